@@ -0,0 +1,139 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+CONCURRENT EVALUATION OF AN 'async def' FITNESS ('concurrency' AND 'timeout' OPTIONS OF THE PSO CLASS)
+
+A LOCAL STUB SERVER STANDS IN FOR A REMOTE MODEL: IT ANSWERS EACH REQUEST (ONE POSITION PER LINE) WITH
+
+'fitness_1' (HIMMELBLAU'S FUNCTION) AFTER 'delay' SECONDS, AND A FRACTION 'slow' OF THE REQUESTS TAKE TEN
+
+TIMES LONGER. THE CLIENT KEEPS ITS CONNECTIONS OPEN AND REUSES THEM FROM ONE CALL TO THE NEXT. USAGE (FROM
+
+THE REPOSITORY ROOT):
+
+    python benchmarks/aio.py [--delay 0.01] [--P 32] [--Tmax 10] [--concurrency 1 4 32] [--slow 0.05 --timeout 0.05]
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from fitness import fitness_1
+
+#######################   STUB SERVER   ########################################
+
+def serve(delay, slow, handlers, seed=0):
+
+    # CONNECTION HANDLER OF THE STUB SERVER: ONE REQUEST 'x1 x2 ... xn' PER LINE, ONE FITNESS VALUE PER LINE BACK.
+
+    # THE TASK OF EACH CONNECTION IS ADDED TO 'handlers' SO THAT THEY CAN ALL BE AWAITED BEFORE THE LOOP STOPS
+
+    rng = np.random.default_rng(seed)
+
+    async def handle(reader, writer):
+        handlers.add(asyncio.current_task())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                X = np.array(line.split(), dtype='float64').reshape(-1,1)
+                await asyncio.sleep(delay*10 if rng.random() < slow else delay)
+                writer.write(b'%r\n' % float(fitness_1(X)))
+                await writer.drain()
+        except ConnectionError:
+            pass # THE CLIENT GAVE UP ON THE REQUEST (TIMEOUT) AND CLOSED THE CONNECTION
+        writer.close()
+
+    return handle
+
+#######################   CLIENT   #############################################
+
+class Remote:
+
+    def __init__(self, host, port):
+
+        # 'async def' FITNESS FUNCTION EVALUATED BY THE SERVER AT (host, port). IDLE CONNECTIONS ARE KEPT FOR THE NEXT CALLS
+
+        self.host, self.port = host, port
+        self.idle = []
+        self.opened = 0
+
+    async def __call__(self, X):
+        if self.idle:
+            reader, writer = self.idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            self.opened += 1
+        try:
+            writer.write(' '.join(map(repr, X.reshape(-1).tolist())).encode() + b'\n')
+            await writer.drain()
+            f = float(await reader.readline())
+        except BaseException:
+            writer.close() # A CANCELLED CALL (TIMEOUT) LEAVES ITS CONNECTION MID REQUEST, SO IT IS NOT REUSED
+            raise
+        self.idle.append((reader, writer))
+        return f
+
+    async def close(self):
+        for reader, writer in self.idle:
+            writer.close()
+            await writer.wait_closed()
+        self.idle = []
+
+async def run(port, P, Tmax, concurrency, timeout):
+
+    # RETURNS WALL TIME, FINAL FITNESS, TIMEOUTS AND CONNECTIONS OPENED FOR ONE RUN
+
+    fitness = Remote('127.0.0.1', port)
+    optimizer = PSO(fitness, P=P, Tmax=Tmax, concurrency=concurrency, timeout=timeout, seed=0)
+    start = time.perf_counter()
+    await optimizer.run()
+    elapsed = time.perf_counter() - start
+    await fitness.close()
+    return elapsed, optimizer.gbest_fitness, optimizer.evaluator.timeouts, fitness.opened
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--delay', type=float, default=0.01)
+    parser.add_argument('--slow', type=float, default=0.0)
+    parser.add_argument('--timeout', type=float, default=None)
+    parser.add_argument('--P', type=int, default=32)
+    parser.add_argument('--Tmax', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 32])
+    args = parser.parse_args()
+
+    handlers = set()
+    server = await asyncio.start_server(serve(args.delay, args.slow, handlers), '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    print('P: %d | Tmax: %d | delay: %gs | slow: %g | timeout: %s' % (args.P, args.Tmax, args.delay, args.slow, args.timeout))
+    print('%-12s %10s %8s %14s %9s %12s' % ('concurrency', 'time (s)', 'speedup', 'gbest fitness', 'timeouts', 'connections'))
+    baseline = None
+    for concurrency in args.concurrency:
+        elapsed, best, timeouts, opened = await run(port, args.P, args.Tmax, concurrency, args.timeout)
+        baseline = baseline or elapsed
+        print('%-12d %10.3f %8.2f %14.7g %9d %12d' % (concurrency, elapsed, baseline/elapsed, best, timeouts, opened))
+    server.close()
+    await server.wait_closed()
+    await asyncio.gather(*handlers)
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+COST OF 'import pso' IN A FRESH PYTHON PROCESS (WALL TIME AND PEAK MEMORY), AS PAID BY EVERY SHORT
+
+LIVED WORKER PROCESS. USAGE (FROM THE REPOSITORY ROOT):
+
+    python benchmarks/import_time.py [--repeat 20] [--path pso]
+
+'--path' CAN POINT TO THE 'pso' FOLDER OF ANOTHER CHECKOUT TO COMPARE TWO VERSIONS, E.G.
+
+    git worktree add /tmp/old <commit> && python benchmarks/import_time.py --path /tmp/old/pso
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+import argparse
+import subprocess
+
+import numpy as np
+
+# THE CHILD PROCESS REPORTS THE IMPORT TIME OF 'pso' ALONE (NUMPY IS IMPORTED FIRST, SINCE ANY USER OF 'pso' PAYS
+
+# FOR IT ANYWAY) AND ITS PEAK RESIDENT MEMORY IN KB
+
+CHILD = '''
+import sys, time, resource
+sys.path.insert(0, sys.argv[1])
+import numpy
+start = time.perf_counter()
+import pso
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'matplotlib' in sys.modules)
+'''
+
+def measure(path, repeat):
+
+    # RETURNS THE IMPORT TIMES (SECONDS), PEAK MEMORY (KB) OF 'repeat' FRESH PROCESSES AND WHETHER MATPLOTLIB WAS LOADED
+
+    env = dict(os.environ, MPLBACKEND='Agg')
+    times, memory = [], []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', CHILD, path], env=env).split()
+        times.append(float(out[0]))
+        memory.append(int(out[1]))
+    return np.array(times), np.array(memory), out[2] == b'True'
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--path', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+    args = parser.parse_args()
+    if not os.path.isfile(os.path.join(args.path, 'pso.py')):
+        parser.error("--path must be a folder containing 'pso.py', got %s" % os.path.abspath(args.path))
+
+    times, memory, matplotlib = measure(os.path.abspath(args.path), args.repeat)
+    print('import pso from %s (%d runs)' % (os.path.abspath(args.path), args.repeat))
+    print('  time   : median %.1f ms | min %.1f ms | max %.1f ms' % (1e3*np.median(times), 1e3*times.min(), 1e3*times.max()))
+    print('  memory : median peak RSS %.1f MB' % (np.median(memory)/1024))
+    print('  matplotlib imported: %s' % matplotlib)
+
+if __name__ == '__main__':
+    main()
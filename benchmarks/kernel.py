@@ -0,0 +1,86 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+COST OF THE SWARM UPDATE WITH AND WITHOUT THE FUSED KERNEL ('kernel' OPTION OF THE PSO CLASS)
+
+THE OBJECTIVE IS THE BATCHED 'sphere' OF 'fitness.py', SO THAT THE OPTIMIZER'S OWN WORK (VELOCITY, POSITION,
+
+CLIPPING AND BEST UPDATES, THE 'update_time' COLUMN OF THE METRICS) IS WHAT IS MEASURED. FOR EACH BACKEND THE
+
+FIRST RUN ALSO PAYS THE NUMBA COMPILATION (OR ITS LOADING FROM THE CACHE), WHICH IS REPORTED SEPARATELY. USAGE
+
+(FROM THE REPOSITORY ROOT):
+
+    python benchmarks/kernel.py [--P 1000 100000] [--n 2 10] [--Tmax 50] [--backends ufunc numpy numba]
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from fitness import sphere
+
+#######################   BENCHMARK   ##########################################
+
+def run(backend, P, n, Tmax):
+
+    # RETURNS THE MEDIAN UPDATE TIME PER ITERATION, THE WALL TIME OF THE RUN AND THE FINAL FITNESS ('ufunc' IS THE BASELINE)
+
+    kernel = None if backend == 'ufunc' else backend
+    optimizer = PSO(sphere, P=P, n=n, Tmax=Tmax, vmax=1.0, bound=sphere.bound(n), vectorize=True, seed=0,
+                    kernel=kernel, metrics=True)
+    start = time.perf_counter()
+    optimizer.initialize()
+    optimizer.move()
+    wall = time.perf_counter() - start
+    return float(np.median(optimizer.metrics['update_time'])), wall, optimizer.gbest_fitness
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--P', type=int, nargs='+', default=[1000, 100000])
+    parser.add_argument('--n', type=int, nargs='+', default=[2, 10])
+    parser.add_argument('--Tmax', type=int, default=50)
+    parser.add_argument('--backends', nargs='+', default=['ufunc', 'numpy', 'numba'], choices=['ufunc', 'numpy', 'numba'])
+    args = parser.parse_args()
+
+    backends = list(args.backends)
+    if 'numba' in backends:
+        try:
+            import numba
+        except ImportError:
+            print('numba is not installed, skipping its backend\n')
+            backends.remove('numba')
+    for backend in backends:
+        if backend != 'ufunc':
+            start = time.perf_counter()
+            run(backend, 10, 2, 1)
+            print('%-6s first call (compilation or cache load): %.3f s' % (backend, time.perf_counter() - start))
+
+    print('\n%-6s %8s %4s %16s %10s %8s %14s' % ('kernel', 'P', 'n', 'update (ms/it)', 'wall (s)', 'speedup', 'gbest fitness'))
+    for P in args.P:
+        for n in args.n:
+            baseline = None
+            for backend in backends:
+                update, wall, best = run(backend, P, n, args.Tmax)
+                baseline = baseline or update
+                print('%-6s %8d %4d %16.3f %10.3f %8.2f %14.7g' % (backend, P, n, 1e3*update, wall, baseline/update, best))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+SPEEDUP OF PARALLEL FITNESS EVALUATION ('workers' OPTION OF THE PSO CLASS)
+
+THE OBJECTIVE IS 'fitness_1' (HIMMELBLAU'S FUNCTION) WITH AN ARTIFICIAL DELAY PER CALL, STANDING
+
+IN FOR AN EXPENSIVE SIMULATION. USAGE (FROM THE REPOSITORY ROOT):
+
+    python benchmarks/parallel.py [--delay 0.01] [--P 32] [--Tmax 10] [--workers 1 2 4 8 16]
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from fitness import fitness_1
+
+#######################   DELAYED FITNESS   ####################################
+
+class Delayed:
+
+    # FITNESS FUNCTION WHICH SLEEPS 'delay' SECONDS BEFORE EVALUATING (PICKLABLE, SO IT CAN BE SENT TO WORKERS)
+
+    def __init__(self, fitness, delay):
+        self.fitness = fitness
+        self.delay = delay
+
+    def __call__(self, X):
+        time.sleep(self.delay)
+        return self.fitness(X)
+
+class Rows:
+
+    # BATCHED VERSION OF A FITNESS FUNCTION WHICH TAKES ONE POSITION: THE ROWS OF 'X' ARE EVALUATED ONE AFTER THE OTHER.
+
+    # THE SERIAL BASELINE USES IT SO THAT IT RUNS THE SAME SYNCHRONOUS UPDATE ('gbest' ONCE PER ITERATION) AS THE POOL
+
+    batch = True
+
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+    def __call__(self, X):
+        return np.array([self.fitness(x.reshape(-1,1)) for x in X])
+
+def run(fitness, workers, P, Tmax, chunksize):
+
+    # RETURNS WALL TIME AND FINAL FITNESS OF ONE RUN (workers=None IS THE SERIAL BASELINE)
+
+    if workers is None:
+        fitness = Rows(fitness)
+    optimizer = PSO(fitness, P=P, Tmax=Tmax, batch=workers is None, workers=workers, chunksize=chunksize, vectorize=True,
+                    seed=0)
+    start = time.perf_counter()
+    try:
+        optimizer.initialize()
+        optimizer.move()
+    finally:
+        optimizer.close()
+    return time.perf_counter() - start, optimizer.gbest_fitness
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--delay', type=float, default=0.01)
+    parser.add_argument('--P', type=int, default=32)
+    parser.add_argument('--Tmax', type=int, default=10)
+    parser.add_argument('--chunksize', type=int, default=None)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    fitness = Delayed(fitness_1, args.delay)
+    serial, best = run(fitness, None, args.P, args.Tmax, args.chunksize)
+    print('cpus: %d | P: %d | Tmax: %d | delay: %gs' % (os.cpu_count(), args.P, args.Tmax, args.delay))
+    print('%-8s %10s %8s %14s' % ('workers', 'time (s)', 'speedup', 'gbest fitness'))
+    print('%-8s %10.3f %8.2f %14.7g' % ('serial', serial, 1.0, best))
+    for workers in args.workers:
+        elapsed, fitness_value = run(fitness, workers, args.P, args.Tmax, args.chunksize)
+        print('%-8d %10.3f %8.2f %14.7g' % (workers, elapsed, serial/elapsed, fitness_value))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+RUNS THE BENCHMARK FUNCTIONS OF 'fitness.py' OVER A GRID OF DIMENSIONS (n) AND POPULATION SIZES (P) AND
+
+REPORTS, FOR EACH CELL, THE EVALUATIONS NEEDED TO REACH THE TARGET ERROR, THE WALL TIME AND THE FINAL ERROR
+
+(MEDIANS OVER THE RUNS). EVERY RUN IS WRITTEN TO A JSON FILE. USAGE (FROM THE REPOSITORY ROOT):
+
+    python benchmarks/suite.py [--functions sphere rastrigin] [--n 2 10 30] [--P 20 50] [--runs 5]
+
+                               [--variant plain shifted rotated] [--output results.json] [--baseline old.json]
+
+WITH '--baseline', THE CELLS ARE COMPARED WITH A PREVIOUS RESULT FILE AND THE SCRIPT EXITS WITH STATUS 1 IF
+
+ANY CELL GOT SLOWER (WALL TIME) OR WORSE (FINAL ERROR) BEYOND '--tolerance', SO IT CAN GUARD THE PSO HOT PATH
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from fitness import BENCHMARKS
+
+#######################   BENCHMARK   ##########################################
+
+def variant(benchmark, name, n, seed):
+
+    # PLAIN, SHIFTED, ROTATED OR SHIFTED AND ROTATED VERSION OF 'benchmark' (THE SAME ONE FOR EVERY RUN OF A CELL)
+
+    if 'shifted' in name:
+        benchmark = benchmark.shifted(n, seed)
+    if 'rotated' in name:
+        benchmark = benchmark.rotated(n, seed)
+    return benchmark
+
+def run(benchmark, n, P, Tmax, target, seed):
+
+    '''
+
+    ONE RUN OF THE ARRAY ENGINE ON 'benchmark' IN n DIMENSIONS. THE RUN IS NOT STOPPED AT THE TARGET, SO THAT
+
+    THE FINAL ERROR AND THE WALL TIME ALWAYS COVER 'Tmax' ITERATIONS. RETURNS A DICTIONARY WITH:
+
+        evaluations_to_target: EVALUATIONS DONE WHEN THE ERROR FIRST WENT BELOW 'target' (NONE IF NEVER)
+
+        wall_time: SECONDS FOR INITIALIZATION AND ALL THE ITERATIONS
+
+        final_error: GLOBAL FITNESS MINUS THE KNOWN OPTIMUM AT THE END
+
+        evaluations: TOTAL FITNESS EVALUATIONS
+
+    '''
+
+    vmax = 0.2*(benchmark.upper - benchmark.lower)
+    optimizer = PSO(benchmark, P=P, n=n, Tmax=Tmax, vmax=vmax, bound=benchmark.bound(n), vectorize=True, seed=seed)
+    reached = None
+    start = time.perf_counter()
+    optimizer.initialize()
+    for state in optimizer.iterate():
+        if reached is None and benchmark.error(state['gbest_fitness']) <= target:
+            reached = state['evaluations']
+    wall = time.perf_counter() - start
+    return {'evaluations_to_target': reached, 'wall_time': wall, 'final_error': float(benchmark.error(optimizer.gbest_fitness)),
+            'evaluations': optimizer.evaluations}
+
+def summarize(results):
+
+    # MEDIANS OF THE RUNS OF EACH (function, variant, n, P) CELL
+
+    cells = {}
+    for result in results:
+        cells.setdefault((result['function'], result['variant'], result['n'], result['P']), []).append(result)
+    summary = []
+    for (function, name, n, P), runs in cells.items():
+        reached = [r['evaluations_to_target'] for r in runs if r['evaluations_to_target'] is not None]
+        summary.append({'function': function, 'variant': name, 'n': n, 'P': P, 'runs': len(runs),
+                        'success_rate': len(reached)/len(runs),
+                        'evaluations_to_target': float(np.median(reached)) if reached else None,
+                        'wall_time': float(np.median([r['wall_time'] for r in runs])),
+                        'final_error': float(np.median([r['final_error'] for r in runs]))})
+    return summary
+
+def compare(summary, baseline, tolerance):
+
+    # CELLS OF 'summary' WHICH ARE SLOWER OR WORSE THAN THE SAME CELLS OF 'baseline' BY MORE THAN 'tolerance' (A RATIO)
+
+    old = {(c['function'], c['variant'], c['n'], c['P']): c for c in baseline}
+    regressions = []
+    for cell in summary:
+        key = (cell['function'], cell['variant'], cell['n'], cell['P'])
+        if key not in old:
+            continue
+        if cell['wall_time'] > (1 + tolerance)*old[key]['wall_time']:
+            regressions.append((key, 'wall_time', old[key]['wall_time'], cell['wall_time']))
+        if cell['final_error'] > (1 + tolerance)*old[key]['final_error'] + 1e-12:
+            regressions.append((key, 'final_error', old[key]['final_error'], cell['final_error']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--functions', nargs='+', default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument('--variant', nargs='+', default=['plain'], choices=['plain', 'shifted', 'rotated', 'shifted_rotated'])
+    parser.add_argument('--n', type=int, nargs='+', default=[2, 10, 30])
+    parser.add_argument('--P', type=int, nargs='+', default=[20, 50])
+    parser.add_argument('--Tmax', type=int, default=300)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--target', type=float, default=1e-4)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='results.json')
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = []
+    for function in args.functions:
+        for name in args.variant:
+            for n in args.n:
+                benchmark = variant(BENCHMARKS[function], name, n, args.seed)
+                for P in args.P:
+                    for i in range(args.runs):
+                        result = run(benchmark, n, P, args.Tmax, args.target, seed=[args.seed, i])
+                        results.append(dict(function=function, variant=name, n=n, P=P, run=i, **result))
+    summary = summarize(results)
+
+    print('%-12s %-16s %4s %4s %8s %14s %10s %12s' % ('function', 'variant', 'n', 'P', 'success', 'evals->target', 'time (s)', 'error'))
+    for cell in summary:
+        evaluations = '-' if cell['evaluations_to_target'] is None else '%d' % cell['evaluations_to_target']
+        print('%-12s %-16s %4d %4d %7.0f%% %14s %10.4f %12.3e' % (cell['function'], cell['variant'], cell['n'], cell['P'],
+              100*cell['success_rate'], evaluations, cell['wall_time'], cell['final_error']))
+
+    config = {key: value for key, value in vars(args).items() if key not in ('output', 'baseline', 'tolerance')}
+    with open(args.output, 'w') as f:
+        json.dump({'config': config, 'numpy': np.__version__, 'summary': summary, 'runs': results}, f, indent=1)
+    print('\nresults written to', args.output)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare(summary, json.load(f)['summary'], args.tolerance)
+        for key, field, old, new in regressions:
+            print('REGRESSION %s %s: %.4g -> %.4g' % ('/'.join(map(str, key)), field, old, new))
+        if regressions:
+            sys.exit(1)
+        print('no regression against', args.baseline)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import numpy as np
+from collections import OrderedDict
+
+###########################  FITNESS CACHE CLASS  ##############################
+
+class FitnessCache:
+
+    def __init__(self, maxsize=100000, resolution=None, path=None):
+
+        '''
+
+        MEMOIZES FITNESS VALUES BY POSITION SO THAT A POSITION VISITED AGAIN (FOR EXAMPLE BY PARTICLES
+
+        STACKED ON A BOUND BY 'clip_X') IS NOT EVALUATED AGAIN. ONLY USEFUL FOR DETERMINISTIC FITNESS FUNCTIONS
+
+        PARAMETERS:
+
+        maxsize: MAXIMUM NUMBER OF STORED POSITIONS. WHEN FULL, THE LEAST RECENTLY USED ONE IS EVICTED
+
+        resolution: NONE TO MATCH POSITIONS EXACTLY, OR A GRID SPACING. POSITIONS ARE THEN ROUNDED TO THE
+
+        NEAREST MULTIPLE OF 'resolution' AND ALL THE POSITIONS IN THE SAME GRID CELL SHARE ONE FITNESS VALUE
+
+        path: FILE (.npz) TO WARM START FROM (IF IT EXISTS) AND TO 'save' TO
+
+        hits, misses, evictions: COUNTERS OF LOOKUPS FOUND, LOOKUPS NOT FOUND AND POSITIONS EVICTED
+
+        '''
+
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.path = path
+        self.table = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def key(self, X):
+
+        # HASHABLE KEY OF POSITION 'X' (ANY SHAPE WITH n ELEMENTS)
+
+        X = np.asarray(X, dtype='float64').reshape(-1)
+        if self.resolution is None:
+            return X.tobytes()
+        return np.rint(X/self.resolution).astype('int64').tobytes()
+
+    def get(self, key):
+
+        # RETURNS THE CACHED FITNESS VALUE OF 'key' (AND MARKS IT AS RECENTLY USED) OR NONE
+
+        value = self.table.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.table.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+
+        # STORES THE FITNESS VALUE OF 'key', EVICTING THE LEAST RECENTLY USED POSITIONS IF THE CACHE IS FULL
+
+        self.table[key] = float(value)
+        self.table.move_to_end(key)
+        while len(self.table) > self.maxsize:
+            self.table.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+
+        # COUNTERS AS A DICTIONARY
+
+        return {'size': len(self.table), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def save(self, path=None):
+
+        # WRITES THE CACHED POSITIONS (IN LEAST TO MOST RECENTLY USED ORDER) AND FITNESS VALUES TO AN .npz FILE
+
+        # (WRITTEN THROUGH A FILE OBJECT, SO THAT NUMPY DOES NOT ADD '.npz' TO A 'path' WITHOUT IT AND 'load' FINDS IT)
+
+        path = path or self.path
+        keys, values = self.arrays()
+        with open(path, 'wb') as f:
+            np.savez(f, keys=keys, values=values, resolution=np.array(np.nan if self.resolution is None else self.resolution))
+
+    def arrays(self):
+
+        # THE CACHED POSITIONS (AS ROWS OF BYTES, IN LEAST TO MOST RECENTLY USED ORDER) AND THEIR FITNESS VALUES
+
+        keys = np.frombuffer(b''.join(self.table.keys()), dtype=np.uint8)
+        keys = keys.reshape(len(self.table), -1) if self.table else np.zeros((0,0), dtype=np.uint8)
+        return keys, np.array(list(self.table.values()), dtype='float64')
+
+    def fill(self, keys, values):
+
+        # ADDS THE POSITIONS AND FITNESS VALUES RETURNED BY 'arrays' TO THE CACHE
+
+        for key, value in zip(keys, values):
+            self.put(key.tobytes(), value)
+
+    def load(self, path):
+
+        # ADDS THE POSITIONS SAVED BY 'save' TO THE CACHE (THEY MUST HAVE BEEN SAVED WITH THE SAME 'resolution')
+
+        with np.load(path) as data:
+            resolution = float(data['resolution'])
+            if (self.resolution is None) != np.isnan(resolution) or (self.resolution is not None and resolution != self.resolution):
+                raise ValueError('cache file %s was saved with a different resolution' % path)
+            self.fill(data['keys'], data['values'])
+
+######################################## END OF FITNESS CACHE CLASS ########################################
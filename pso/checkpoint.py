@@ -0,0 +1,201 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+CHECKPOINT FORMAT. A CHECKPOINT IS A DIRECTORY WITH:
+
+    state.json: SCALARS (ITERATION, EVALUATIONS, COEFFICIENTS, STATE OF THE RANDOM GENERATOR 'rng', ...) AND THE SLOT
+
+    HOLDING THE ARRAYS
+
+    slot0/, slot1/: ONE .npy FILE PER ARRAY (POSITIONS, VELOCITIES, BESTS, HISTORY, ...)
+
+THE ARRAYS ARE WRITTEN INTO MEMORY-MAPPED .npy FILES WHICH ARE CREATED ONCE AND THEN OVERWRITTEN IN PLACE,
+
+ALTERNATING BETWEEN THE TWO SLOTS. 'state.json' IS REPLACED ATOMICALLY ONLY AFTER THE SLOT IS FLUSHED, SO A
+
+RUN PRE-EMPTED IN THE MIDDLE OF A CHECKPOINT STILL HAS THE PREVIOUS COMPLETE ONE
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import json
+import numpy as np
+
+#######################   SAVE   ###############################################
+
+def swarm_arrays(optimizer):
+
+    # RETURNS THE ARRAYS DESCRIBING THE SWARM OF 'optimizer' (EITHER ENGINE) AS A DICTIONARY
+
+    if optimizer.vectorize:
+        swarm = optimizer.swarm
+        arrays = {'X': swarm.X, 'V': swarm.V, 'pbest': swarm.pbest, 'cost': swarm.cost,
+                  'pbest_cost': swarm.pbest_cost, 'gbest': swarm.gbest}
+        if swarm.topology is not None:
+            arrays['index'] = swarm.topology.index
+        return arrays
+    population = optimizer.population
+    return {'X': np.hstack([particle.X for particle in population]).T,
+            'V': np.hstack([particle.V for particle in population]).T,
+            'pbest': np.hstack([particle.pbest for particle in population]).T,
+            'fitness': np.array([particle.fitness for particle in population], dtype='float64'),
+            'pbest_fitness': np.array([particle.pbest_fitness for particle in population], dtype='float64'),
+            'gbest': optimizer.gbest.reshape(-1)}
+
+def write(path, array, maps):
+
+    # COPIES 'array' INTO THE MEMORY-MAPPED .npy FILE 'path' (CREATED ONLY IF IT DOES NOT EXIST WITH THE SAME SHAPE)
+
+    mapped = maps.get(path)
+    if mapped is None and os.path.exists(path):
+        mapped = np.lib.format.open_memmap(path, mode='r+')
+    if mapped is None or mapped.shape != array.shape or mapped.dtype != array.dtype:
+        mapped = np.lib.format.open_memmap(path, mode='w+', dtype=array.dtype, shape=array.shape)
+    mapped[...] = array
+    mapped.flush()
+    maps[path] = mapped
+
+def save(optimizer, path, maps):
+
+    '''
+
+    PARAMETERS:
+
+    optimizer: PSO OBJECT
+
+    path: CHECKPOINT DIRECTORY
+
+    maps: DICTIONARY OF OPEN MEMORY MAPS (KEPT BY THE CALLER BETWEEN TWO CHECKPOINTS)
+
+    ACTION:
+
+    WRITES A CHECKPOINT OF THE FULL STATE OF 'optimizer' (SWARM, HISTORY, COEFFICIENTS, RANDOM STATE, THE CONTENT
+
+    OF THE 'cache' AND THE ARCHIVE AND MODEL OF THE 'surrogate', IF ANY). THE CACHE IS PART OF THE STATE: ITS HITS
+
+    ARE NOT COUNTED AS EVALUATIONS AND, WITH A 'resolution', THEY ALSO CHANGE THE FITNESS VALUES OF THE TRAJECTORY
+
+    '''
+
+    state_file = os.path.join(path, 'state.json')
+    slot = 0
+    if os.path.exists(state_file):
+        with open(state_file) as f:
+            slot = 1 - json.load(f)['slot']
+    folder = os.path.join(path, 'slot%d' % slot)
+    os.makedirs(folder, exist_ok=True)
+
+    history = np.zeros(optimizer.Tmax+1)
+    history[:len(optimizer.fitness_time)] = optimizer.fitness_time
+    arrays = dict(swarm_arrays(optimizer), history=history)
+    surrogate = optimizer.surrogate
+    if surrogate is not None and surrogate.X is not None:
+        arrays.update(surrogate_X=surrogate.X, surrogate_cost=surrogate.cost, surrogate_errors=np.array(surrogate.errors, dtype='float64'))
+        if hasattr(surrogate, 'lam'):
+            arrays.update(surrogate_lam=surrogate.lam, surrogate_tail=surrogate.tail)
+    cache = optimizer.cache
+    if cache is not None:
+        arrays['cache_keys'], arrays['cache_values'] = cache.arrays()
+    for key, array in arrays.items():
+        write(os.path.join(folder, key + '.npy'), np.ascontiguousarray(array), maps)
+
+    state = {'slot': slot, 'P': optimizer.P, 'n': optimizer.n, 'vectorize': optimizer.vectorize, 'min': optimizer.min,
+             't': optimizer.t, 'evaluations': optimizer.evaluations, 'gbest_fitness': float(optimizer.gbest_fitness),
+             'w': optimizer.w, 'c1': optimizer.c1, 'c2': optimizer.c2, 'vmax': optimizer.vmax,
+             'length': len(optimizer.fitness_time), 'arrays': sorted(arrays),
+             'rng': optimizer.rng.bit_generator.state}
+    if surrogate is not None:
+        state['surrogate'] = {'evaluated': surrogate.evaluated, 'skipped': surrogate.skipped}
+    if cache is not None:
+        state['cache'] = cache.stats()
+    recorder = optimizer.recorder
+    if recorder is not None and recorder.path is not None and recorder.P is not None:
+        recorder.flush() # SO THAT EVERY FRAME BEFORE THE CHECKPOINT IS ON DISK
+        state['recorder'] = recorder.count
+    with open(state_file + '.tmp', 'w') as f:
+        json.dump(state, f, default=lambda array: array.tolist())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(state_file + '.tmp', state_file)
+
+#######################   LOAD   ###############################################
+
+def load(optimizer, path):
+
+    '''
+
+    PARAMETERS:
+
+    optimizer: PSO OBJECT CREATED WITH THE SAME ARGUMENTS AS THE RUN WHICH WROTE THE CHECKPOINT
+
+    path: CHECKPOINT DIRECTORY
+
+    ACTION:
+
+    RESTORES THE STATE SAVED BY 'save' INTO 'optimizer', SO THAT THE RUN CONTINUES EXACTLY AS IF IT HAD
+
+    NEVER STOPPED
+
+    '''
+
+    with open(os.path.join(path, 'state.json')) as f:
+        state = json.load(f)
+    for key in ('P', 'n', 'vectorize', 'min'):
+        if state[key] != getattr(optimizer, key):
+            raise ValueError('checkpoint %s has %s=%r but the optimizer has %r' % (path, key, state[key], getattr(optimizer, key)))
+    folder = os.path.join(path, 'slot%d' % state['slot'])
+    arrays = {key: np.load(os.path.join(folder, key + '.npy'), mmap_mode='r') for key in state['arrays']}
+
+    # THE SWARM IS REBUILT FIRST (WHICH DRAWS RANDOM NUMBERS) AND THE RANDOM STATE IS RESTORED LAST
+
+    if optimizer.vectorize:
+        optimizer.create_swarm()
+        swarm = optimizer.swarm
+        for key in ('X', 'V', 'pbest', 'cost', 'pbest_cost', 'gbest'):
+            getattr(swarm, key)[...] = arrays[key]
+        swarm.gbest_cost = swarm.sign*state['gbest_fitness']
+        if swarm.topology is not None:
+            swarm.topology.index[...] = arrays['index']
+    else:
+        from pso import Particle
+        optimizer.population = []
+        for i in range(optimizer.P):
+            particle = Particle(n=optimizer.n, vmax=state['vmax'], X0=arrays['X'][i], bound=optimizer.bound, rng=optimizer.rng)
+            particle.V = np.array(arrays['V'][i]).reshape(-1,1)
+            particle.pbest = np.array(arrays['pbest'][i]).reshape(-1,1)
+            particle.fitness, particle.pbest_fitness = float(arrays['fitness'][i]), float(arrays['pbest_fitness'][i])
+            optimizer.population.append(particle)
+        optimizer.gbest = np.array(arrays['gbest']).reshape(-1,1)
+
+    optimizer.gbest_fitness = state['gbest_fitness']
+    optimizer.t, optimizer.evaluations = state['t'], state['evaluations']
+    optimizer.w, optimizer.c1, optimizer.c2, optimizer.vmax = state['w'], state['c1'], state['c2'], state['vmax']
+    optimizer.fitness_time = arrays['history'][:state['length']].tolist()
+    optimizer.time = list(range(state['length']))
+    optimizer.rng.bit_generator.state = state['rng']
+    if optimizer.surrogate is not None and 'surrogate' in state:
+        surrogate = optimizer.surrogate
+        surrogate.evaluated, surrogate.skipped = state['surrogate']['evaluated'], state['surrogate']['skipped']
+        surrogate.pending = None
+        if 'surrogate_X' in arrays:
+            surrogate.X, surrogate.cost = np.array(arrays['surrogate_X']), np.array(arrays['surrogate_cost'])
+            surrogate.errors = arrays['surrogate_errors'].tolist()
+        if 'surrogate_lam' in arrays:
+            surrogate.lam, surrogate.tail = np.array(arrays['surrogate_lam']), np.array(arrays['surrogate_tail'])
+    if optimizer.cache is not None and 'cache' in state:
+        cache = optimizer.cache
+        cache.table.clear()
+        cache.fill(arrays['cache_keys'], arrays['cache_values'])
+        cache.hits, cache.misses, cache.evictions = state['cache']['hits'], state['cache']['misses'], state['cache']['evictions']
+    if optimizer.recorder is not None and 'recorder' in state:
+        optimizer.recorder.limit = state['recorder']
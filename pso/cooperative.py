@@ -0,0 +1,206 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+from pso import PSO
+from swarm import Swarm
+from topology import Topology
+
+###########################  COOPERATIVE PSO CLASS  ############################
+
+class CooperativePSO(PSO):
+
+    def __init__(self, fitness, n=1000, groups=10, regroup=None, **options):
+
+        '''
+
+        COOPERATIVE PSO FOR HIGH DIMENSIONAL PROBLEMS [8]. THE n DIMENSIONS ARE SPLIT INTO 'groups' SUBGROUPS AND
+
+        EACH SUBGROUP IS OPTIMIZED BY ITS OWN SUB-SWARM OF 'P' PARTICLES (A 'Swarm' OF THE ARRAY ENGINE) WHICH ONLY
+
+        MOVES ITS OWN DIMENSIONS. A PARTICLE OF SUBGROUP 'k' IS EVALUATED IN THE CONTEXT OF THE BEST FULL VECTOR
+
+        FOUND SO FAR (THE CONTEXT VECTOR, WHICH IS 'gbest'): ITS COORDINATES REPLACE THE SUBGROUP'S DIMENSIONS OF
+
+        THE CONTEXT VECTOR. WHENEVER A SUB-SWARM FINDS A BETTER VECTOR, THE CONTEXT VECTOR IS UPDATED AND THE NEXT
+
+        SUBGROUPS OF THE SAME ITERATION ALREADY USE IT
+
+        PARAMETERS:
+
+        fitness, n: SAME AS IN THE PSO CLASS
+
+        groups: NUMBER OF SUBGROUPS (SUB-SWARMS). AN ITERATION COSTS groups*P EVALUATIONS, EACH ONE A BATCH OF P
+
+        FULL VECTORS, SO A BATCHED FITNESS FUNCTION IS CALLED 'groups' TIMES PER ITERATION
+
+        regroup: NUMBER OF ITERATIONS BETWEEN TWO RANDOM REGROUPINGS OF THE DIMENSIONS (NONE TO KEEP ONE FIXED
+
+        CONTIGUOUS SPLIT). RANDOM GROUPING GIVES INTERACTING DIMENSIONS A CHANCE TO BE OPTIMIZED TOGETHER [9]
+
+        options: ANY OTHER ARGUMENT OF THE PSO CLASS (P, w, c1, c2, Tmax, vmax, X0, bound, update_w, ..., topology,
+
+        workers, cache, metrics, seed, kernel, STOPPING CRITERIA). THE COEFFICIENT SCHEDULES OF 'update_coeff' ARE SHARED
+
+        BY ALL THE SUB-SWARMS. CHECKPOINTS, THE RECORDER, THE SURROGATE AND THE ASYNCHRONOUS MODE ARE NOT AVAILABLE
+
+        '''
+
+        if (options.get('checkpoint') is not None or options.get('recorder') is not None or options.get('surrogate')
+                or options.get('asynchronous')):
+            raise ValueError('checkpoints, the recorder, the surrogate and the asynchronous mode are not available in '
+                             'the cooperative PSO')
+        super().__init__(fitness, n=n, **dict(options, vectorize=True))
+        if not 1 <= groups <= n:
+            raise ValueError('groups must be between 1 and n (%d), got %d' % (n, groups))
+        self.groups = groups
+        self.regroup = regroup
+        self.iteration_cost = groups*self.P
+        if self.max_evaluations is not None and self.max_evaluations < 1 + self.iteration_cost:
+            raise ValueError('max_evaluations (%d) must cover the %d evaluations of the initialization (1 + groups*P)'
+                             % (self.max_evaluations, 1 + self.iteration_cost))
+
+    def partition(self):
+
+        # SPLITS THE DIMENSIONS INTO 'groups' INDEX ARRAYS OF (ALMOST) EQUAL SIZE, AT RANDOM IF 'regroup' IS SET
+
+        order = self.rng.permutation(self.n) if self.regroup else np.arange(self.n)
+        return np.array_split(order, self.groups)
+
+    def create_swarms(self, index, X=None, V=None, pbest=None):
+
+        '''
+
+        PARAMETERS:
+
+        index: LIST OF THE DIMENSION INDICES OF EACH SUBGROUP
+
+        X, V, pbest: FULL (P,n) POSITIONS, VELOCITIES AND PERSONAL BESTS TO DISTRIBUTE TO THE NEW SUB-SWARMS
+
+        (NONE TO INITIALIZE THEM AT RANDOM)
+
+        ACTION:
+
+        CREATES ONE 'Swarm' PER SUBGROUP. PERSONAL BEST COSTS START AT INFINITY, SO THE NEXT EVALUATION OF
+
+        EACH PARTICLE (IN THE CONTEXT OF THE NEW GROUPING) BECOMES ITS 'pbest'
+
+        '''
+
+        self.index = index
+        self.swarms = []
+        for idx in index:
+            topology = None
+            if self.topology != 'global':
+                topology = Topology(self.topology, P=self.P, k=self.k, rewire=self.rewire, rng=self.rng)
+            bound = None if self.bound is None else [self.bound[i] for i in idx]
+            swarm = Swarm(P=self.P, n=len(idx), bound=bound, min=self.min, topology=topology, rng=self.rng, kernel=self.kernel)
+            if X is None:
+                swarm.initialize(vmax=self.vmax, X0=None if self.X is None else np.asarray(self.X, dtype='float64').reshape(-1)[idx])
+            else:
+                swarm.X[:], swarm.V[:], swarm.pbest[:] = X[:,idx], V[:,idx], pbest[:,idx]
+                swarm.pbest_cost.fill(np.inf)
+            self.swarms.append(swarm)
+
+    def initialize(self):
+
+        '''
+
+        ACTION:
+
+        CREATES THE SUB-SWARMS, BUILDS THE FIRST CONTEXT VECTOR FROM THE FIRST PARTICLE OF EACH SUB-SWARM,
+
+        EVALUATES IT AND THEN EVALUATES EVERY SUB-SWARM IN ITS CONTEXT (WITHOUT MOVING IT)
+
+        '''
+
+        self.t = 0
+        self.fitness_time, self.time = [], []
+        self.stop_reason = None
+        self.create_swarms(self.partition())
+        self.context = np.zeros(self.n)
+        for idx, swarm in zip(self.index, self.swarms):
+            self.context[idx] = swarm.X[0]
+        self.gbest = self.context.reshape(-1,1)
+        self.candidates = np.zeros((self.P, self.n))
+        self.sign = 1.0 if self.min else -1.0
+        self.context_cost = self.sign*self.evaluate_batch(self.context.reshape(1,-1))[0]
+        self.gbest_fitness = self.sign*self.context_cost
+        for k in range(self.groups):
+            self.cooperate(k)
+
+    def cooperate(self, k):
+
+        # EVALUATES THE PARTICLES OF SUB-SWARM 'k' IN THE CONTEXT VECTOR AND UPDATES ITS BESTS AND THE CONTEXT VECTOR
+
+        idx, swarm = self.index[k], self.swarms[k]
+        self.candidates[:] = self.context
+        self.candidates[:,idx] = swarm.X
+        swarm.gbest[:] = self.context[idx]
+        swarm.gbest_cost = self.context_cost
+        if swarm.accept_all(self.evaluate_batch(self.candidates)):
+            self.context[idx] = swarm.gbest
+            self.context_cost = swarm.gbest_cost
+            self.gbest_fitness = self.sign*self.context_cost
+
+    def step(self):
+
+        '''
+
+        ACTION:
+
+        ONE ITERATION: REGROUPS THE DIMENSIONS IF IT IS TIME TO, THEN MOVES EACH SUB-SWARM IN TURN (WITH THE
+
+        CURRENT COEFFICIENTS AND THE SUBGROUP'S DIMENSIONS OF THE CONTEXT VECTOR AS ITS 'gbest') AND EVALUATES IT
+
+        '''
+
+        if self.regroup and self.t > 0 and self.t % self.regroup == 0:
+            X, V, pbest = self.positions(), self.full('V'), self.full('pbest')
+            self.create_swarms(self.partition(), X, V, pbest)
+        for k, swarm in enumerate(self.swarms):
+            if swarm.topology is not None:
+                swarm.topology.update(self.t)
+            swarm.gbest[:] = self.context[self.index[k]]
+            swarm.move(self.w, self.c1, self.c2, self.vmax)
+            self.cooperate(k)
+
+    def full(self, name):
+
+        # GATHERS THE ARRAY 'name' ('X', 'V' OR 'pbest') OF ALL THE SUB-SWARMS INTO ONE (P,n) ARRAY
+
+        out = np.zeros((self.P, self.n))
+        for idx, swarm in zip(self.index, self.swarms):
+            out[:,idx] = getattr(swarm, name)
+        return out
+
+    def positions(self):
+
+        # CURRENT POSITIONS OF THE SUB-SWARMS AS (P,n) FULL VECTORS (PARTICLE i OF EVERY SUB-SWARM PUT TOGETHER)
+
+        return self.full('X')
+
+    def ask(self):
+        raise RuntimeError('ask/tell is not available in the cooperative PSO, use move or iterate')
+
+######################################## END OF COOPERATIVE PSO CLASS ########################################
+
+#########################################################################################################################################
+#                                                                                                                                       #
+# REFERENCES:                                                                                                                           #
+#                                                                                                                                       #
+# [8] F. VAN DEN BERGH AND A. P. ENGELBRECHT, "A COOPERATIVE APPROACH TO PARTICLE SWARM OPTIMIZATION," IEEE TRANSACTIONS ON             #
+#     EVOLUTIONARY COMPUTATION, VOL. 8, NO. 3, PP. 225–239, JUNE 2004.                                                                  #
+#                                                                                                                                       #
+# [9] X. LI AND X. YAO, "COOPERATIVELY COEVOLVING PARTICLE SWARMS FOR LARGE SCALE OPTIMIZATION," IEEE TRANSACTIONS ON                   #
+#     EVOLUTIONARY COMPUTATION, VOL. 16, NO. 2, PP. 210–224, APRIL 2012.                                                                #
+#                                                                                                                                       #
+#########################################################################################################################################
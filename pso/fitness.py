@@ -1,147 +1,370 @@
-
-################################################################################
-#                                                                              #
-#	UJJWAL KHANDELWAL                                                          #    
-#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
-#	PYTHON 3.7.10                                                              #
-#                                                                              #
-################################################################################
-
-######################## FITNESS FUNCTION 1 ######################################
-
-def fitness_1(X):
-
-    '''
-
-    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,)
-
-    EXAMPLE PRESENT IN [7] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
-
-    #################################################################################
-
-    HIMMELBLAU'S FUNCTION
-
-    MINIMIZE f(x) = (x^2 + y - 11)^2 + (x + y^2 - 7)^2
-    
-    OPTIMUM SOLUTION IS x* = 3 AND y* = 2
-
-    REPLACE 'f' BELOW WITH THIS TO TEST EXAMPLE-1
-
-    f = (x**2 + y - 11)**2 + (x + y**2 - 7)**2
-
-    '''
-
-    x, y = X[0][0], X[1][0]
-    f = (x**2 + y - 11)**2 + (x + y**2 - 7)**2
-    return f
-
-######################## FITNESS FUNCTION 2 ######################################
-
-def fitness_2(X):
-
-    '''
-
-    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,)
-
-    EXAMPLE PRESENT IN [7] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
-
-    #################################################################################
-
-    BOOTH'S FUNCTION
-
-    MINIMIZE f(x) = (x + 2y - 7)^2 + (2x + y - 5)^2
-
-    OPTIMUM SOLUTION IS x* = 1 AND y* = 3
-
-    REPLACE 'f' BELOW WITH THIS TO TEST EXAMPLE-2
-
-    f = (x + 2*y - 7)**2 + (2*x + y - 5)**2
-
-    '''
-
-    x, y = X[0][0], X[1][0]
-    f = (x + 2*y - 7)**2 + (2*x + y - 5)**2
-    return f
-
-######################## FITNESS FUNCTION 3 ######################################
-
-def fitness_3(X):
-
-    '''
-
-    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,)
-
-    EXAMPLE PRESENT IN [7] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
-
-    #################################################################################
-
-    BEALE'S FUNCTION
-
-    MINIMIZE f(x) = (1.5 - x - xy)^2 + (2.25 - x + xy^2)^2 + (2.625 - x + xy^3)^2
-
-    OPTIMUM SOLUTION IS x* = 3 AND y* = 0.5
-
-    REPLACE 'f' BELOW WITH THIS TO TEST EXAMPLE-3
-
-    f = (1.5 - x + x*y)**2 + (2.25 - x + x*(y**2))**2 + (2.625 - x + x*(y**3))**2
-    
-    #################################################################################
-
-    '''
-
-    x, y = X[0][0], X[1][0]
-    f = (1.5 - x + x*y)**2 + (2.25 - x + x*(y**2))**2 + (2.625 - x + x*(y**3))**2
-    return f
-
-def fitness_4(X):
-
-    '''
-
-    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,)
-
-    EXAMPLE PRESENT IN [https://www.ece.mcmaster.ca/~xwu/part4.pdf, pg. 14] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
-
-    #################################################################################
-
-    MAXIMIZE f(x) = 2xy + 2x - x^2 - 2y^2
-
-    OPTIMUM SOLUTION IS x* = 2 AND y* = 1
-
-    REPLACE 'f' BELOW WITH THIS TO TEST fitness_4
-
-    f = 2*x*y + 2*x - x**2 - 2*(y**2)
-    
-    #################################################################################
-
-    '''
-    x, y = X[0][0], X[1][0]
-    f = 2*x*y + 2*x - x**2 - 2*(y**2)
-    return f
-
-#########################################################################################################################################
-#                                                                                                                                       #
-# REFERENCES:                                                                                                                           #
-#                                                                                                                                       #
-# [1] ALMEIDA, BRUNO & COPPO LEITE, VICTOR. (2019). PARTICLE SWARM OPTIMIZATION: A POWERFUL TECHNIQUE FOR                               #
-#     SOLVING ENGINEERING PROBLEMS. 10.5772/INTECHOPEN.89633.                                                                           #
-#                                                                                                                                       #
-# [2] HE, YAN & MA, WEI & ZHANG, JI. (2016). THE PARAMETERS SELECTION OF PSO ALGORITHM INFLUENCING ON PERFORMANCE OF FAULT DIAGNOSIS.   #
-#     MATEC WEB OF CONFERENCES. 63. 02019. 10.1051/MATECCONF/20166302019.                                                               #
-#                                                                                                                                       #
-# [3] CLERC, M., AND J. KENNEDY. THE PARTICLE SWARM — EXPLOSION, STABILITY, AND CONVERGENCE IN A MULTIDIMENSIONAL COMPLEX SPACE.        #
-#     IEEE TRANSACTIONS ON EVOLUTIONARY COMPUTATION 6, NO. 1 (FEBRUARY 2002): 58–73.                                                    #
-#                                                                                                                                       #
-# [4] Y. H. SHI AND R. C. EBERHART, “A MODIFIED PARTICLE SWARM OPTIMIZER,” IN PROCEEDINGS OF THE IEEE INTERNATIONAL                     #
-#     CONFERENCES ON EVOLUTIONARY COMPUTATION, PP. 69–73, ANCHORAGE, ALASKA, USA, MAY 1998.                                             #
-#                                                                                                                                       #
-# [5] G. SERMPINIS, K. THEOFILATOS, A. KARATHANASOPOULOS, E. F. GEORGOPOULOS, & C. DUNIS, FORECASTING FOREIGN EXCHANGE                  #
-#     RATES WITH ADAPTIVE NEURAL NETWORKS USING RADIAL-BASIS FUNCTIONS AND PARTICLE SWARM OPTIMIZATION,                                 #
-#     EUROPEAN JOURNAL OF OPERATIONAL RESEARCH.                                                                                         #
-#                                                                                                                                       #
-# [6] PARTICLE SWARM OPTIMIZATION (PSO) VISUALLY EXPLAINED                                                                              #
-#     (https://towardsdatascience.com/particle-swarm-optimization-visually-explained-46289eeb2e14)                                      #
-#                                                                                                                                       #
-# [7] RAJIB KUMAR BHATTACHARJYA, INTRODUCTION TO PARTICLE SWARM OPTIMIZATION                                                            #
-#     (http://www.iitg.ac.in/rkbc/CE602/CE602/Particle%20Swarm%20Algorithms.pdf)                                                        #
-#                                                                                                                                       #
-#########################################################################################################################################
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #    
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+
+######################## BATCH FITNESS PROTOCOL ##################################
+
+def batch_fitness(f):
+
+    '''
+
+    DECORATOR WHICH MARKS A FITNESS FUNCTION AS BATCHED. A BATCHED FITNESS FUNCTION RECEIVES
+
+    THE POSITIONS OF THE WHOLE SWARM AS A MATRIX OF SHAPE (P,n) (ONE PARTICLE PER ROW) AND
+
+    RETURNS THEIR FITNESS VALUES AS A VECTOR OF SHAPE (P,). THE PSO CLASS DETECTS THIS MARK
+
+    AND EVALUATES THE WHOLE SWARM WITH ONE CALL PER ITERATION
+
+    THE FOUR 2-DIMENSIONAL EXAMPLE FUNCTIONS BELOW ACCEPT BOTH FORMS BUT ARE NOT MARKED: WITH 'vectorize' THEY ARE
+
+    EVALUATED PARTICLE BY PARTICLE AND FOLLOW THE SAME TRAJECTORIES AS THE 'Particle' ENGINE. PASS 'batch=True' TO
+
+    THE PSO CLASS TO EVALUATE THEM IN ONE CALL PER ITERATION INSTEAD
+
+    '''
+
+    f.batch = True
+    return f
+
+def coordinates(X):
+
+    '''
+
+    X: EITHER A SINGLE POSITION OF SHAPE (2,1) OR (2,) OR A BATCH OF POSITIONS OF SHAPE (P,2)
+
+    RETURNS THE TWO COORDINATES (x,y) AS SCALARS FOR A SINGLE POSITION AND AS VECTORS OF
+
+    SHAPE (P,) FOR A BATCH, SO THAT THE SAME FORMULA SERVES BOTH FORMS. THE EXAMPLE FUNCTIONS HAVE TWO
+
+    DIMENSIONS, SO A BATCH IS RECOGNIZED BY ITS TWO COLUMNS (A BATCH OF ONE PARTICLE IS A (1,2) MATRIX)
+
+    '''
+
+    X = np.asarray(X)
+    if X.ndim == 1:
+        return X[0], X[1]
+    if X.shape[1] == 2:
+        return X[:,0], X[:,1]
+    return X[0][0], X[1][0]
+
+######################## FITNESS FUNCTION 1 ######################################
+
+def fitness_1(X):
+
+    '''
+
+    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,1) OR A BATCH OF POSITIONS OF SHAPE (P,n)
+
+    EXAMPLE PRESENT IN [7] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
+
+    #################################################################################
+
+    HIMMELBLAU'S FUNCTION
+
+    MINIMIZE f(x) = (x^2 + y - 11)^2 + (x + y^2 - 7)^2
+    
+    OPTIMUM SOLUTION IS x* = 3 AND y* = 2
+
+    REPLACE 'f' BELOW WITH THIS TO TEST EXAMPLE-1
+
+    f = (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+
+    '''
+
+    x, y = coordinates(X)
+    f = (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+    return f
+
+######################## FITNESS FUNCTION 2 ######################################
+
+def fitness_2(X):
+
+    '''
+
+    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,1) OR A BATCH OF POSITIONS OF SHAPE (P,n)
+
+    EXAMPLE PRESENT IN [7] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
+
+    #################################################################################
+
+    BOOTH'S FUNCTION
+
+    MINIMIZE f(x) = (x + 2y - 7)^2 + (2x + y - 5)^2
+
+    OPTIMUM SOLUTION IS x* = 1 AND y* = 3
+
+    REPLACE 'f' BELOW WITH THIS TO TEST EXAMPLE-2
+
+    f = (x + 2*y - 7)**2 + (2*x + y - 5)**2
+
+    '''
+
+    x, y = coordinates(X)
+    f = (x + 2*y - 7)**2 + (2*x + y - 5)**2
+    return f
+
+######################## FITNESS FUNCTION 3 ######################################
+
+def fitness_3(X):
+
+    '''
+
+    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,1) OR A BATCH OF POSITIONS OF SHAPE (P,n)
+
+    EXAMPLE PRESENT IN [7] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
+
+    #################################################################################
+
+    BEALE'S FUNCTION
+
+    MINIMIZE f(x) = (1.5 - x - xy)^2 + (2.25 - x + xy^2)^2 + (2.625 - x + xy^3)^2
+
+    OPTIMUM SOLUTION IS x* = 3 AND y* = 0.5
+
+    REPLACE 'f' BELOW WITH THIS TO TEST EXAMPLE-3
+
+    f = (1.5 - x + x*y)**2 + (2.25 - x + x*(y**2))**2 + (2.625 - x + x*(y**3))**2
+    
+    #################################################################################
+
+    '''
+
+    x, y = coordinates(X)
+    f = (1.5 - x + x*y)**2 + (2.25 - x + x*(y**2))**2 + (2.625 - x + x*(y**3))**2
+    return f
+
+def fitness_4(X):
+
+    '''
+
+    X: POSITION (EITHER CURRENT, LOCAL BEST OR GLOBAL BEST) OF SIZE (n,1) OR A BATCH OF POSITIONS OF SHAPE (P,n)
+
+    EXAMPLE PRESENT IN [https://www.ece.mcmaster.ca/~xwu/part4.pdf, pg. 14] FOR 2-DIMENSIONAL VECTORS (X = (x,y))
+
+    #################################################################################
+
+    MAXIMIZE f(x) = 2xy + 2x - x^2 - 2y^2
+
+    OPTIMUM SOLUTION IS x* = 2 AND y* = 1
+
+    REPLACE 'f' BELOW WITH THIS TO TEST fitness_4
+
+    f = 2*x*y + 2*x - x**2 - 2*(y**2)
+    
+    #################################################################################
+
+    '''
+    x, y = coordinates(X)
+    f = 2*x*y + 2*x - x**2 - 2*(y**2)
+    return f
+
+######################## SCALABLE BENCHMARK FUNCTIONS ##########################
+
+def rows(X):
+
+    '''
+
+    X: EITHER A SINGLE POSITION OF SHAPE (n,) OR A BATCH OF POSITIONS OF SHAPE (P,n)
+
+    RETURNS THE POSITIONS AS A (P,n) MATRIX (ONE ROW FOR A SINGLE POSITION) AND TRUE IF 'X' WAS A SINGLE POSITION.
+
+    ANY MATRIX IS A BATCH, ALSO A (P,1) BATCH OF ONE DIMENSIONAL POSITIONS, SO A SINGLE POSITION MUST BE A VECTOR
+
+    '''
+
+    X = np.asarray(X, dtype='float64')
+    if X.ndim == 1:
+        return X[None,:], True
+    return X.reshape(len(X), -1), False
+
+# EACH FUNCTION BELOW TAKES A (P,n) MATRIX 'Z' AND RETURNS A VECTOR OF SHAPE (P,). THEY ARE WRAPPED BY THE
+
+# 'Benchmark' OBJECTS FURTHER DOWN, WHICH ADD THE BOUNDS, THE OPTIMUM, THE SHIFT AND THE ROTATION
+
+def sphere_rows(Z):
+
+    # f(z) = SUM z_i^2
+
+    return np.einsum('ij,ij->i', Z, Z)
+
+def rosenbrock_rows(Z):
+
+    # f(z) = SUM 100 (z_i+1 - z_i^2)^2 + (1 - z_i)^2
+
+    return (100*(Z[:,1:] - Z[:,:-1]**2)**2 + (1 - Z[:,:-1])**2).sum(axis=1)
+
+def rastrigin_rows(Z):
+
+    # f(z) = 10 n + SUM z_i^2 - 10 cos(2 pi z_i)
+
+    return 10*Z.shape[1] + (Z**2 - 10*np.cos(2*np.pi*Z)).sum(axis=1)
+
+def ackley_rows(Z):
+
+    # f(z) = -20 exp(-0.2 sqrt(MEAN z_i^2)) - exp(MEAN cos(2 pi z_i)) + 20 + e
+
+    return -20*np.exp(-0.2*np.sqrt((Z**2).mean(axis=1))) - np.exp(np.cos(2*np.pi*Z).mean(axis=1)) + 20 + np.e
+
+def griewank_rows(Z):
+
+    # f(z) = 1 + SUM z_i^2 / 4000 - PRODUCT cos(z_i / sqrt(i))
+
+    i = np.arange(1, Z.shape[1]+1)
+    return 1 + (Z**2).sum(axis=1)/4000 - np.cos(Z/np.sqrt(i)).prod(axis=1)
+
+def schwefel_rows(Z):
+
+    # f(z) = 418.9829 n - SUM z_i sin(sqrt|z_i|)
+
+    return 418.9828872724338*Z.shape[1] - (Z*np.sin(np.sqrt(np.abs(Z)))).sum(axis=1)
+
+###########################  BENCHMARK CLASS  ##################################
+
+class Benchmark:
+
+    # MARKS EVERY BENCHMARK AS A BATCHED FITNESS FUNCTION (SEE 'batch_fitness')
+
+    batch = True
+
+    def __init__(self, name, f, bound, x_opt=0.0, optimum=0.0, shift=None, rotation=None):
+
+        '''
+
+        n-DIMENSIONAL TEST FUNCTION (TO MINIMIZE) WITH ITS SEARCH DOMAIN AND ITS KNOWN OPTIMUM. A 'Benchmark'
+
+        IS A BATCHED FITNESS FUNCTION: IT IS CALLED WITH A (P,n) BATCH (OR A SINGLE (n,) POSITION, SEE 'rows'), AND
+
+        IT CAN BE SENT TO WORKER PROCESSES
+
+        PARAMETERS:
+
+        name: NAME OF THE FUNCTION
+
+        f: FUNCTION OF A (P,n) MATRIX RETURNING A VECTOR OF SHAPE (P,) (E.G. 'sphere_rows')
+
+        bound: (LOWER, UPPER) BOUND OF EVERY DIMENSION
+
+        x_opt: VALUE OF EVERY COORDINATE OF THE OPTIMUM OF 'f'
+
+        optimum: FITNESS VALUE AT THE OPTIMUM
+
+        shift: OPTIMUM POSITION OF SHAPE (n,) OF THE SHIFTED VARIANT (SEE 'shifted')
+
+        rotation: ORTHOGONAL MATRIX OF SHAPE (n,n) OF THE ROTATED VARIANT (SEE 'rotated')
+
+        THE SHIFTED AND ROTATED VARIANT EVALUATES f(R (x - shift) + x_opt), WHOSE OPTIMUM IS AT x = shift. THE
+
+        TRANSFORMED COORDINATES ARE CLIPPED TO THE DOMAIN, SO THAT NO POINT OUTSIDE IT (E.G. OF SCHWEFEL'S FUNCTION)
+
+        BEATS THE KNOWN OPTIMUM
+
+        '''
+
+        self.name = name
+        self.f = f
+        self.lower, self.upper = bound
+        self.x_opt = x_opt
+        self.optimum = optimum
+        self.shift = shift
+        self.rotation = rotation
+
+    def __call__(self, X):
+        Z, single = rows(X)
+        if self.shift is not None or self.rotation is not None:
+            Z = Z - (self.x_opt if self.shift is None else self.shift)
+            if self.rotation is not None:
+                Z = Z @ self.rotation.T
+            Z += self.x_opt
+            np.clip(Z, self.lower, self.upper, out=Z)
+        F = self.f(Z)
+        return F[0] if single else F
+
+    def bound(self, n):
+
+        # 'bound' ARGUMENT OF THE PSO CLASS FOR n DIMENSIONS
+
+        return [(self.lower, self.upper)]*n
+
+    def solution(self, n):
+
+        # POSITION OF THE OPTIMUM OF SHAPE (n,)
+
+        if self.shift is not None:
+            return self.shift.copy()
+        return np.full(n, self.x_opt, dtype='float64')
+
+    def error(self, fitness):
+
+        # DISTANCE OF A FITNESS VALUE FROM THE OPTIMUM
+
+        return fitness - self.optimum
+
+    def shifted(self, n, seed=None):
+
+        # SHIFTED VARIANT FOR n DIMENSIONS: THE OPTIMUM IS MOVED TO A RANDOM POSITION IN THE INNER 80% OF THE DOMAIN
+
+        rng = np.random.default_rng(seed)
+        half = 0.4*(self.upper - self.lower)
+        shift = (self.upper + self.lower)/2 + rng.uniform(-half, half, size=n)
+        return Benchmark('shifted_' + self.name, self.f, (self.lower, self.upper), self.x_opt, self.optimum, shift, self.rotation)
+
+    def rotated(self, n, seed=None):
+
+        # ROTATED VARIANT FOR n DIMENSIONS: THE COORDINATES ARE MIXED BY A RANDOM ORTHOGONAL MATRIX (NO LONGER SEPARABLE)
+
+        rng = np.random.default_rng(seed)
+        Q, R = np.linalg.qr(rng.standard_normal((n,n)))
+        Q *= np.sign(np.diag(R))
+        return Benchmark('rotated_' + self.name, self.f, (self.lower, self.upper), self.x_opt, self.optimum, self.shift, Q)
+
+    def __repr__(self):
+        return 'Benchmark(%r)' % self.name
+
+######################## END OF BENCHMARK CLASS ##################################
+
+sphere = Benchmark('sphere', sphere_rows, (-5.12, 5.12))
+rosenbrock = Benchmark('rosenbrock', rosenbrock_rows, (-5.0, 10.0), x_opt=1.0)
+rastrigin = Benchmark('rastrigin', rastrigin_rows, (-5.12, 5.12))
+ackley = Benchmark('ackley', ackley_rows, (-32.768, 32.768))
+griewank = Benchmark('griewank', griewank_rows, (-600.0, 600.0))
+schwefel = Benchmark('schwefel', schwefel_rows, (-500.0, 500.0), x_opt=420.9687462275036)
+
+BENCHMARKS = {f.name: f for f in (sphere, rosenbrock, rastrigin, ackley, griewank, schwefel)}
+
+#########################################################################################################################################
+#                                                                                                                                       #
+# REFERENCES:                                                                                                                           #
+#                                                                                                                                       #
+# [1] ALMEIDA, BRUNO & COPPO LEITE, VICTOR. (2019). PARTICLE SWARM OPTIMIZATION: A POWERFUL TECHNIQUE FOR                               #
+#     SOLVING ENGINEERING PROBLEMS. 10.5772/INTECHOPEN.89633.                                                                           #
+#                                                                                                                                       #
+# [2] HE, YAN & MA, WEI & ZHANG, JI. (2016). THE PARAMETERS SELECTION OF PSO ALGORITHM INFLUENCING ON PERFORMANCE OF FAULT DIAGNOSIS.   #
+#     MATEC WEB OF CONFERENCES. 63. 02019. 10.1051/MATECCONF/20166302019.                                                               #
+#                                                                                                                                       #
+# [3] CLERC, M., AND J. KENNEDY. THE PARTICLE SWARM — EXPLOSION, STABILITY, AND CONVERGENCE IN A MULTIDIMENSIONAL COMPLEX SPACE.        #
+#     IEEE TRANSACTIONS ON EVOLUTIONARY COMPUTATION 6, NO. 1 (FEBRUARY 2002): 58–73.                                                    #
+#                                                                                                                                       #
+# [4] Y. H. SHI AND R. C. EBERHART, “A MODIFIED PARTICLE SWARM OPTIMIZER,” IN PROCEEDINGS OF THE IEEE INTERNATIONAL                     #
+#     CONFERENCES ON EVOLUTIONARY COMPUTATION, PP. 69–73, ANCHORAGE, ALASKA, USA, MAY 1998.                                             #
+#                                                                                                                                       #
+# [5] G. SERMPINIS, K. THEOFILATOS, A. KARATHANASOPOULOS, E. F. GEORGOPOULOS, & C. DUNIS, FORECASTING FOREIGN EXCHANGE                  #
+#     RATES WITH ADAPTIVE NEURAL NETWORKS USING RADIAL-BASIS FUNCTIONS AND PARTICLE SWARM OPTIMIZATION,                                 #
+#     EUROPEAN JOURNAL OF OPERATIONAL RESEARCH.                                                                                         #
+#                                                                                                                                       #
+# [6] PARTICLE SWARM OPTIMIZATION (PSO) VISUALLY EXPLAINED                                                                              #
+#     (https://towardsdatascience.com/particle-swarm-optimization-visually-explained-46289eeb2e14)                                      #
+#                                                                                                                                       #
+# [7] RAJIB KUMAR BHATTACHARJYA, INTRODUCTION TO PARTICLE SWARM OPTIMIZATION                                                            #
+#     (http://www.iitg.ac.in/rkbc/CE602/CE602/Particle%20Swarm%20Algorithms.pdf)                                                        #
+#                                                                                                                                       #
+#########################################################################################################################################
@@ -0,0 +1,237 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+import multiprocessing as mp
+from threading import BrokenBarrierError
+from pso import PSO
+
+MIGRATIONS = ('ring', 'star', 'random')
+
+#######################   ISLAND PROCESS   #####################################
+
+def source(k, K, migration, F, rng):
+
+    '''
+
+    PARAMETERS:
+
+    k: ISLAND INDEX
+
+    K: NUMBER OF ISLANDS
+
+    migration: MIGRATION TOPOLOGY ('ring', 'star' OR 'random')
+
+    F: PUBLISHED FITNESS VALUES OF THE BEST PARTICLES OF EVERY ISLAND OF SHAPE (K,m), BEST FIRST, AS COSTS
+
+    rng: 'numpy.random.Generator' OF ISLAND 'k'
+
+    ACTION:
+
+    RETURNS THE ISLAND WHOSE BEST PARTICLES MIGRATE TO ISLAND 'k'
+
+        1. 'ring': THE PREVIOUS ISLAND (k-1)
+
+        2. 'star': ISLAND 0 IS THE HUB. IT RECEIVES FROM THE BEST OTHER ISLAND AND EVERY OTHER ISLAND RECEIVES FROM IT
+
+        3. 'random': A RANDOM OTHER ISLAND, DRAWN AGAIN AT EVERY MIGRATION
+
+    '''
+
+    if migration == 'ring':
+        return (k-1) % K
+    if migration == 'star':
+        if k != 0:
+            return 0
+        return 1 + int(np.argmin(F[1:,0]))
+    return (k + rng.integers(1, K)) % K
+
+def run_island(k, K, fitness, options, seed, interval, migrants, migration, shared, barrier):
+
+    '''
+
+    BODY OF THE PROCESS OF ISLAND 'k'. RUNS A 'PSO' ITERATION BY ITERATION AND EVERY 'interval' ITERATIONS:
+
+        1. PUBLISHES ITS 'migrants' BEST PARTICLES IN THE SHARED BUFFERS
+
+        2. WAITS FOR ALL THE ISLANDS, COPIES THE PARTICLES OF ITS SOURCE ISLAND AND WAITS AGAIN (SO THAT NO
+
+        ISLAND OVERWRITES ITS PARTICLES BEFORE EVERYONE HAS READ THEM)
+
+        3. REPLACES ITS WORST PARTICLES WITH THE MIGRANTS WHICH ARE BETTER
+
+    AN ISLAND WHICH MEETS A STOPPING CRITERION EARLY KEEPS TAKING PART IN THE REMAINING MIGRATIONS. AT THE END,
+
+    THE HISTORY, BEST POSITION AND NUMBER OF EVALUATIONS OF THE ISLAND ARE WRITTEN TO THE SHARED BUFFERS
+
+    '''
+
+    try:
+        optimizer = PSO(fitness, **dict(options, vectorize=True, seed=seed))
+        n, T = optimizer.n, optimizer.Tmax + 1
+        sign = 1.0 if optimizer.min else -1.0
+        X = np.frombuffer(shared['X'], dtype='float64').reshape(K, migrants, n)
+        F = np.frombuffer(shared['F'], dtype='float64').reshape(K, migrants)
+        history = np.frombuffer(shared['history'], dtype='float64').reshape(K, T)
+        gbest = np.frombuffer(shared['gbest'], dtype='float64').reshape(K, n)
+        counts = np.frombuffer(shared['counts'], dtype='float64').reshape(K, 3)
+        rounds = optimizer.Tmax // interval if K > 1 else 0
+        done = 0
+
+        def migrate():
+            X[k], F[k] = optimizer.emigrants(migrants)
+            F[k] *= sign
+            barrier.wait()
+            j = source(k, K, migration, F, optimizer.rng)
+            X_in, F_in = X[j].copy(), sign*F[j]
+            barrier.wait()
+            optimizer.immigrate(X_in, F_in)
+
+        for state in optimizer.iterate():
+            history[k, state['t']] = state['gbest_fitness']
+            if (state['t']+1) % interval == 0 and done < rounds:
+                migrate()
+                done += 1
+        while done < rounds:
+            migrate()
+            done += 1
+
+        gbest[k] = optimizer.gbest.reshape(-1)
+        counts[k] = optimizer.gbest_fitness, optimizer.evaluations, len(optimizer.fitness_time)
+    except BrokenBarrierError:
+        raise
+    except BaseException:
+        barrier.abort()
+        raise
+
+###########################  ISLANDS CLASS  ####################################
+
+class Islands:
+
+    def __init__(self, fitness, K=4, interval=10, migrants=1, migration='ring', seed=None, **options):
+
+        '''
+
+        ISLAND MODEL. RUNS 'K' SWARMS (EACH ONE A 'PSO' INSTANCE) IN 'K' SEPARATE PROCESSES WHICH EXCHANGE THEIR
+
+        BEST PARTICLES EVERY 'interval' ITERATIONS. THE PARTICLES ARE EXCHANGED THROUGH SHARED MEMORY BUFFERS
+
+        ('multiprocessing.RawArray'), SO NO SWARM IS EVER PICKLED
+
+        PARAMETERS:
+
+        fitness: FITNESS FUNCTION (MUST BE PICKLABLE IF THE PROCESSES ARE NOT FORKED)
+
+        K: NUMBER OF ISLANDS (PROCESSES)
+
+        interval: NUMBER OF ITERATIONS BETWEEN TWO MIGRATIONS
+
+        migrants: NUMBER OF BEST PARTICLES SENT BY AN ISLAND AT EACH MIGRATION (AT MOST P)
+
+        migration: MIGRATION TOPOLOGY ('ring', 'star' OR 'random', SEE 'source')
+
+        seed: SEED OF THE RUN (AN INT OR A 'numpy.random.SeedSequence', NONE FOR FRESH ENTROPY). EACH ISLAND GETS ITS OWN
+
+        INDEPENDENT STREAM, SPAWNED FROM 'numpy.random.SeedSequence(seed)'
+
+        options: ANY OTHER ARGUMENT OF THE PSO CLASS (P, n, w, c1, c2, Tmax, bound, topology, ...), SHARED BY ALL
+
+        THE ISLANDS. THE ISLANDS USE THE ARRAY ENGINE
+
+        RESULTS (AFTER 'move' OR 'execute'):
+
+        gbest: GLOBAL BEST POSITION OVER ALL THE ISLANDS OF SHAPE (n,1)
+
+        gbest_fitness: FITNESS (OR COST) VALUE OF 'gbest'
+
+        island_fitness_time: GLOBAL FITNESS OF EACH ISLAND AT EACH ITERATION OF SHAPE (K,T)
+
+        fitness_time: BEST GLOBAL FITNESS OVER ALL THE ISLANDS AT EACH ITERATION
+
+        time: LIST STORING ITERATION NUMBER ([0,1,2,...])
+
+        evaluations: TOTAL NUMBER OF FITNESS EVALUATIONS OVER ALL THE ISLANDS
+
+        '''
+
+        if migration not in MIGRATIONS:
+            raise ValueError('migration must be one of %s, got %r' % (', '.join(MIGRATIONS), migration))
+        if migrants > options.get('P', 30):
+            raise ValueError('migrants (%d) cannot exceed the population size of an island' % migrants)
+        self.fitness = fitness
+        self.K = K
+        self.interval = interval
+        self.migrants = migrants
+        self.migration = migration
+        self.seed = seed
+        self.options = options
+        self.n = options.get('n', 2)
+        self.Tmax = options.get('Tmax', 300)
+        self.min = options.get('min', True)
+
+    def move(self):
+
+        '''
+
+        ACTION:
+
+        ALLOCATES THE SHARED BUFFERS, STARTS ONE PROCESS PER ISLAND, WAITS FOR ALL OF THEM AND MERGES
+
+        THEIR 'fitness_time' HISTORIES INTO THE GLOBAL REPORT
+
+        '''
+
+        K, n, T, m = self.K, self.n, self.Tmax + 1, self.migrants
+        seed = self.seed if isinstance(self.seed, np.random.SeedSequence) else np.random.SeedSequence(self.seed)
+        seeds = seed.spawn(K)
+        shared = {'X': mp.RawArray('d', K*m*n), 'F': mp.RawArray('d', K*m), 'history': mp.RawArray('d', K*T),
+                  'gbest': mp.RawArray('d', K*n), 'counts': mp.RawArray('d', K*3)}
+        barrier = mp.Barrier(K)
+        processes = [mp.Process(target=run_island, args=(k, K, self.fitness, self.options, seeds[k], self.interval,
+                                                         m, self.migration, shared, barrier)) for k in range(K)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError('an island process failed (exit codes: %s)' % [process.exitcode for process in processes])
+
+        history = np.frombuffer(shared['history'], dtype='float64').reshape(K, T).copy()
+        gbest = np.frombuffer(shared['gbest'], dtype='float64').reshape(K, n)
+        counts = np.frombuffer(shared['counts'], dtype='float64').reshape(K, 3)
+
+        # AN ISLAND WHICH STOPPED EARLY KEEPS ITS LAST GLOBAL FITNESS FOR THE REMAINING ITERATIONS
+
+        length = counts[:,2].astype(int)
+        for k in range(K):
+            history[k, length[k]:] = history[k, length[k]-1]
+        length = length.max()
+        self.island_fitness_time = history[:, :length]
+        best = np.min if self.min else np.max
+        self.fitness_time = best(self.island_fitness_time, axis=0).tolist()
+        self.time = list(range(length))
+        k = int(np.argmin(counts[:,0]) if self.min else np.argmax(counts[:,0]))
+        self.gbest = gbest[k].reshape(-1,1).copy()
+        self.gbest_fitness = counts[k,0]
+        self.evaluations = int(counts[:,1].sum())
+
+    def execute(self):
+
+        # A KIND OF MAIN FUNCTION, PRINTS THE FINAL SOLUTION
+
+        self.move()
+        print('\nOPTIMUM SOLUTION\n  >', np.round(self.gbest.reshape(-1),7).tolist())
+        print('\nOPTIMUM FITNESS\n  >', np.round(self.gbest_fitness,7))
+        print()
+
+    Fplot = PSO.Fplot
+
+######################################## END OF ISLANDS CLASS ########################################
@@ -0,0 +1,244 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+
+BACKENDS = ('auto', 'numba', 'numpy')
+
+NO_BOUND = np.empty(0)
+
+#######################   LOOP KERNELS (COMPILED BY NUMBA)   ###################
+
+# PLAIN PYTHON LOOPS OVER THE (P,n) ARRAYS OF A 'Swarm'. COMPILED BY NUMBA THEY VISIT EACH ELEMENT ONCE, WITHOUT
+
+# ANY TEMPORARY ARRAY. THE ARITHMETIC IS DONE IN THE SAME ORDER AS 'Swarm.propose', SO THE RESULT IS BIT FOR BIT THE
+
+# SAME AS THE UFUNC VERSION. THEY ALSO RUN UNCOMPILED (SLOWLY), WHICH IS HOW THEY CAN BE CHECKED WITHOUT NUMBA
+
+def move_loops(X, V, pbest, social, r, c1, c2, w, vmax, lower, upper, tmp):
+
+    '''
+
+    PARAMETERS:
+
+    X, V, pbest: POSITIONS, VELOCITIES AND PERSONAL BESTS OF SHAPE (P,n) ('X' AND 'V' ARE UPDATED IN PLACE)
+
+    social: 'gbest' OF SHAPE (1,n) OR THE NEIGHBOURHOOD BESTS 'lbest' OF SHAPE (P,n)
+
+    r: RANDOM COEFFICIENTS OF SHAPE (P,2)
+
+    c1, c2, w: COEFFICIENTS OF THE ITERATION
+
+    vmax: MAXIMUM VELOCITY OF EACH DIMENSION OF SHAPE (n,)
+
+    lower, upper: BOUNDS OF SHAPE (n,) (EMPTY ARRAYS IF THERE IS NO BOUND)
+
+    tmp: WORK BUFFER OF THE NUMPY VERSION (NOT USED HERE)
+
+    ACTION:
+
+    INERTIA, COGNITIVE AND SOCIAL TERMS, VELOCITY CLAMP, POSITION UPDATE AND BOUND CLIPPING IN ONE PASS
+
+    '''
+
+    P, n = X.shape
+    bounded = lower.shape[0] > 0
+    for i in range(P):
+        a1 = c1*r[i,0]
+        a2 = c2*r[i,1]
+        k = 0 if social.shape[0] == 1 else i
+        for j in range(n):
+            x = X[i,j]
+            v = w*V[i,j] + a1*(pbest[i,j] - x)
+            v = v + a2*(social[k,j] - x)
+            if v < -vmax[j]:
+                v = -vmax[j]
+            elif v > vmax[j]:
+                v = vmax[j]
+            x = x + v
+            if bounded:
+                if x < lower[j]:
+                    x = lower[j]
+                elif x > upper[j]:
+                    x = upper[j]
+            V[i,j] = v
+            X[i,j] = x
+
+def select_loops(X, F, sign, cost, pbest, pbest_cost, gbest, gbest_cost, improved):
+
+    '''
+
+    PARAMETERS:
+
+    X: EVALUATED POSITIONS OF SHAPE (P,n)
+
+    F: THEIR FITNESS VALUES OF SHAPE (P,)
+
+    sign: 1 FOR MINIMIZATION AND -1 FOR MAXIMIZATION
+
+    cost, pbest, pbest_cost, gbest: ARRAYS OF THE 'Swarm' (UPDATED IN PLACE)
+
+    gbest_cost: COST OF 'gbest'
+
+    improved: WORK BUFFER OF THE NUMPY VERSION (NOT USED HERE)
+
+    ACTION:
+
+    UPDATES THE COSTS AND EVERY 'pbest' IN ONE PASS, THEN 'gbest' FROM THE BEST CURRENT POSITION. RETURNS
+
+    THE NEW 'gbest_cost' AND TRUE IF 'gbest' CHANGED
+
+    '''
+
+    P, n = X.shape
+    best = 0
+    for i in range(P):
+        c = sign*F[i]
+        cost[i] = c
+        if c < pbest_cost[i]:
+            pbest_cost[i] = c
+            for j in range(n):
+                pbest[i,j] = X[i,j]
+        if c < cost[best]:
+            best = i
+    if gbest_cost > cost[best]:
+        for j in range(n):
+            gbest[j] = X[best,j]
+        return cost[best], True
+    return gbest_cost, False
+
+#######################   NUMPY KERNELS   ######################################
+
+def move_numpy(X, V, pbest, social, r, c1, c2, w, vmax, lower, upper, tmp):
+
+    # SAME AS 'move_loops' WITH IN-PLACE UFUNCS ON THE WORK BUFFER 'tmp' (NO COPY OF THE PREVIOUS POSITIONS IS KEPT).
+
+    # 'vmax' CAN ALSO BE A SCALAR AND 'lower' NONE. THE COEFFICIENTS ARE MULTIPLIED INTO 'r'
+
+    np.multiply(r, (c1, c2), out=r)
+    np.multiply(w, V, out=V)
+    np.subtract(pbest, X, out=tmp)
+    np.multiply(r[:,:1], tmp, out=tmp)
+    np.add(V, tmp, out=V)
+    np.subtract(social, X, out=tmp)
+    np.multiply(r[:,1:], tmp, out=tmp)
+    np.add(V, tmp, out=V)
+    np.clip(V, -vmax, vmax, out=V)
+    np.add(X, V, out=X)
+    if lower is not None:
+        np.clip(X, lower, upper, out=X)
+
+def select_numpy(X, F, sign, cost, pbest, pbest_cost, gbest, gbest_cost, improved):
+
+    # SAME AS 'select_loops' WITH WHOLE ARRAY OPERATIONS, THE MASK OF THE IMPROVED PARTICLES IS WRITTEN INTO 'improved'
+
+    np.multiply(F, sign, out=cost)
+    np.less(cost, pbest_cost, out=improved)
+    np.copyto(pbest, X, where=improved[:,None])
+    np.copyto(pbest_cost, cost, where=improved)
+    best = np.argmin(cost)
+    if gbest_cost > cost[best]:
+        np.copyto(gbest, X[best])
+        return cost[best], True
+    return gbest_cost, False
+
+###########################  KERNEL CLASS  #####################################
+
+# COMPILED FUNCTIONS, SHARED BY ALL THE 'Kernel' OBJECTS OF A PROCESS
+
+compiled = {}
+
+class Kernel:
+
+    def __init__(self, backend='auto'):
+
+        '''
+
+        FUSED UPDATE OF A 'Swarm': ONE KERNEL MOVES EVERY PARTICLE (INERTIA, COGNITIVE AND SOCIAL TERMS, VELOCITY
+
+        CLAMP, POSITION UPDATE AND BOUND CLIPPING) AND ONE KERNEL SELECTS THE NEW 'pbest' AND 'gbest' AFTER THE
+
+        EVALUATION. THEY REPLACE THE SEQUENCE OF UFUNCS OF 'draw', 'propose' AND 'accept_all', WHOSE DISPATCH AND
+
+        MEMORY TRAFFIC DOMINATE FOR LARGE SWARMS IN FEW DIMENSIONS
+
+        PARAMETERS:
+
+        backend: 'numba' (COMPILED LOOPS, NEEDS NUMBA), 'numpy' (IN-PLACE UFUNCS, NO EXTRA DEPENDENCY) OR 'auto'
+
+        (NUMBA IF IT IS INSTALLED, OTHERWISE NUMPY)
+
+        NUMBA IS ONLY IMPORTED HERE, SO 'import pso' STAYS CHEAP. THE LOOPS ARE COMPILED WITH 'cache=True': THE
+
+        MACHINE CODE IS WRITTEN NEXT TO THIS FILE (IN '__pycache__') THE FIRST TIME AND LOADED FROM THERE BY ANY
+
+        LATER PROCESS (E.G. A WORKER OR AN ISLAND), WHICH THEN DOES NOT PAY THE COMPILATION AGAIN
+
+        '''
+
+        if backend not in BACKENDS:
+            raise ValueError('backend must be one of %s, got %r' % (', '.join(BACKENDS), backend))
+        if backend != 'numpy' and not compiled:
+            try:
+                import numba
+            except ImportError:
+                if backend == 'numba':
+                    raise
+            else:
+                compiled['move'] = numba.njit(cache=True)(move_loops)
+                compiled['select'] = numba.njit(cache=True)(select_loops)
+        if backend != 'numpy' and compiled:
+            self.backend, self.move_rows, self.select_rows = 'numba', compiled['move'], compiled['select']
+        else:
+            self.backend, self.move_rows, self.select_rows = 'numpy', move_numpy, select_numpy
+
+    def move(self, swarm, w, c1, c2, vmax):
+
+        '''
+
+        PARAMETERS:
+
+        swarm: 'Swarm' OBJECT
+
+        w, c1, c2, vmax: COEFFICIENTS OF THE ITERATION
+
+        ACTION:
+
+        DRAWS THE RANDOM COEFFICIENTS OF EVERY PARTICLE (THE SAME NUMBERS AS 'Swarm.draw') AND MOVES THE WHOLE SWARM
+
+        '''
+
+        r = swarm.rng.random(out=swarm.r)
+        social = swarm.gbest[None,:]
+        if swarm.topology is not None:
+            swarm.topology.social_best(swarm.pbest, swarm.pbest_cost, swarm.lbest)
+            social = swarm.lbest
+        lower, upper = swarm.lower, swarm.upper
+        if self.backend == 'numba':
+            vmax = np.broadcast_to(np.asarray(vmax, dtype='float64').reshape(-1), (swarm.n,))
+            c1, c2, w = float(c1), float(c2), float(w)
+            if lower is None:
+                lower = upper = NO_BOUND
+        self.move_rows(swarm.X, swarm.V, swarm.pbest, social, r, c1, c2, w, vmax, lower, upper, swarm.tmp)
+
+    def select(self, swarm, F):
+
+        # UPDATES 'pbest' AND 'gbest' OF 'swarm' FROM THE FITNESS VALUES 'F' OF SHAPE (P,). RETURNS TRUE IF 'gbest' CHANGED
+
+        F = np.asarray(F, dtype='float64')
+        swarm.gbest_cost, changed = self.select_rows(swarm.X, F, swarm.sign, swarm.cost, swarm.pbest, swarm.pbest_cost,
+                                                     swarm.gbest, swarm.gbest_cost, swarm.improved)
+        return changed
+
+    def __repr__(self):
+        return 'Kernel(%r)' % self.backend
+
+######################################## END OF KERNEL CLASS ########################################
@@ -0,0 +1,165 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import json
+import time
+import numpy as np
+
+# COLUMNS RECORDED FOR EVERY ITERATION (SEE 'Metrics')
+
+FIELDS = ('t', 'time', 'coeff_time', 'evaluate_time', 'update_time', 'evaluations', 'cache_hits', 'diversity',
+          'improvement', 'gbest_fitness')
+
+INTEGER_FIELDS = ('t', 'evaluations', 'cache_hits')
+
+###########################  METRICS CLASS  ####################################
+
+class Metrics:
+
+    def __init__(self, callbacks=None, diversity=True, capacity=1024):
+
+        '''
+
+        PER ITERATION PROFILE OF A PSO RUN. PASS 'metrics=True' (OR A 'Metrics' OBJECT) TO THE PSO CLASS AND,
+
+        AFTER EACH ITERATION, ONE ROW WITH THE FOLLOWING COLUMNS IS STORED:
+
+            t: ITERATION NUMBER
+
+            time: WALL TIME OF THE ITERATION (SECONDS)
+
+            coeff_time: TIME SPENT IN 'update_coeff'
+
+            evaluate_time: TIME SPENT IN THE FITNESS FUNCTION (OR WAITING FOR THE WORKERS, OR BETWEEN 'ask' AND 'tell')
+
+            update_time: THE REST OF THE ITERATION, I.E. THE OPTIMIZER'S OWN WORK (VELOCITY AND POSITION UPDATE,
+
+            CLIPPING, 'pbest'/'gbest' UPDATE, CACHE LOOKUPS AND RECORDING)
+
+            evaluations: FITNESS EVALUATIONS DONE IN THE ITERATION
+
+            cache_hits: POSITIONS FOUND IN THE 'cache' IN THE ITERATION (0 WITHOUT A CACHE)
+
+            diversity: MEAN DISTANCE OF THE PARTICLES TO THE CENTROID OF THE SWARM (NAN IF 'diversity' IS FALSE)
+
+            improvement: HOW MUCH THE GLOBAL FITNESS IMPROVED IN THE ITERATION (NEVER NEGATIVE)
+
+            gbest_fitness: GLOBAL FITNESS AT THE END OF THE ITERATION
+
+        PARAMETERS:
+
+        callbacks: LIST OF FUNCTIONS CALLED AFTER EACH ITERATION WITH THE ROW AS A DICTIONARY (E.G. TO SEND IT TO A
+
+        MONITORING SYSTEM WHILE THE RUN IS GOING ON)
+
+        diversity: BOOL VALUE (FALSE TO SKIP THE DIVERSITY, WHICH COSTS O(P*n) PER ITERATION)
+
+        capacity: NUMBER OF ROWS ALLOCATED UPFRONT (THE TABLE GROWS BY DOUBLING WHEN FULL)
+
+        THE COLUMNS ARE READ AS NUMPY ARRAYS WITH metrics['evaluate_time'] AND EXPORTED WITH 'to_csv' AND 'to_jsonl'.
+
+        WITHOUT METRICS, THE PSO CLASS ONLY CHECKS 'metrics is None' ONCE PER ITERATION AND PER EVALUATION
+
+        '''
+
+        self.callbacks = list(callbacks or [])
+        self.diversity = diversity
+        self.data = np.zeros((capacity, len(FIELDS)))
+        self.length = 0
+        self.column = {field: j for j, field in enumerate(FIELDS)}
+        self.coeff_time = self.evaluate_time = 0.0
+
+    def begin(self, optimizer):
+
+        # START OF AN ITERATION OF 'optimizer': RESET THE PHASE TIMERS AND TAKE A SNAPSHOT OF THE COUNTERS
+
+        self.coeff_time = self.evaluate_time = 0.0
+        self.evaluations = optimizer.evaluations
+        self.hits = optimizer.cache.hits if optimizer.cache is not None else 0
+        self.gbest_fitness = optimizer.gbest_fitness
+        self.start = self.mark = time.perf_counter()
+
+    def lap(self):
+
+        # RETURNS THE TIME SINCE 'begin' OR THE PREVIOUS 'lap'
+
+        now = time.perf_counter()
+        elapsed, self.mark = now - self.mark, now
+        return elapsed
+
+    def end(self, optimizer):
+
+        # END OF THE ITERATION: STORES ITS ROW, CALLS THE CALLBACKS AND RETURNS THE ROW AS A DICTIONARY
+
+        elapsed = time.perf_counter() - self.start
+        if self.diversity:
+            X = optimizer.positions()
+            diversity = np.sqrt(((X - X.mean(axis=0))**2).sum(axis=1)).mean()
+        else:
+            diversity = np.nan
+        sign = 1.0 if optimizer.min else -1.0
+        hits = optimizer.cache.hits if optimizer.cache is not None else 0
+        row = (optimizer.t, elapsed, self.coeff_time, self.evaluate_time, elapsed - self.coeff_time - self.evaluate_time,
+               optimizer.evaluations - self.evaluations, hits - self.hits, diversity,
+               max(sign*(self.gbest_fitness - optimizer.gbest_fitness), 0.0), optimizer.gbest_fitness)
+        if self.length == len(self.data):
+            self.data = np.concatenate([self.data, np.zeros_like(self.data)])
+        self.data[self.length] = row
+        self.length += 1
+        row = self.row(self.length - 1)
+        for callback in self.callbacks:
+            callback(row)
+        return row
+
+    def __getitem__(self, field):
+
+        # COLUMN 'field' OF ALL THE RECORDED ITERATIONS AS A NUMPY ARRAY
+
+        return self.data[:self.length, self.column[field]]
+
+    def __len__(self):
+        return self.length
+
+    def row(self, i):
+
+        # ROW 'i' AS A DICTIONARY
+
+        row = dict(zip(FIELDS, self.data[i].tolist()))
+        for field in INTEGER_FIELDS:
+            row[field] = int(row[field])
+        return row
+
+    def summary(self):
+
+        # TOTAL TIME OF EACH PHASE OVER THE RUN AND THE SHARE OF THE FITNESS EVALUATION
+
+        total = {field: float(self[field].sum()) for field in ('time', 'coeff_time', 'evaluate_time', 'update_time')}
+        total['iterations'] = self.length
+        total['evaluate_share'] = total['evaluate_time']/total['time'] if total['time'] > 0 else 0.0
+        return total
+
+    def to_csv(self, path):
+
+        # WRITES THE TABLE TO A CSV FILE WITH A HEADER LINE
+
+        fmt = ['%d' if field in INTEGER_FIELDS else '%.9g' for field in FIELDS]
+        np.savetxt(path, self.data[:self.length], fmt=fmt, delimiter=',', header=','.join(FIELDS), comments='')
+
+    def to_jsonl(self, path):
+
+        # WRITES THE TABLE TO A JSON LINES FILE (ONE OBJECT PER ITERATION)
+
+        with open(path, 'w') as f:
+            for i in range(self.length):
+                row = {field: None if value != value else value for field, value in self.row(i).items()} # NAN IS NOT JSON
+                f.write(json.dumps(row) + '\n')
+
+######################################## END OF METRICS CLASS ########################################
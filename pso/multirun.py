@@ -0,0 +1,236 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+from pso import schedule
+
+###########################  MULTI RUN PSO CLASS  ##############################
+
+class MultiPSO:
+
+    def __init__(self, fitness, R=10, P=30, n=2, w=0.72984, c1=2.8, c2=2.05, Tmax=300, vmax=1, X0=None, bound=None,
+                update_w=False, update_c1=False, update_c2=False, update_vmax=False, min=True, verbose=False, batch=None, seed=None):
+
+        '''
+
+        RUNS 'R' INDEPENDENT SWARMS AT ONCE. THE SWARMS ARE STACKED INTO (R,P,n) ARRAYS AND ALL OF THEM ARE
+
+        MOVED WITH ONE VECTORIZED STEP PER ITERATION, WHICH REPLACES 'R' SEPARATE 'PSO(...).execute()' CALLS
+
+        (E.G. FOR A SWEEP OVER THE COEFFICIENTS OR OVER RANDOM STARTS)
+
+        PARAMETERS (SAME MEANING AS IN THE PSO CLASS):
+
+        fitness: FITNESS FUNCTION. IF BATCHED (SEE 'batch_fitness' IN 'fitness.py'), ALL THE R*P PARTICLES ARE
+
+        EVALUATED WITH ONE CALL PER ITERATION, OTHERWISE ONE CALL PER PARTICLE
+
+        R: NUMBER OF RUNS
+
+        w, c1, c2, vmax: EITHER ONE VALUE FOR ALL THE RUNS OR A SEQUENCE OF 'R' VALUES (ONE PER RUN)
+
+        update_w, update_c1, update_c2, update_vmax: EITHER ONE BOOL VALUE FOR ALL THE RUNS OR A SEQUENCE OF 'R'
+
+        BOOL VALUES. A RUN WITH THE FLAG SET FOLLOWS THE SAME SCHEDULE AS 'PSO.update_coeff'
+
+        P, n, Tmax, X0, bound, min, verbose, batch: SHARED BY ALL THE RUNS
+
+        seed: SEED OF THE RUNS (AN INT OR A 'numpy.random.SeedSequence', NONE FOR FRESH ENTROPY). EACH RUN 'k' DRAWS FROM
+
+        ITS OWN 'numpy.random.Generator' rngs[k], SEEDED WITH THE k-TH STREAM SPAWNED FROM 'numpy.random.SeedSequence(seed)',
+
+        SO A RUN CAN BE REPRODUCED ON ITS OWN: RUN 'k' IS THE SAME AS A PSO WITH seed=SeedSequence(seed).spawn(R)[k],
+
+        vectorize=True AND batch=True (WITH THE SAME COEFFICIENTS)
+
+        RESULTS:
+
+        gbest: GLOBAL BEST POSITION OF EACH RUN OF SHAPE (R,n)
+
+        gbest_fitness: FITNESS (OR COST) VALUE OF EACH 'gbest' OF SHAPE (R,)
+
+        fitness_time: GLOBAL FITNESS OF EACH RUN AT EACH ITERATION OF SHAPE (R,Tmax+1)
+
+        time: LIST STORING ITERATION NUMBER ([0,1,2,...])
+
+        evaluations: TOTAL NUMBER OF FITNESS EVALUATIONS (OVER ALL THE RUNS)
+
+        '''
+
+        self.fitness = fitness
+        self.R, self.P, self.n = R, P, n
+        self.Tmax = Tmax
+        self.X = X0
+        self.bound = bound
+        self.sign = 1.0 if min else -1.0
+        self.verbose = verbose
+        self.batch = getattr(fitness, 'batch', False) if batch is None else batch
+
+        # PER RUN COEFFICIENTS AND SCHEDULE FLAGS OF SHAPE (R,)
+
+        self.w0, self.c10, self.c20, self.vmax0 = (np.broadcast_to(np.asarray(c, dtype='float64'), (R,)).copy() for c in (w, c1, c2, vmax))
+        self.update_w, self.update_c1, self.update_c2, self.update_vmax = (np.broadcast_to(np.asarray(u, dtype=bool), (R,)).copy()
+                                                                            for u in (update_w, update_c1, update_c2, update_vmax))
+        self.w, self.c1, self.c2, self.vmax = self.w0.copy(), self.c10.copy(), self.c20.copy(), self.vmax0.copy()
+        self.evaluations = 0
+        self.seed = seed
+        seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.rngs = [np.random.default_rng(s) for s in seed.spawn(R)]
+
+    def initialize(self):
+
+        '''
+
+        ACTION:
+
+        ALLOCATES THE (R,P,n) ARRAYS AND WORK BUFFERS, INITIALIZES POSITIONS AND VELOCITIES (EXACTLY AS IN
+
+        THE 'Particle' CLASS, PARTICLE BY PARTICLE FROM THE GENERATOR OF EACH RUN AND WITH ITS 'vmax'), EVALUATES
+
+        THEM AND SETS 'pbest' AND 'gbest'
+
+        '''
+
+        R, P, n = self.R, self.P, self.n
+        self.position = np.empty((R,P,n))
+        self.velocity = np.empty((R,P,n))
+        for k, rng in enumerate(self.rngs):
+            for i in range(P):
+                if self.X is None:
+                    self.position[k,i] = 2*rng.random(n) - 1
+                else:
+                    self.position[k,i] = np.array(self.X, dtype='float64').reshape(-1)
+                self.velocity[k,i] = 2*self.vmax[k]*rng.random(n) - self.vmax[k]
+        if self.bound is None:
+            self.lower = self.upper = None
+        else:
+            self.lower = np.array([b[0] for b in self.bound], dtype='float64')
+            self.upper = np.array([b[1] for b in self.bound], dtype='float64')
+        self.clip_X()
+
+        self.cost = np.zeros((R,P))
+        self.evaluate()
+        self.pbest = self.position.copy()
+        self.pbest_cost = self.cost.copy()
+        best = np.argmin(self.cost, axis=1)
+        self.gbest = self.position[np.arange(R),best].copy()
+        self.gbest_cost = self.cost[np.arange(R),best].copy()
+
+        self.tmp = np.zeros((R,P,n))
+        self.r = np.zeros((R,P,2))
+        self.a1 = np.zeros((R,P,1))
+        self.a2 = np.zeros((R,P,1))
+        self.improved = np.zeros((R,P), dtype=bool)
+        self.best = np.zeros(R, dtype=np.intp)
+        self.rows = np.arange(R)
+        self.fitness_time = np.zeros((R,self.Tmax+1))
+        self.time = []
+
+    def clip_X(self):
+
+        # IF BOUND IS SPECIFIED THEN CLIP THE POSITIONS OF ALL THE RUNS SO THAT THEY ARE IN THE SPECIFIED RANGE
+
+        if self.lower is not None:
+            np.clip(self.position, self.lower, self.upper, out=self.position)
+
+    def evaluate(self):
+
+        # EVALUATES ALL THE R*P PARTICLES AND STORES THEIR COST (FITNESS, NEGATED FOR MAXIMIZATION) IN 'cost'
+
+        X = self.position.reshape(-1,self.n)
+        if self.batch:
+            F = np.asarray(self.fitness(X), dtype='float64')
+        else:
+            F = np.array([self.fitness(x.reshape(-1,1)) for x in X], dtype='float64')
+        np.multiply(F.reshape(self.R,self.P), self.sign, out=self.cost)
+        self.evaluations += X.shape[0]
+
+    def update_coeff(self):
+
+        # SAME SCHEDULES AS 'PSO.update_coeff', APPLIED ONLY TO THE RUNS WHOSE FLAG IS SET
+
+        w, c1, c2, vmax = schedule(self.t, self.Tmax)
+        np.copyto(self.w, w, where=self.update_w)
+        np.copyto(self.c1, c1, where=self.update_c1)
+        np.copyto(self.c2, c2, where=self.update_c2)
+        np.copyto(self.vmax, vmax, where=self.update_vmax)
+
+    def step(self):
+
+        '''
+
+        ACTION:
+
+        ONE ITERATION OF ALL THE RUNS: VELOCITY AND POSITION UPDATE WITH THE COEFFICIENTS OF EACH RUN,
+
+        CLIPPING, EVALUATION AND 'pbest'/'gbest' UPDATE (ONCE PER ITERATION), ALL AS WHOLE ARRAY OPERATIONS
+
+        '''
+
+        X, V, tmp = self.position, self.velocity, self.tmp
+        r = self.r
+        for k, rng in enumerate(self.rngs):
+            rng.random(out=r[k])
+        np.multiply(self.c1[:,None,None], r[:,:,:1], out=self.a1)
+        np.multiply(self.c2[:,None,None], r[:,:,1:], out=self.a2)
+        np.multiply(self.w[:,None,None], V, out=V) # PARTICLE'S PREVIOUS MOTION
+        np.subtract(self.pbest, X, out=tmp)
+        np.multiply(self.a1, tmp, out=tmp)
+        np.add(V, tmp, out=V) # COGNITIVE VELOCITY
+        np.subtract(self.gbest[:,None,:], X, out=tmp)
+        np.multiply(self.a2, tmp, out=tmp)
+        np.add(V, tmp, out=V) # SOCIAL VELOCITY
+        vmax = self.vmax[:,None,None]
+        np.clip(V, -vmax, vmax, out=V)
+        np.add(X, V, out=X)
+        self.clip_X()
+
+        self.evaluate()
+        np.less(self.cost, self.pbest_cost, out=self.improved)
+        np.copyto(self.pbest, X, where=self.improved[:,:,None])
+        np.copyto(self.pbest_cost, self.cost, where=self.improved)
+        np.argmin(self.cost, axis=1, out=self.best)
+        cost = self.cost[self.rows,self.best]
+        better = cost < self.gbest_cost
+        self.gbest[better] = X[self.rows[better],self.best[better]]
+        self.gbest_cost[better] = cost[better]
+
+    def move(self):
+
+        # RUNS ITERATIONS 0, 1, ..., Tmax OF ALL THE RUNS AND RECORDS THE GLOBAL FITNESS OF EACH RUN
+
+        self.t = 0
+        while self.t <= self.Tmax:
+            self.update_coeff()
+            self.step()
+            self.fitness_time[:,self.t] = self.gbest_fitness
+            self.time.append(self.t)
+            if self.verbose:
+                print('Iteration:  ',self.t,'| best global fitness (cost):',np.round(self.gbest_fitness,7).tolist())
+            self.t += 1
+
+    @property
+    def gbest_fitness(self):
+
+        # FITNESS (OR COST) VALUE OF 'gbest' OF EACH RUN
+
+        return self.sign*self.gbest_cost
+
+    def execute(self):
+
+        # A KIND OF MAIN FUNCTION, PRINTS THE FINAL SOLUTION OF EACH RUN
+
+        self.initialize()
+        self.move()
+        for i in range(self.R):
+            print('RUN', i, '| OPTIMUM SOLUTION >', np.round(self.gbest[i],7).tolist(), '| OPTIMUM FITNESS >', np.round(self.gbest_fitness[i],7))
+
+######################################## END OF MULTI RUN PSO CLASS ########################################
@@ -0,0 +1,296 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+#######################   WORKER SIDE   ########################################
+
+# FITNESS FUNCTION OF A WORKER PROCESS, SET ONCE BY 'init_worker' WHEN THE PROCESS STARTS
+
+_fitness, _batch = None, False
+
+def init_worker(fitness, batch):
+
+    # RECEIVES (UNPICKLES) THE FITNESS FUNCTION ONCE PER WORKER INSTEAD OF ONCE PER TASK
+
+    global _fitness, _batch
+    _fitness, _batch = fitness, batch
+
+def evaluate_rows(fitness, batch, X):
+
+    '''
+
+    PARAMETERS:
+
+    fitness: FITNESS FUNCTION
+
+    batch: BOOL VALUE (TRUE IF 'fitness' IS BATCHED)
+
+    X: CHUNK OF POSITIONS OF SHAPE (k,n)
+
+    ACTION:
+
+    RETURNS THE FITNESS VALUES OF THE ROWS OF 'X' AS A VECTOR OF SHAPE (k,)
+
+    '''
+
+    if batch:
+        return np.asarray(fitness(X), dtype='float64')
+    return np.array([fitness(x.reshape(-1,1)) for x in X], dtype='float64')
+
+def evaluate_chunk(X):
+
+    # TASK RUN BY A WORKER OF THE POOL CREATED BY 'Evaluator'
+
+    return evaluate_rows(_fitness, _batch, X)
+
+def timed_rows(fitness, batch, X):
+
+    # SAME AS 'evaluate_rows' BUT ALSO RETURNS THE TIME (IN SECONDS) THE WORKER WAS BUSY
+
+    start = time.perf_counter()
+    F = evaluate_rows(fitness, batch, X)
+    return F, time.perf_counter() - start
+
+def timed_chunk(X):
+
+    # SAME AS 'evaluate_chunk' BUT ALSO RETURNS THE TIME (IN SECONDS) THE WORKER WAS BUSY
+
+    return timed_rows(_fitness, _batch, X)
+
+###########################  EVALUATOR CLASS  ##################################
+
+class Evaluator:
+
+    def __init__(self, fitness, batch=False, workers=None, executor=None, chunksize=None):
+
+        '''
+
+        EVALUATES THE POSITIONS OF A SWARM ON A 'concurrent.futures' POOL
+
+        PARAMETERS:
+
+        fitness: FITNESS FUNCTION (MUST BE PICKLABLE, E.G. DEFINED AT MODULE LEVEL)
+
+        batch: BOOL VALUE (TRUE IF 'fitness' IS BATCHED)
+
+        workers: NUMBER OF WORKER PROCESSES. A PROCESS POOL IS CREATED ON FIRST USE AND EACH WORKER
+
+        RECEIVES 'fitness' ONLY ONCE, WHEN IT STARTS. WITH AN 'executor', ITS NUMBER OF WORKERS (REQUIRED, IT SETS
+
+        THE DEFAULT 'chunksize', THE TASKS IN FLIGHT OF THE ASYNCHRONOUS MODE AND ITS UTILIZATION)
+
+        executor: AN EXISTING 'concurrent.futures' EXECUTOR TO USE INSTEAD OF CREATING ONE. SINCE ITS
+
+        WORKERS ARE ALREADY RUNNING, 'fitness' IS SENT ALONG WITH EVERY CHUNK
+
+        chunksize: NUMBER OF PARTICLES PER TASK (DEFAULT: ENOUGH FOR ABOUT 4 TASKS PER WORKER)
+
+        THE RESULTS ARE ALWAYS RETURNED IN PARTICLE ORDER, WHATEVER THE ORDER IN WHICH THE TASKS FINISH,
+
+        SO A RUN DOES NOT DEPEND ON THE NUMBER OF WORKERS
+
+        '''
+
+        self.fitness = fitness
+        self.batch = batch
+        self.executor = executor
+        self.own = executor is None
+        if executor is not None and workers is None:
+            raise ValueError("pass the number of workers of the 'executor' as 'workers'")
+        self.workers = workers
+        self.chunksize = chunksize
+
+    def pool(self):
+
+        # CREATE THE PROCESS POOL ON FIRST USE
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                                initargs=(self.fitness, self.batch))
+        return self.executor
+
+    def __call__(self, X):
+
+        '''
+
+        PARAMETERS:
+
+        X: POSITIONS OF SHAPE (P,n)
+
+        ACTION:
+
+        SPLITS 'X' INTO CHUNKS OF 'chunksize' ROWS, EVALUATES THEM ON THE POOL AND RETURNS THE
+
+        FITNESS VALUES OF SHAPE (P,) IN ROW ORDER
+
+        '''
+
+        chunksize = self.chunksize or max(1, -(-len(X)//(4*self.workers)))
+        chunks = [X[i:i+chunksize] for i in range(0, len(X), chunksize)]
+        if self.own:
+            results = self.pool().map(evaluate_chunk, chunks)
+        else:
+            results = self.pool().map(evaluate_rows, [self.fitness]*len(chunks), [self.batch]*len(chunks), chunks)
+        return np.concatenate(list(results))
+
+    def submit(self, X):
+
+        '''
+
+        PARAMETERS:
+
+        X: POSITIONS OF SHAPE (k,n)
+
+        ACTION:
+
+        SUBMITS 'X' AS A SINGLE TASK AND RETURNS ITS FUTURE, WHOSE RESULT IS THE TUPLE (F, busy) WHERE
+
+        'F' ARE THE FITNESS VALUES OF SHAPE (k,) AND 'busy' IS THE TIME THE WORKER SPENT ON THE TASK
+
+        '''
+
+        if self.own:
+            return self.pool().submit(timed_chunk, X)
+        return self.pool().submit(timed_rows, self.fitness, self.batch, X)
+
+    def close(self):
+
+        # SHUT DOWN THE POOL IF IT WAS CREATED HERE (AN EXECUTOR GIVEN BY THE USER IS LEFT RUNNING)
+
+        if self.own and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+######################################## END OF EVALUATOR CLASS ########################################
+
+###########################  ASYNC EVALUATOR CLASS  ############################
+
+class AsyncEvaluator:
+
+    def __init__(self, fitness, batch=False, concurrency=None, timeout=None, penalty=np.inf):
+
+        '''
+
+        EVALUATES THE POSITIONS OF A SWARM WITH AN 'async def' FITNESS FUNCTION (E.G. ONE WHICH CALLS A MODEL SERVER
+
+        OVER THE NETWORK), CONCURRENTLY ON AN 'asyncio' EVENT LOOP INSTEAD OF ONE CALL AFTER THE OTHER
+
+        PARAMETERS:
+
+        fitness: COROUTINE FUNCTION TAKING A POSITION OF SHAPE (n,1) (OR A (k,n) BATCH IF 'batch') AND RETURNING ITS FITNESS.
+
+        CONNECTIONS ARE LEFT TO IT (E.G. A CLIENT SESSION CREATED ONCE AND REUSED BY EVERY CALL)
+
+        batch: BOOL VALUE (TRUE IF 'fitness' IS BATCHED, THEN IT IS AWAITED ONCE PER SWARM)
+
+        concurrency: MAXIMUM NUMBER OF CALLS IN FLIGHT AT THE SAME TIME (NONE FOR NO LIMIT)
+
+        timeout: MAXIMUM DURATION OF A CALL IN SECONDS (NONE FOR NO LIMIT). A CALL WHICH TAKES LONGER IS CANCELLED
+
+        AND ITS POSITION GETS THE FITNESS VALUE 'penalty'
+
+        penalty: FITNESS VALUE OF A POSITION WHOSE CALL TIMED OUT
+
+        timeouts: NUMBER OF CALLS WHICH TIMED OUT SO FAR
+
+        'evaluate' IS A COROUTINE FOR CALLERS ALREADY RUNNING ON AN EVENT LOOP ('PSO.run'). CALLING THE EVALUATOR
+
+        RUNS 'evaluate' ON A PRIVATE EVENT LOOP, CREATED ON FIRST USE AND KEPT UNTIL 'close', SO THAT THE OBJECTIVE
+
+        CAN KEEP ITS CONNECTIONS OPEN FROM ONE ITERATION TO THE NEXT
+
+        '''
+
+        self.fitness = fitness
+        self.batch = batch
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.penalty = penalty
+        self.workers = concurrency or 1
+        self.timeouts = 0
+        self.loop = None
+
+    async def call(self, X, semaphore):
+
+        # ONE CALL OF THE FITNESS FUNCTION, WITHIN THE CONCURRENCY LIMIT AND THE TIMEOUT
+
+        import asyncio
+        if semaphore is None:
+            return await asyncio.wait_for(self.fitness(X), self.timeout)
+        async with semaphore:
+            return await asyncio.wait_for(self.fitness(X), self.timeout)
+
+    async def evaluate(self, X):
+
+        '''
+
+        PARAMETERS:
+
+        X: POSITIONS OF SHAPE (P,n)
+
+        ACTION:
+
+        AWAITS THE FITNESS VALUES OF ALL THE ROWS OF 'X' (ALL THE CALLS RUN CONCURRENTLY) AND RETURNS THEM AS A
+
+        VECTOR OF SHAPE (P,) IN ROW ORDER
+
+        '''
+
+        import asyncio
+        semaphore = asyncio.Semaphore(self.concurrency) if self.concurrency else None
+        if self.batch:
+            try:
+                return np.asarray(await self.call(X, semaphore), dtype='float64')
+            except asyncio.TimeoutError:
+                self.timeouts += len(X)
+                return np.full(len(X), self.penalty)
+        results = await asyncio.gather(*[self.call(x.reshape(-1,1), semaphore) for x in X], return_exceptions=True)
+        F = np.empty(len(X))
+        for i, result in enumerate(results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.timeouts += 1
+                F[i] = self.penalty
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                F[i] = result
+        return F
+
+    def __call__(self, X):
+
+        # SYNCHRONOUS VERSION OF 'evaluate' (USED BY 'move'), RUN ON THE PRIVATE EVENT LOOP. IT CANNOT BE CALLED FROM
+
+        # A RUNNING EVENT LOOP (E.G. IN JUPYTER), WHICH WOULD BE BLOCKED: THE OPTIMIZER MUST BE AWAITED THERE INSTEAD
+
+        import asyncio
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("an 'async def' fitness cannot be evaluated synchronously inside a running event loop, "
+                               "use 'await optimizer.run()' instead of 'execute'")
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        return self.loop.run_until_complete(self.evaluate(X))
+
+    def close(self):
+
+        # CLOSE THE PRIVATE EVENT LOOP (IF IT WAS CREATED)
+
+        if self.loop is not None:
+            self.loop.close()
+            self.loop = None
+
+######################################## END OF ASYNC EVALUATOR CLASS ########################################
@@ -9,14 +9,26 @@
 
 #######################   IMPORT DEPENDENCIES   ################################
 
+import os
+import time
+import inspect
 import numpy as np
-import matplotlib.pyplot as plt
+from concurrent.futures import wait, FIRST_COMPLETED
+from swarm import Swarm
+from parallel import Evaluator, AsyncEvaluator
+from topology import Topology, TOPOLOGIES
+from cache import FitnessCache
+from metrics import Metrics
+from surrogate import Surrogate
+from kernel import Kernel
+from recorder import Recorder
+import checkpoint
 
 ###########################  PARTICLE CLASS  ###################################
 
 class Particle:
 
-    def __init__(self, n=2, vmax=1, X0=None, bound=None):
+    def __init__(self, n=2, vmax=1, X0=None, bound=None, rng=None):
 
         '''
 
@@ -38,18 +50,27 @@ class Particle:
 
         ##############################################
 
+        rng: 'numpy.random.Generator' DRAWING THE RANDOM NUMBERS OF THE PARTICLE (USUALLY THE ONE OF THE PSO CLASS,
+
+        A NEW UNSEEDED ONE IF NONE)
+
         X: PARTICLE POSITION OF SHAPE (n,1)
 
         V: PARTICLE VELOCITY OF SHAPE (n,1)
 
         pbest: PARTICLE'S OWN BEST POSITION OF SHAPE (n,1)
+
+        fitness: FITNESS (OR COST) VALUE OF THE CURRENT POSITION 'X' (SET BY THE PSO CLASS)
+
+        pbest_fitness: FITNESS (OR COST) VALUE OF 'pbest' (SET BY THE PSO CLASS)
         
         '''
 
         # IF INITIAL POSITION 'X0' IS NOT SPECIFIED THEN DO RANDOM INITIALIZATION OF 'X'
 
+        self.rng = np.random.default_rng() if rng is None else rng
         if X0 is None:
-            self.X = 2*np.random.rand(n,1) - 1
+            self.X = 2*self.rng.random((n,1)) - 1
         else:
             self.X = np.array(X0, dtype='float64').reshape(-1,1)
         self.bound = bound
@@ -58,20 +79,25 @@ class Particle:
         
         '''
 
-        np.random.rand() ∈ (0,1)
+        rng.random() ∈ (0,1)
         
-        THEREFORE 2*vmax*np.random.rand() ∈ (0,2*vmax)
+        THEREFORE 2*vmax*rng.random() ∈ (0,2*vmax)
         
-        THUS, V = 2*vmax*np.random.rand() - vmax ∈ (-vmax,vmax)
+        THUS, V = 2*vmax*rng.random() - vmax ∈ (-vmax,vmax)
         
         '''
 
-        self.V = 2*vmax*np.random.rand(n,1) - vmax
+        self.V = 2*vmax*self.rng.random((n,1)) - vmax
         self.clip_X()
 
         # INITIALIZE 'pbest' WITH A COPY OF 'X' 
 
         self.pbest = self.X.copy()
+
+        # FITNESS VALUES ARE CACHED HERE SO THAT EVERY POSITION IS EVALUATED ONLY ONCE
+
+        self.fitness = None
+        self.pbest_fitness = None
         
     def clip_X(self):
 
@@ -82,7 +108,7 @@ class Particle:
                 xmin, xmax = self.bound[i]
                 self.X[i,0] = np.clip(self.X[i,0], xmin, xmax)
     
-    def update_velocity(self, w, c1, c2, gbest):
+    def update_velocity(self, w, c1, c2, gbest, vmax=None, r1=None, r2=None):
 
         '''
 
@@ -96,16 +122,26 @@ class Particle:
 
         gbest: GLOBAL BEST POSITION (BEST POSITION IN GROUP) OF SHAPE (n,1)
 
+        vmax: CURRENT MAXIMUM LIMITED VELOCITY (IF NONE, THE 'vmax' GIVEN AT INITIALIZATION IS KEPT)
+
+        r1, r2: RANDOM COEFFICIENTS IN (0,1) OF THE COGNITIVE AND SOCIAL TERMS (THE PSO CLASS DRAWS THEM FOR THE WHOLE
+
+        SWARM AT ONCE). IF NONE, THEY ARE DRAWN HERE FROM 'rng'
+
         ACTION:
 
         UPDATE THE PARTICLE'S VELOCITY
         
         '''
 
+        if vmax is not None:
+            self.vmax = vmax
+        if r1 is None:
+            r1, r2 = self.rng.random(2)
         self.clip_X()
         self.V = w*self.V # PARTICLE'S PREVIOUS MOTION 
-        self.V += c1*np.random.rand()*(self.pbest - self.X) # COGNITIVE VELOCITY 
-        self.V += c2*np.random.rand()*(gbest - self.X) # SOCIAL VELOCITY
+        self.V += c1*r1*(self.pbest - self.X) # COGNITIVE VELOCITY 
+        self.V += c2*r2*(gbest - self.X) # SOCIAL VELOCITY
         self.V = np.clip(self.V, -self.vmax, self.vmax) 
     
     def update_position(self):
@@ -121,12 +157,39 @@ class Particle:
         self.X += self.V 
         self.clip_X()
 
+########################  COEFFICIENT SCHEDULES  ##############################
+
+def schedule(t, Tmax):
+
+    '''
+
+    PARAMETERS:
+
+    t: ITERATION NUMBER
+
+    Tmax: MAXIMUM ITERATION
+
+    ACTION:
+
+    RETURNS THE SCHEDULED VALUES (w, c1, c2, vmax) AT ITERATION 't' (SEE 'PSO.update_coeff' FOR THE REFERENCES).
+
+    SHARED BY EVERY ENGINE WHICH UPDATES ITS COEFFICIENTS WITH ITERATION
+
+    '''
+
+    return 0.9 - 0.5*(t/Tmax), 3.5 - 3*(t/Tmax), 0.5 + 3*(t/Tmax), 1.5*np.exp(1-((t/Tmax)))
+
 ###########################  PSO CLASS  ####################################
 
 class PSO:
 
     def __init__(self, fitness, P=30, n=2, w=0.72984, c1=2.8, c2=2.05, Tmax=300, vmax=1, X0=None, bound=None,
-                update_w=False, update_c1=False, update_c2=False, update_vmax=False, plot=False, min=True, verbose=False):
+                update_w=False, update_c1=False, update_c2=False, update_vmax=False, plot=False, min=True, verbose=False,
+                vectorize=False, batch=None, workers=None, executor=None, chunksize=None, asynchronous=False,
+                max_evaluations=None, tol=None, window=20, diameter=None, target=None, max_time=None, topology='global',
+                k=3, rewire=None, cache=None, checkpoint=None, checkpoint_every=100, seed=None,
+                metrics=None, surrogate=None, concurrency=None, timeout=None, penalty=None, kernel=None,
+                recorder=None):
 
         '''
 
@@ -134,7 +197,11 @@ class PSO:
 
         PARAMETERS:
 
-        fitness: A FUNCTION WHICH EVALUATES COST (OR THE FITNESS) VALUE
+        fitness: A FUNCTION WHICH EVALUATES COST (OR THE FITNESS) VALUE OF A POSITION OF SHAPE (n,1), OR A BATCHED FUNCTION
+
+        WHICH EVALUATES A MATRIX OF POSITIONS OF SHAPE (P,n) AND RETURNS A VECTOR OF SHAPE (P,) (SEE 'batch'). IT CAN ALSO BE
+
+        AN 'async def' FUNCTION (SEE 'concurrency' AND 'run')
 
         P: POPULATION SIZE
 
@@ -170,11 +237,141 @@ class PSO:
 
         ##############################################
 
-        plot: BOOL VALUE (TRUE IF PLOT BETWEEN GLOBAL FITNESS (OR COST) VALUE VS ITERATION IS NEEDED ELSE FALSE)
+        plot: BOOL VALUE (TRUE IF PLOT BETWEEN GLOBAL FITNESS (OR COST) VALUE VS ITERATION IS NEEDED ELSE FALSE), OR A
+
+        FILE NAME (E.G. 'fitness.png') TO SAVE THE PLOT TO INSTEAD OF SHOWING IT (WORKS WITHOUT A DISPLAY)
 
         min: BOOL VALUE (TRUE FOR 'MINIMIZATION PROBLEM' AND FALSE FOR 'MAXIMIZATION PROBLEM')
 
         verbose: BOOL VALUE (TRUE IF PRINTING IS REQUIRED TO SHOW GLOBAL FITNESS VALUE FOR EACH ITERATION ELSE FALSE)
+
+        vectorize: BOOL VALUE (TRUE TO STORE THE SWARM AS (P,n) ARRAYS IN A 'Swarm' OBJECT AND MOVE ALL THE PARTICLES
+
+        WITH WHOLE ARRAY OPERATIONS, FALSE TO USE A LIST OF 'Particle' OBJECTS). BOTH PRODUCE THE SAME TRAJECTORIES
+
+        FOR THE SAME RANDOM STREAM WHEN THE FITNESS IS NOT BATCHED (THE FOUR EXAMPLE FUNCTIONS OF 'fitness.py' ARE NOT)
+
+        batch: BOOL VALUE (TRUE IF 'fitness' IS BATCHED, FALSE IF IT TAKES ONE POSITION). IF NONE, IT IS DETECTED FROM THE
+
+        'batch' ATTRIBUTE SET BY THE 'batch_fitness' DECORATOR OF 'fitness.py'. WITH 'vectorize' TRUE, A BATCHED FITNESS
+
+        EVALUATES THE WHOLE SWARM IN ONE CALL PER ITERATION AND 'gbest' IS UPDATED ONCE PER ITERATION
+
+        workers: NUMBER OF WORKER PROCESSES EVALUATING THE SWARM IN PARALLEL (NONE FOR SERIAL EVALUATION). THE FITNESS
+
+        FUNCTION MUST BE PICKLABLE AND IS SENT ONCE TO EACH WORKER. IMPLIES 'vectorize' AND 'gbest' IS UPDATED ONCE
+
+        PER ITERATION. CALL 'close' (OR USE 'execute') TO SHUT THE WORKERS DOWN
+
+        executor: AN EXISTING 'concurrent.futures' EXECUTOR TO EVALUATE THE SWARM ON, WITH 'workers' SET TO ITS NUMBER OF WORKERS
+
+        chunksize: NUMBER OF PARTICLES SENT TO A WORKER PER TASK (DEFAULT: ABOUT 4 TASKS PER WORKER)
+
+        asynchronous: BOOL VALUE (TRUE FOR BARRIER FREE PSO ON THE 'workers' OR 'executor' POOL). EACH PARTICLE IS SUBMITTED
+
+        ON ITS OWN AND, AS SOON AS ITS EVALUATION FINISHES, ITS 'pbest', 'gbest', VELOCITY AND POSITION ARE UPDATED AND IT IS
+
+        SUBMITTED AGAIN, WITHOUT WAITING FOR THE REST OF THE SWARM. THE RUN STOPS AFTER 'max_evaluations' EVALUATIONS AND
+
+        THE RESULT DEPENDS ON THE ORDER IN WHICH THE EVALUATIONS FINISH
+
+        max_evaluations: TOTAL EVALUATION BUDGET, INITIALIZATION INCLUDED. IT MUST COVER THE P INITIAL EVALUATIONS AND AN
+
+        ITERATION IS ONLY STARTED IF ITS P EVALUATIONS FIT IN THE REST OF THE BUDGET
+
+        (DEFAULT: NO BUDGET, EXCEPT IN THE ASYNCHRONOUS MODE WHERE IT IS P*(Tmax+2), THE COST OF A SYNCHRONOUS RUN)
+
+        STOPPING CRITERIA (NONE TO DISABLE ANY OF THEM). THE RUN STOPS AS SOON AS ONE OF THEM OR 'Tmax' IS REACHED AND
+
+        'stop_reason' TELLS WHICH ONE ('tol', 'diameter', 'target', 'max_evaluations', 'max_time' OR 'Tmax'):
+
+        tol: STOP WHEN THE GLOBAL FITNESS CHANGED BY AT MOST 'tol' OVER THE LAST 'window' ITERATIONS
+
+        window: NUMBER OF ITERATIONS OVER WHICH 'tol' IS CHECKED
+
+        diameter: STOP WHEN THE SWARM DIAMETER (DIAGONAL OF THE BOUNDING BOX OF ALL PARTICLE POSITIONS) IS AT MOST 'diameter'
+
+        target: STOP WHEN THE GLOBAL FITNESS IS AT LEAST AS GOOD AS 'target' (<= FOR MINIMIZATION AND >= FOR MAXIMIZATION)
+
+        max_time: WALL CLOCK BUDGET IN SECONDS
+
+        topology: SOCIAL MODEL OF THE SWARM. 'global' (DEFAULT) ATTRACTS EVERY PARTICLE TO 'gbest'. 'ring', 'von_neumann'
+
+        AND 'random' ATTRACT EACH PARTICLE TO THE BEST 'pbest' OF ITS NEIGHBOURHOOD INSTEAD (SEE 'topology.py'). A LOCAL
+
+        TOPOLOGY IMPLIES 'vectorize' AND THE NEIGHBOURHOOD BESTS ARE UPDATED ONCE PER ITERATION
+
+        k: NUMBER OF RANDOM NEIGHBOURS OF EACH PARTICLE ('random' TOPOLOGY)
+
+        rewire: NUMBER OF ITERATIONS BETWEEN TWO REWIRINGS OF THE 'random' TOPOLOGY (NONE TO KEEP THE FIRST ONE)
+
+        cache: 'FitnessCache' OBJECT (SEE 'cache.py') OR TRUE FOR A DEFAULT ONE. POSITIONS FOUND IN THE CACHE ARE NOT
+
+        EVALUATED AGAIN NOR COUNTED IN 'evaluations'. A CACHE WITH A 'path' IS SAVED BY 'close'. NOT USED IN THE
+
+        ASYNCHRONOUS MODE
+
+        checkpoint: DIRECTORY TO WRITE CHECKPOINTS OF THE FULL STATE OF THE RUN TO (SEE 'checkpoint.py' AND 'resume'),
+
+        NONE TO DISABLE. NOT USED IN THE ASYNCHRONOUS MODE
+
+        checkpoint_every: NUMBER OF ITERATIONS BETWEEN TWO CHECKPOINTS. THE TIME SPENT ON EACH ONE IS APPENDED TO
+
+        'checkpoint_times' (IN SECONDS) AND SUMMARIZED BY 'execute', TO HELP CHOOSING THE INTERVAL
+
+        seed: SEED OF THE RANDOM NUMBERS OF THE RUN (AN INT, A 'numpy.random.SeedSequence' OR A 'numpy.random.Generator',
+
+        NONE FOR FRESH ENTROPY). EACH PSO OBJECT OWNS ITS GENERATOR 'rng' AND NEVER TOUCHES THE GLOBAL 'np.random' STATE,
+
+        SO THE SAME SEED GIVES THE SAME RESULT WHATEVER THE NUMBER OF WORKERS OR OTHER RUNS IN THE SAME PROCESS
+
+        metrics: 'Metrics' OBJECT (SEE 'metrics.py') OR TRUE FOR A DEFAULT ONE. RECORDS THE WALL TIME OF EACH ITERATION
+
+        SPLIT BY PHASE, THE EVALUATIONS, CACHE HITS, SWARM DIVERSITY AND GLOBAL FITNESS IMPROVEMENT. EACH SNAPSHOT OF
+
+        'iterate' (AND 'tell') THEN HAS THE ROW OF THE ITERATION UNDER 'metrics'. NOT USED IN THE ASYNCHRONOUS MODE
+
+        surrogate: 'Surrogate' OBJECT (SEE 'surrogate.py') OR TRUE FOR A DEFAULT ONE. A MODEL OF THE FITNESS FUNCTION,
+
+        TRAINED ON ALL THE EVALUATED POSITIONS, PRE-SCREENS THE MOVED PARTICLES AND ONLY THE PROMISING ONES ARE SENT
+
+        TO 'fitness'. IMPLIES 'vectorize' AND 'gbest' IS UPDATED ONCE PER ITERATION. NOT USED IN THE ASYNCHRONOUS MODE
+
+        NOR WITH ASK/TELL
+
+        concurrency: WITH AN 'async def' FITNESS, MAXIMUM NUMBER OF CALLS IN FLIGHT AT THE SAME TIME (DEFAULT: P, THE WHOLE
+
+        SWARM). THE CALLS OF AN ITERATION RUN CONCURRENTLY ON AN 'asyncio' EVENT LOOP (SEE 'parallel.py'), WHICH SUITS
+
+        OBJECTIVES WAITING ON THE NETWORK (E.G. A MODEL SERVER). IMPLIES 'vectorize' AND 'gbest' IS UPDATED ONCE PER
+
+        ITERATION. 'execute' RUNS THE LOOP ITSELF, 'await run()' USES THE CALLER'S LOOP. THE FITNESS FUNCTION KEEPS ITS OWN
+
+        CONNECTIONS (E.G. ONE CLIENT SESSION SHARED BY ALL ITS CALLS), THEY ARE NOT MANAGED HERE
+
+        timeout: WITH AN 'async def' FITNESS, MAXIMUM DURATION OF A CALL IN SECONDS (NONE FOR NO LIMIT). A CALL WHICH TAKES
+
+        LONGER IS CANCELLED AND ITS POSITION GETS THE FITNESS VALUE 'penalty'
+
+        penalty: FITNESS VALUE OF A POSITION WHOSE CALL TIMED OUT (DEFAULT: THE WORST POSSIBLE VALUE, +INF FOR MINIMIZATION
+
+        AND -INF FOR MAXIMIZATION)
+
+        kernel: FUSED UPDATE OF THE SWARM (SEE 'kernel.py'): 'numba', 'numpy', 'auto' OR TRUE (NUMBA IF IT IS INSTALLED,
+
+        OTHERWISE NUMPY), OR A 'Kernel' OBJECT. EVERY PARTICLE IS MOVED (VELOCITY, CLAMP, POSITION, CLIPPING) IN ONE PASS
+
+        AND THE BESTS ARE SELECTED IN ANOTHER, WITH THE SAME RESULT AS WITHOUT IT. IMPLIES 'vectorize' AND 'gbest' IS
+
+        UPDATED ONCE PER ITERATION. NOT USED IN THE ASYNCHRONOUS MODE
+
+        recorder: 'Recorder' OBJECT (SEE 'recorder.py') OR A DIRECTORY FOR A DEFAULT ONE. STREAMS THE POSITIONS, VELOCITIES
+
+        AND FITNESS VALUES OF ALL THE PARTICLES AT EACH RECORDED ITERATION TO DISK (READ THEM BACK WITH 'Trajectory').
+
+        NOT USED IN THE ASYNCHRONOUS MODE
+
+        evaluations: TOTAL NUMBER OF FITNESS FUNCTION CALLS MADE SO FAR (P CALLS FOR INITIALIZATION AND P CALLS PER ITERATION)
         
         '''
 
@@ -194,8 +391,161 @@ class PSO:
         self.plot = plot
         self.min = min
         self.verbose = verbose
+        self.vectorize = vectorize
+        self.gbest = self.gbest_fitness = None
+        self.swarm = self.population = None
+        self.asked = None
+        self.t = 0
+        self.batch = getattr(fitness, 'batch', False) if batch is None else batch
+        self.evaluator = None
+        if workers is not None or executor is not None:
+            self.evaluator = Evaluator(fitness, batch=self.batch, workers=workers, executor=executor, chunksize=chunksize)
+            self.vectorize = True
+        if inspect.iscoroutinefunction(fitness) or inspect.iscoroutinefunction(getattr(fitness, '__call__', None)):
+            if self.evaluator is not None or asynchronous:
+                raise ValueError("an 'async def' fitness runs on an event loop, not with 'workers', 'executor' or 'asynchronous'")
+            penalty = (np.inf if min else -np.inf) if penalty is None else penalty
+            self.evaluator = AsyncEvaluator(fitness, batch=self.batch, concurrency=concurrency or P, timeout=timeout, penalty=penalty)
+            self.vectorize = True
+        self.asynchronous = asynchronous
+        self.max_evaluations = max_evaluations
+        self.tol, self.window = tol, window
+        self.diameter = diameter
+        self.target = target
+        self.max_time = max_time
+        self.stop_reason = None
+        if topology not in TOPOLOGIES:
+            raise ValueError('topology must be one of %s, got %r' % (', '.join(TOPOLOGIES), topology))
+        self.topology, self.k, self.rewire = topology, k, rewire
+        self.cache = FitnessCache() if cache is True else cache or None
+        self.surrogate = Surrogate() if surrogate is True else surrogate or None
+        self.kernel = None if kernel is None or kernel is False else kernel if isinstance(kernel, Kernel) else \
+                      Kernel('auto' if kernel is True else kernel)
+        if topology != 'global' or self.surrogate is not None or self.kernel is not None:
+            self.vectorize = True
+        if asynchronous and self.evaluator is None:
+            raise ValueError("asynchronous mode needs a pool, pass 'workers' or 'executor'")
+        if asynchronous and checkpoint is not None:
+            raise ValueError('checkpoints are not available in asynchronous mode')
+        self.checkpoint, self.checkpoint_every = checkpoint, checkpoint_every
+        self.checkpoint_maps = {}
+        self.checkpoint_times = []
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.r = np.zeros((P,2))
+        self.metrics = Metrics(capacity=Tmax+1) if metrics is True else None if metrics is False else metrics
+        if asynchronous and self.metrics is not None:
+            raise ValueError('metrics are not available in asynchronous mode')
+        if asynchronous and self.surrogate is not None:
+            raise ValueError('a surrogate is not available in asynchronous mode')
+        if asynchronous and self.kernel is not None:
+            raise ValueError('a fused kernel is not available in asynchronous mode')
+        self.recorder = Recorder(recorder) if isinstance(recorder, str) else recorder
+        if asynchronous and self.recorder is not None:
+            raise ValueError('a recorder is not available in asynchronous mode')
+        self.evaluations = 0
+        self.iteration_cost = P # EVALUATIONS PER ITERATION, CHECKED AGAINST 'max_evaluations'
+        if max_evaluations is not None and max_evaluations < P:
+            raise ValueError('max_evaluations (%d) must cover the %d evaluations of the initialization' % (max_evaluations, P))
+
+    def evaluate(self, X):
+
+        '''
+
+        PARAMETERS:
+
+        X: PARTICLE POSITION OF SHAPE (n,1)
+
+        ACTION:
+
+        RETURNS THE FITNESS (OR COST) VALUE OF 'X' AND COUNTS THE CALL IN 'evaluations'.
+
+        IF THERE IS A 'cache', A POSITION ALREADY EVALUATED IS RETURNED WITHOUT CALLING THE FITNESS FUNCTION
+
+        '''
+
+        if self.cache is not None:
+            key = self.cache.key(X)
+            f = self.cache.get(key)
+            if f is not None:
+                return f
+        if self.metrics is not None:
+            start = time.perf_counter()
+        if self.batch:
+            f = self.fitness(X.reshape(1,-1))[0]
+        else:
+            f = self.fitness(X)
+        self.evaluations += 1
+        if self.metrics is not None:
+            self.metrics.evaluate_time += time.perf_counter() - start
+        if self.cache is not None:
+            self.cache.put(key, f)
+        return f
+
+    def evaluate_batch(self, X):
+
+        '''
+
+        PARAMETERS:
+
+        X: POSITIONS OF SHAPE (P,n)
+
+        ACTION:
+
+        RETURNS THE FITNESS (OR COST) VALUES OF ALL THE ROWS OF 'X' AS A VECTOR OF SHAPE (P,),
+
+        ON THE WORKER POOL IF THERE IS ONE, OTHERWISE WITH A SINGLE CALL IF 'fitness' IS BATCHED
+
+        AND ONE CALL PER ROW IF IT IS NOT. IF THERE IS A 'cache', ONLY THE DISTINCT POSITIONS WHICH
+
+        ARE NOT CACHED ARE SENT TO THE FITNESS FUNCTION
+
+        '''
+
+        if self.evaluator is None and not self.batch:
+            return np.array([self.evaluate(x.reshape(-1,1)) for x in X])
+        if self.cache is None:
+            return self.call_fitness(X)
+        F = np.empty(len(X))
+        missing = {}
+        for i, x in enumerate(X):
+            key = self.cache.key(x)
+            if key in missing:
+                missing[key].append(i)
+                self.cache.hits += 1
+                continue
+            f = self.cache.get(key)
+            if f is None:
+                missing[key] = [i]
+            else:
+                F[i] = f
+        if missing:
+            values = self.call_fitness(X[[rows[0] for rows in missing.values()]])
+            for (key, rows), f in zip(missing.items(), values):
+                F[rows] = f
+                self.cache.put(key, f)
+        return F
+
+    def call_fitness(self, X):
+
+        # EVALUATES ALL THE ROWS OF 'X' WITH THE BATCHED FITNESS FUNCTION OR ON THE WORKER POOL (NO CACHE). THE CALLS ARE
+
+        # ONLY COUNTED ONCE THEY HAVE SUCCEEDED
+
+        if self.metrics is not None:
+            start = time.perf_counter()
+        if self.evaluator is not None:
+            F = self.evaluator(X)
+        else:
+            F = np.asarray(self.fitness(X), dtype='float64')
+        self.evaluations += len(X)
+        if self.metrics is not None:
+            self.metrics.evaluate_time += time.perf_counter() - start
+        if F.shape != (len(X),):
+            raise ValueError('batched fitness must return shape (%d,), got %s' % (len(X), F.shape))
+        return F
         
-    def optimum(self, best, particle_x):
+    def optimum(self, best, best_fitness, particle_x, particle_fitness):
 
         '''
 
@@ -203,8 +553,12 @@ class PSO:
 
         best: EITHER LOCAL BEST SOLUTION 'pbest' OR GLOBAL BEST SOLUTION 'gbest'
 
+        best_fitness: CACHED FITNESS VALUE OF 'best'
+
         particle_x: PARTICLE POSITION
 
+        particle_fitness: CACHED FITNESS VALUE OF 'particle_x'
+
         ACTION:
 
         COMPARE PARTICLE'S CURRENT POSITION EITHER WITH LOCAL BEST OR GLOBAL BEST POSITIONS
@@ -220,16 +574,20 @@ class PSO:
             IS GREATER THAN THE FITNESS VALUE OF 'particle_x' AND IF IT IS LESS, THEN IT
 
             SUBSTITUTES THE CURRENT PARTICLE POSITION AS THE BEST (GLOBAL OR LOCAL) SOLUTION
+
+        NO FITNESS FUNCTION IS CALLED HERE, ONLY THE CACHED VALUES ARE COMPARED. RETURNS
+
+        THE (POSSIBLY SUBSTITUTED) BEST SOLUTION ALONG WITH ITS FITNESS VALUE
         
         '''
         
         if self.min:
-            if self.fitness(best) > self.fitness(particle_x):
-                best = particle_x.copy()
+            if best_fitness > particle_fitness:
+                best, best_fitness = particle_x.copy(), particle_fitness
         else:
-            if self.fitness(best) < self.fitness(particle_x):
-                best = particle_x.copy()
-        return best
+            if best_fitness < particle_fitness:
+                best, best_fitness = particle_x.copy(), particle_fitness
+        return best, best_fitness
 
     def initialize(self):
 
@@ -239,7 +597,11 @@ class PSO:
 
         population: A LIST OF SIZE (P,) WHICH STORES ALL THE SWARM PARTICLE OBJECT
 
+        swarm: 'Swarm' OBJECT STORING ALL THE PARTICLES AS ARRAYS (USED INSTEAD OF 'population' WHEN 'vectorize' IS TRUE)
+
         gbest: GLOBAL BEST POSITION (BEST POSITION IN GROUP) OF SHAPE (n,1)
+
+        gbest_fitness: FITNESS (OR COST) VALUE OF 'gbest'
         
         ACTION:
 
@@ -248,16 +610,52 @@ class PSO:
             1. IT INITIALIZE POSITION 'X' AND VELOCITY 'V' OF PARTICLE 'i' AND STORES IT IN 'population' LIST
 
             2. INITIALIZE 'gbest' WITH COPY OF 'ith' PARTICLE'S POSITION 'X' HAVING BEST FITNESS
+
+        AND RESETS THE ITERATION NUMBER AND THE HISTORY. IF AN EVALUATION FAILS, THE HALF BUILT SWARM IS DROPPED
+
+        ('gbest' IS NONE AGAIN) AND THE ERROR IS RAISED
         
         '''
-        
-        self.population = []
-        for i in range(self.P):
-            self.population.append(Particle(n=self.n, vmax=self.vmax, X0=self.X, bound=self.bound))
-            if i==0:
-                self.gbest = self.population[0].X.copy()
-            else:
-                self.gbest = self.optimum(self.gbest, self.population[i].X)
+
+        self.t = 0
+        self.fitness_time, self.time = [], []
+        self.stop_reason = None
+        try:
+            if self.vectorize:
+                self.create_swarm()
+                if not self.asynchronous:
+                    F = self.evaluate_batch(self.swarm.X)
+                    if self.surrogate is not None:
+                        self.surrogate.add(self.swarm.X.copy(), self.swarm.sign*F)
+                    self.swarm.set_best(F)
+                    self.gbest_fitness = self.swarm.gbest_fitness
+                return
+
+            self.population = []
+            for i in range(self.P):
+                particle = Particle(n=self.n, vmax=self.vmax, X0=self.X, bound=self.bound, rng=self.rng)
+                particle.fitness = particle.pbest_fitness = self.evaluate(particle.X)
+                self.population.append(particle)
+                if i==0:
+                    self.gbest, self.gbest_fitness = particle.X.copy(), particle.fitness
+                else:
+                    self.gbest, self.gbest_fitness = self.optimum(self.gbest, self.gbest_fitness, particle.X, particle.fitness)
+        except BaseException:
+            self.gbest = self.gbest_fitness = None
+            self.swarm = self.population = None
+            raise
+
+    def create_swarm(self):
+
+        # CREATE THE 'Swarm' OBJECT OF THE ARRAY ENGINE AND INITIALIZE ITS POSITIONS AND VELOCITIES (WITHOUT EVALUATING THEM)
+
+        topology = None
+        if self.topology != 'global':
+            topology = Topology(self.topology, P=self.P, k=self.k, rewire=self.rewire, rng=self.rng)
+        self.swarm = Swarm(P=self.P, n=self.n, bound=self.bound, min=self.min, topology=topology, rng=self.rng, kernel=self.kernel)
+        self.swarm.initialize(vmax=self.vmax, X0=self.X)
+        self.gbest = self.swarm.gbest.reshape(-1,1)
+        self.gbest_fitness = self.swarm.gbest_fitness
 
     def update_coeff(self):
         
@@ -286,14 +684,15 @@ class PSO:
     
         '''
 
+        w, c1, c2, vmax = schedule(self.t, self.Tmax)
         if self.update_w:
-            self.w = 0.9 - 0.5*(self.t/self.Tmax)
+            self.w = w
         if self.update_c1:
-            self.c1 = 3.5 - 3*(self.t/self.Tmax)
+            self.c1 = c1
         if self.update_c2:
-            self.c2 = 0.5 + 3*(self.t/self.Tmax)
+            self.c2 = c2
         if self.update_vmax:
-            self.vmax = 1.5*np.exp(1-((self.t/self.Tmax)))
+            self.vmax = vmax
 
     def move(self):
 
@@ -325,21 +724,424 @@ class PSO:
         FOLLOW [1] WHERE THE PSO ALGORITHM PSEUDO CODE IS PRESENT IN 'FIGURE-1'
         
         '''
-        
+
+        if self.asynchronous:
+            return self.move_async()
+        for _ in self.iterate():
+            pass
+
+    def iterate(self):
+
+        '''
+
+        ACTION:
+
+        GENERATOR VERSION OF 'move'. EACH 'next' RUNS ONE ITERATION AND YIELDS A SNAPSHOT OF THE STATE
+
+        AS A DICTIONARY WITH KEYS 't', 'gbest' (A COPY OF SHAPE (n,1)), 'gbest_fitness' AND 'evaluations'.
+
+        NOTHING IS COMPUTED UNTIL THE NEXT SNAPSHOT IS REQUESTED, SO THE RUN CAN BE STOPPED AT ANY ITERATION
+
+        BY SIMPLY NOT ASKING FOR MORE. THE SWARM IS INITIALIZED FIRST IF 'initialize' (OR 'restore') WAS NOT CALLED
+
+        EXAMPLE:
+
+            for state in PSO(fitness_1).iterate():
+                if state['gbest_fitness'] < 1e-6:
+                    break
+
+        '''
+
+        if self.asynchronous:
+            raise ValueError('iterate is not available in asynchronous mode, use move')
+        self.start_time = time.perf_counter()
+        if self.gbest is None:
+            self.initialize()
+        self.stop_reason = self.stopping_criterion()
+        metrics = self.metrics
+        while self.stop_reason is None:
+            if metrics is not None:
+                metrics.begin(self)
+            self.update_coeff()
+            if metrics is not None:
+                metrics.coeff_time = metrics.lap()
+            if self.vectorize:
+                self.step()
+            else:
+                r = self.rng.random(out=self.r)
+                for i, particle in enumerate(self.population):
+                    particle.update_velocity(self.w, self.c1, self.c2, self.gbest, self.vmax, r[i,0], r[i,1])
+                    particle.update_position()
+                    particle.fitness = self.evaluate(particle.X)
+                    particle.pbest, particle.pbest_fitness = self.optimum(particle.pbest, particle.pbest_fitness, particle.X, particle.fitness)
+                    self.gbest, self.gbest_fitness = self.optimum(self.gbest, self.gbest_fitness, particle.X, particle.fitness)
+            yield self.record()
+
+    def record(self):
+
+        # STORE THE GLOBAL FITNESS OF ITERATION 't', PRINT IT IF VERBOSE, MOVE TO THE NEXT ITERATION, CHECK THE STOPPING
+
+        # CRITERIA AND RETURN THE SNAPSHOT
+
+        self.fitness_time.append(self.gbest_fitness)
+        self.time.append(self.t)
+        if self.verbose:
+            print('Iteration:  ',self.t,'| best global fitness (cost):',round(self.gbest_fitness,7))
+        state = {'t': self.t, 'gbest': self.gbest.copy(), 'gbest_fitness': self.gbest_fitness, 'evaluations': self.evaluations}
+        if self.metrics is not None:
+            state['metrics'] = self.metrics.end(self)
+        if self.recorder is not None:
+            self.recorder.record(self)
+        self.t += 1
+        self.stop_reason = state['stop_reason'] = self.stopping_criterion()
+        if self.checkpoint is not None and self.t % self.checkpoint_every == 0:
+            self.save_checkpoint()
+        return state
+
+    def save_checkpoint(self, path=None):
+
+        # WRITES A CHECKPOINT OF THE RUN TO THE DIRECTORY 'path' (DEFAULT: 'checkpoint') AND RECORDS HOW LONG IT TOOK
+
+        path = path or self.checkpoint
+        start = time.perf_counter()
+        os.makedirs(path, exist_ok=True)
+        checkpoint.save(self, path, self.checkpoint_maps)
+        self.checkpoint_times.append(time.perf_counter() - start)
+
+    def restore(self, path):
+
+        '''
+
+        PARAMETERS:
+
+        path: CHECKPOINT DIRECTORY WRITTEN BY A RUN WITH THE SAME 'fitness', P, n, 'vectorize', 'min' AND OTHER ARGUMENTS
+
+        ACTION:
+
+        REPLACES 'initialize': RESTORES THE SWARM, 'gbest', THE HISTORY, THE COEFFICIENTS, THE EVALUATION COUNT AND THE
+
+        STATE OF 'rng' FROM THE CHECKPOINT. 'move' (OR 'iterate') THEN CONTINUES FROM THE CHECKPOINTED ITERATION
+
+        AND PRODUCES EXACTLY THE SAME RESULT AS THE RUN THAT WAS NEVER INTERRUPTED. THE CONTENT OF A 'cache' IS PART
+
+        OF THE CHECKPOINT AND REPLACES THE ONE LOADED FROM ITS 'path'
+
+        '''
+
+        checkpoint.load(self, path)
+        self.start_time = time.perf_counter()
+        self.stop_reason = None
+
+    def emigrants(self, m=1):
+
+        # RETURNS THE 'm' BEST PERSONAL BEST POSITIONS OF THE SWARM (m,n) AND THEIR FITNESS VALUES (m,) (ARRAY ENGINE)
+
+        return self.swarm.best(m)
+
+    def immigrate(self, X, F):
+
+        # REPLACES THE WORST PARTICLES OF THE SWARM BY THE POSITIONS 'X' (m,n) IF THEIR FITNESS 'F' (m,) IS BETTER (ARRAY ENGINE)
+
+        replaced = self.swarm.replace_worst(X, F)
+        self.gbest_fitness = self.swarm.gbest_fitness
+        return replaced
+
+    def stopping_criterion(self):
+
+        '''
+
+        ACTION:
+
+        RETURNS THE NAME OF THE FIRST STOPPING CRITERION WHICH IS MET BEFORE STARTING ITERATION 't'
+
+        ('target', 'tol', 'diameter', 'max_evaluations', 'max_time' OR 'Tmax') OR NONE TO CONTINUE
+
+        '''
+
+        if self.target is not None:
+            if (self.min and self.gbest_fitness <= self.target) or (not self.min and self.gbest_fitness >= self.target):
+                return 'target'
+        if self.tol is not None and len(self.fitness_time) > self.window:
+            if abs(self.fitness_time[-1] - self.fitness_time[-1-self.window]) <= self.tol:
+                return 'tol'
+        if self.diameter is not None and self.swarm_diameter() <= self.diameter:
+            return 'diameter'
+        if self.max_evaluations is not None and self.evaluations + self.iteration_cost > self.max_evaluations:
+            return 'max_evaluations'
+        if self.max_time is not None and time.perf_counter() - self.start_time >= self.max_time:
+            return 'max_time'
+        if self.t > self.Tmax:
+            return 'Tmax'
+        return None
+
+    def swarm_diameter(self):
+
+        # DIAGONAL OF THE BOUNDING BOX OF ALL THE PARTICLE POSITIONS
+
+        X = self.positions()
+        return np.linalg.norm(X.max(axis=0) - X.min(axis=0))
+
+    def positions(self):
+
+        # CURRENT POSITIONS OF ALL THE PARTICLES AS A (P,n) ARRAY (A VIEW OF THE SWARM WITH THE ARRAY ENGINE)
+
+        if self.vectorize:
+            return self.swarm.X
+        return np.hstack([particle.X for particle in self.population]).T
+
+    def ask(self):
+
+        '''
+
+        ACTION:
+
+        FIRST HALF OF THE ASK/TELL INTERFACE (ARRAY ENGINE, 'gbest' UPDATED ONCE PER ITERATION). RETURNS
+
+        THE POSITIONS OF SHAPE (P,n) WHICH NEED TO BE EVALUATED, THE INITIAL ONES ON THE FIRST CALL AND THE
+
+        MOVED ONES (WITH THE COEFFICIENTS OF ITERATION 't') AFTER THAT. THEIR FITNESS VALUES MUST BE PASSED
+
+        TO 'tell' BEFORE THE NEXT 'ask'. A SWARM INITIALIZED BY 'initialize' CAN ONLY BE CONTINUED HERE IF
+
+        IT IS A 'Swarm' ('vectorize' TRUE)
+
+        EXAMPLE:
+
+            optimizer = PSO(fitness_1, Tmax=100)
+            while optimizer.stop_reason is None:
+                X = optimizer.ask()
+                optimizer.tell([fitness_1(x.reshape(-1,1)) for x in X])
+
+        '''
+
+        if self.surrogate is not None:
+            raise RuntimeError('ask/tell is not available with a surrogate, the positions to evaluate are chosen by move')
+        if self.asked is not None:
+            raise RuntimeError('ask called twice, tell the fitness of the previous positions first')
+        if self.gbest is not None and not self.vectorize:
+            raise RuntimeError("ask/tell needs the array engine, pass vectorize=True or call 'ask' without 'initialize'")
+        if self.gbest is None:
+            self.vectorize = True
+            self.start_time = time.perf_counter()
+            self.create_swarm()
+            self.t = 0
+            self.fitness_time, self.time = [], []
+            self.stop_reason = None
+            self.asked = 'initialize'
+        else:
+            if self.metrics is not None:
+                self.metrics.begin(self)
+            self.update_coeff()
+            if self.metrics is not None:
+                self.metrics.coeff_time = self.metrics.lap()
+            if self.swarm.topology is not None:
+                self.swarm.topology.update(self.t)
+            self.swarm.move(self.w, self.c1, self.c2, self.vmax)
+            if self.metrics is not None:
+                self.metrics.lap() # THE TIME UNTIL 'tell' IS COUNTED AS EVALUATION
+            self.asked = 'move'
+        return self.swarm.X.copy()
+
+    def tell(self, F):
+
+        '''
+
+        PARAMETERS:
+
+        F: FITNESS VALUES OF THE POSITIONS RETURNED BY THE LAST 'ask', OF SHAPE (P,)
+
+        ACTION:
+
+        SECOND HALF OF THE ASK/TELL INTERFACE. UPDATES 'pbest' AND 'gbest' AND (EXCEPT FOR THE INITIAL
+
+        POSITIONS) RECORDS THE ITERATION LIKE 'iterate' AND SETS 'stop_reason' ONCE A STOPPING CRITERION
+
+        IS MET. RETURNS THE SNAPSHOT OF THE STATE (OR NONE FOR THE INITIAL POSITIONS)
+
+        '''
+
+        if self.asked is None:
+            raise RuntimeError('tell called without a matching ask')
+        if self.metrics is not None and self.asked == 'move':
+            self.metrics.evaluate_time = self.metrics.lap()
+        F = np.asarray(F, dtype='float64').reshape(-1)
+        if F.shape != (self.P,):
+            raise ValueError('tell expects %d fitness values, got %d' % (self.P, F.size))
+        self.evaluations += self.P
+        asked, self.asked = self.asked, None
+        if asked == 'initialize':
+            self.swarm.set_best(F)
+            self.gbest_fitness = self.swarm.gbest_fitness
+            return None
+        self.swarm.accept_all(F)
+        self.gbest_fitness = self.swarm.gbest_fitness
+        return self.record()
+
+    def step(self):
+
+        '''
+
+        ACTION:
+
+        ONE ITERATION OF THE ARRAY ENGINE ('vectorize' IS TRUE). ALL THE PARTICLES ARE MOVED AT ONCE
+
+        WITH THE CURRENT 'gbest'.
+
+            1. IF THE FITNESS IS BATCHED OR EVALUATED ON A WORKER POOL, OR THE TOPOLOGY IS LOCAL, OR THERE IS A
+
+            FUSED 'kernel', THE WHOLE SWARM IS EVALUATED AT ONCE AND 'gbest' IS UPDATED ONCE FOR THE ITERATION
+
+            2. OTHERWISE THE PARTICLES ARE EVALUATED ONE BY ONE. WHENEVER A PARTICLE IMPROVES 'gbest',
+
+            THE PARTICLES AFTER IT ARE MOVED AGAIN WITH THE NEW 'gbest', EXACTLY AS THEY WOULD HAVE BEEN
+
+            MOVED BY THE LOOP OVER 'Particle' OBJECTS IN 'move'
+
+        '''
+
+        swarm = self.swarm
+        if swarm.topology is not None:
+            swarm.topology.update(self.t)
+        if self.surrogate is not None:
+            swarm.move(self.w, self.c1, self.c2, self.vmax)
+            swarm.accept_all(self.screen(swarm.X))
+            self.gbest_fitness = swarm.gbest_fitness
+            return
+        if self.batch or self.evaluator is not None or swarm.topology is not None or swarm.kernel is not None:
+            swarm.move(self.w, self.c1, self.c2, self.vmax)
+            swarm.accept_all(self.evaluate_batch(swarm.X))
+            self.gbest_fitness = swarm.gbest_fitness
+            return
+        swarm.draw(self.c1, self.c2)
+        swarm.propose(self.w, self.vmax)
+        for i in range(self.P):
+            if swarm.accept(i, self.evaluate(swarm.columns[i])) and i+1 < self.P:
+                swarm.propose(self.w, self.vmax, i+1)
+        self.gbest_fitness = swarm.gbest_fitness
+
+    def screen(self, X):
+
+        '''
+
+        PARAMETERS:
+
+        X: MOVED POSITIONS OF THE SWARM OF SHAPE (P,n)
+
+        ACTION:
+
+        EVALUATES ONLY THE ROWS OF 'X' CHOSEN BY THE SURROGATE, ADDS THEM TO ITS ARCHIVE AND RETURNS THE FITNESS
+
+        VALUES OF SHAPE (P,). THE ROWS WHICH WERE NOT EVALUATED GET THE WORST POSSIBLE FITNESS (+INF FOR MINIMIZATION,
+
+        -INF FOR MAXIMIZATION), SO THEY UPDATE NEITHER 'pbest' NOR 'gbest'
+
+        '''
+
+        sign = self.swarm.sign
+        mask = self.surrogate.select(X, self.swarm.pbest_cost)
+        F = np.full(len(X), sign*np.inf)
+        F[mask] = self.evaluate_batch(X[mask])
+        self.surrogate.add(X[mask], sign*F[mask])
+        return F
+
+    def move_async(self):
+
+        '''
+
+        PARAMETERS:
+
+        stats: DICTIONARY WITH THE RUN LEVEL STATISTICS OF THE ASYNCHRONOUS MODE ('workers', 'evaluations',
+
+        'wall_time', 'busy_time' AND 'utilization', THE FRACTION OF THE AVAILABLE WORKER TIME SPENT EVALUATING)
+
+        ACTION:
+
+        ASYNCHRONOUS (BARRIER FREE) VERSION OF 'move'. EVERY PARTICLE IS EVALUATED AS A SEPARATE TASK AND
+
+        WHEN A TASK FINISHES, THE 'pbest' OF ITS PARTICLE AND 'gbest' ARE UPDATED, THE PARTICLE IS MOVED
+
+        WITH THE CURRENT 'gbest' AND SUBMITTED AGAIN, UNTIL 'max_evaluations' EVALUATIONS HAVE BEEN SUBMITTED
+
+        OR ONE OF THE 'target', 'tol', 'diameter' AND 'max_time' CRITERIA IS MET (CHECKED EVERY P EVALUATIONS).
+
+        THE COEFFICIENTS FOLLOW THE SAME SCHEDULES WITH t = (COMPLETED EVALUATIONS)/P, AND 'fitness_time'
+
+        AND 'time' ARE RECORDED ONCE EVERY P COMPLETED EVALUATIONS
+
+        '''
+
+        swarm = self.swarm
+        budget = self.max_evaluations if self.max_evaluations is not None else self.P*(self.Tmax+2)
         self.t = 0
         self.fitness_time, self.time = [], []
-        while self.t <= self.Tmax:
-            self.update_coeff()
-            for particle in self.population:
-                particle.update_velocity(self.w, self.c1, self.c2, self.gbest)
-                particle.update_position()
-                particle.pbest = self.optimum(particle.pbest, particle.X)
-                self.gbest = self.optimum(self.gbest, particle.X)
-            self.fitness_time.append(self.fitness(self.gbest))
-            self.time.append(self.t)
-            if self.verbose:
-                print('Iteration:  ',self.t,'| best global fitness (cost):',round(self.fitness(self.gbest),7))
-            self.t += 1
+        busy, submitted, pending = 0.0, 0, {}
+        start = self.start_time = time.perf_counter()
+        self.stop_reason = None
+
+        def submit(i):
+            pending[self.evaluator.submit(swarm.X[i:i+1].copy())] = i
+
+        for i in range(min(self.P, budget)):
+            submit(i)
+        submitted = len(pending)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                F, seconds = future.result()
+                busy += seconds
+                self.evaluations += 1
+                swarm.accept(i, F[0])
+                self.gbest_fitness = swarm.gbest_fitness
+                if self.evaluations % self.P == 0:
+                    self.fitness_time.append(self.gbest_fitness)
+                    self.time.append(len(self.time))
+                    if swarm.topology is not None:
+                        swarm.topology.update(len(self.time))
+                    if self.verbose:
+                        print('Iteration:  ',self.time[-1],'| best global fitness (cost):',round(self.gbest_fitness,7))
+                    reason = self.stopping_criterion()
+                    if reason not in (None, 'max_evaluations', 'Tmax'):
+                        self.stop_reason = reason
+                if submitted < budget and self.stop_reason is None:
+                    self.t = min(self.evaluations//self.P, self.Tmax)
+                    self.update_coeff()
+                    swarm.draw(self.c1, self.c2, i, i+1)
+                    swarm.propose(self.w, self.vmax, i, i+1)
+                    submit(i)
+                    submitted += 1
+        wall = time.perf_counter() - start
+        if self.stop_reason is None:
+            self.stop_reason = 'max_evaluations'
+        workers = self.evaluator.workers
+        self.stats = {'workers': workers, 'evaluations': submitted, 'wall_time': wall, 'busy_time': busy,
+                      'utilization': busy/(workers*wall) if wall > 0 else 0.0}
+
+    async def run(self):
+
+        '''
+
+        SAME AS 'execute' (WITHOUT THE PRINTING) FOR AN 'async def' FITNESS, AS A COROUTINE TO AWAIT FROM A RUNNING EVENT LOOP:
+
+            best, best_fitness = await optimizer.run()
+
+        THE RUN GOES THROUGH ASK/TELL, SO THE CACHE AND THE SURROGATE ARE NOT USED. IT STOPS ON THE SAME CRITERIA AS 'move'
+
+        AND RETURNS 'gbest' AND 'gbest_fitness'. LIKE 'execute', IT CALLS 'close' AT THE END (THE RECORDER IS FLUSHED
+
+        AND THE CACHE SAVED), ALSO IF THE RUN FAILS
+
+        '''
+
+        if not isinstance(self.evaluator, AsyncEvaluator):
+            raise RuntimeError("run needs an 'async def' fitness, use execute")
+        try:
+            while self.stop_reason is None:
+                X = self.ask()
+                self.tell(await self.evaluator.evaluate(X))
+        finally:
+            self.close()
+        return self.gbest, self.gbest_fitness
 
     def execute(self):
 
@@ -350,18 +1152,79 @@ class PSO:
         PRINTS THE FINAL SOLUTION
 
         '''
-        self.initialize()
-        self.move()
+        try:
+            self.initialize()
+            self.move()
+        finally:
+            self.close()
+        self.report()
+
+    def resume(self, path=None):
+
+        # SAME AS 'execute' BUT CONTINUES THE RUN CHECKPOINTED IN 'path' (DEFAULT: 'checkpoint') INSTEAD OF STARTING A NEW ONE
+
+        try:
+            self.restore(path or self.checkpoint)
+            self.move()
+        finally:
+            self.close()
+        self.report()
+
+    def report(self):
+
+        # PRINTS THE FINAL SOLUTION (AND THE CHECKPOINT COST) AND PLOTS THE HISTORY IF 'plot' IS SET
+
         print('\nOPTIMUM SOLUTION\n  >', np.round(self.gbest.reshape(-1),7).tolist())
-        print('\nOPTIMUM FITNESS\n  >', np.round(self.fitness(self.gbest),7))
+        print('\nOPTIMUM FITNESS\n  >', np.round(self.gbest_fitness,7))
+        if self.stop_reason != 'Tmax':
+            print('\nSTOPPED BY\n  >', self.stop_reason)
+        if self.checkpoint_times:
+            print('\nCHECKPOINTS\n  >', len(self.checkpoint_times), 'written, %.2f ms each on average' % (1e3*np.mean(self.checkpoint_times)))
+        if getattr(self.evaluator, 'timeouts', 0):
+            print('\nTIMEOUTS\n  >', self.evaluator.timeouts, 'calls timed out, given the penalty', self.evaluator.penalty)
+        if self.surrogate is not None:
+            stats = self.surrogate.stats()
+            print('\nSURROGATE\n  >', stats['evaluated'], 'evaluated,', stats['skipped'], 'skipped (%.1f%% saved)' % (100*stats['saved']),
+                  '| prediction error: mae %s, rmse %s' % tuple('-' if e is None else '%.4g' % e for e in (stats['mae'], stats['rmse'])))
+        if self.metrics is not None and len(self.metrics):
+            summary = self.metrics.summary()
+            print('\nTIME (s)\n  > total %.4f | update_coeff %.4f | fitness %.4f | optimizer %.4f | fitness share %.1f%%' %
+                  (summary['time'], summary['coeff_time'], summary['evaluate_time'], summary['update_time'], 100*summary['evaluate_share']))
         print()
         if self.plot:
-            self.Fplot()
+            self.Fplot(self.plot if isinstance(self.plot, str) else None)
         
-    def Fplot(self):
+    def close(self):
 
-        # PLOTS GLOBAL FITNESS (OR COST) VALUE VS ITERATION GRAPH
+        # SHUT DOWN THE WORKER PROCESSES (IF ANY), SAVE THE CACHE (IF IT HAS A FILE) AND FLUSH THE RECORDER (IF ANY)
+
+        if self.evaluator is not None:
+            self.evaluator.close()
+        if self.cache is not None and self.cache.path is not None:
+            self.cache.save()
+        if self.recorder is not None:
+            self.recorder.close()
         
+    def Fplot(self, filename=None):
+
+        # PLOTS GLOBAL FITNESS (OR COST) VALUE VS ITERATION GRAPH
+
+        # MATPLOTLIB IS ONLY IMPORTED HERE, SO 'import pso' STAYS CHEAP FOR WORKERS THAT NEVER PLOT. WITH A 'filename',
+
+        # THE FIGURE IS DRAWN WITHOUT PYPLOT (NO GUI BACKEND OR DISPLAY NEEDED) AND SAVED TO THAT FILE
+
+        if filename is not None:
+            from matplotlib.figure import Figure
+            fig = Figure()
+            ax = fig.add_subplot(1,1,1)
+            ax.plot(self.time, self.fitness_time)
+            ax.set_title('Fitness value vs Iteration')
+            ax.set_xlabel('Iteration')
+            ax.set_ylabel('Fitness value')
+            fig.savefig(filename)
+            return
+
+        import matplotlib.pyplot as plt
         plt.plot(self.time, self.fitness_time)
         plt.title('Fitness value vs Iteration')
         plt.xlabel('Iteration')
@@ -0,0 +1,329 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+TRAJECTORY FORMAT. A RECORDED RUN IS A DIRECTORY WITH:
+
+    meta.json: P, n, dtype, FIELDS, 'every' AND 'count' (NUMBER OF ITERATIONS WRITTEN SO FAR)
+
+    X.bin, V.bin: POSITIONS AND VELOCITIES, count*P*n VALUES OF 'dtype' (ONE (P,n) FRAME PER RECORDED ITERATION)
+
+    fitness.bin: FITNESS VALUES OF THE CURRENT POSITIONS, count*P VALUES OF 'dtype'
+
+    t.bin, gbest_fitness.bin: ITERATION NUMBER (int64) AND GLOBAL FITNESS (float64) OF EACH FRAME
+
+THE .bin FILES ARE RAW ARRAYS IN C ORDER WHICH ARE ONLY EVER APPENDED TO, ONE CHUNK OF FRAMES AT A TIME. 'meta.json'
+
+IS REPLACED ATOMICALLY AFTER EACH CHUNK, SO A RUN KILLED IN THE MIDDLE OF A CHUNK STILL READS BACK UP TO THE LAST ONE
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import json
+import numpy as np
+
+FIELDS = ('X', 'V', 'fitness')
+
+def frame(optimizer):
+
+    # POSITIONS, VELOCITIES AND FITNESS VALUES OF THE CURRENT SWARM OF 'optimizer' (EITHER ENGINE) AS A DICTIONARY
+
+    if optimizer.vectorize:
+        swarm = optimizer.swarm
+        return {'X': swarm.X, 'V': swarm.V, 'fitness': swarm.sign*swarm.cost}
+    population = optimizer.population
+    return {'X': np.hstack([particle.X for particle in population]).T,
+            'V': np.hstack([particle.V for particle in population]).T,
+            'fitness': np.array([particle.fitness for particle in population], dtype='float64')}
+
+###########################  RECORDER CLASS  ###################################
+
+class Recorder:
+
+    def __init__(self, path=None, every=1, dtype='float32', chunk=None, ring=None, fields=FIELDS, append=False, buffer_mb=8):
+
+        '''
+
+        STREAMS THE SWARM OF EVERY RECORDED ITERATION (POSITIONS, VELOCITIES AND FITNESS VALUES OF ALL THE PARTICLES)
+
+        TO DISK, FOR DIAGNOSTICS OR ANIMATION, WITHOUT KEEPING THE WHOLE HISTORY IN MEMORY. SEE 'Trajectory' TO READ IT BACK
+
+        PARAMETERS:
+
+        path: DIRECTORY OF THE RECORDED RUN (NONE TO ONLY KEEP THE 'ring' BUFFER IN MEMORY)
+
+        every: RECORD ONE ITERATION OUT OF 'every' (ITERATIONS 0, every, 2*every, ...)
+
+        dtype: TYPE THE ARRAYS ARE STORED AS ('float32' HALVES THE SIZE, 'float64' KEEPS THEM EXACT)
+
+        buffer_mb: MEMORY (IN MB) OF THE BUFFER OF FRAMES WAITING TO BE APPENDED TO THE FILES. THE NUMBER OF FRAMES IT
+
+        HOLDS IS DERIVED FROM THE SIZE OF A FRAME (P, n, 'dtype' AND 'fields'), SO A LARGE SWARM BUFFERS FEWER FRAMES
+
+        (AT LEAST ONE) INSTEAD OF MORE MEMORY
+
+        chunk: MAXIMUM NUMBER OF FRAMES IN THE BUFFER (NONE FOR NO OTHER LIMIT THAN 'buffer_mb')
+
+        ring: NUMBER OF LAST RECORDED ITERATIONS KEPT IN MEMORY (SEE 'last'), NONE FOR NO RING BUFFER
+
+        fields: ARRAYS TO RECORD, ANY OF 'X', 'V' AND 'fitness'
+
+        append: BOOL VALUE (TRUE TO CONTINUE A RECORDING ALREADY IN 'path', E.G. WHEN A RUN IS RESUMED FROM A
+
+        CHECKPOINT, FALSE TO START A NEW ONE). THE FRAMES OF THE ITERATIONS WHICH ARE RUN AGAIN (FROM THE FIRST
+
+        RECORDED ITERATION ON) ARE DROPPED FIRST, SO EACH ITERATION APPEARS ONCE
+
+        count: NUMBER OF FRAMES WRITTEN TO 'path' SO FAR
+
+        '''
+
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError('fields must be among %s, got %s' % (', '.join(FIELDS), ', '.join(sorted(unknown))))
+        if path is None and ring is None:
+            raise ValueError("nothing to record to, pass a 'path' or a 'ring' size")
+        self.path = path
+        self.every = every
+        self.dtype = np.dtype(dtype)
+        self.buffer_mb = buffer_mb
+        self.chunk = chunk
+        self.ring = ring
+        self.fields = tuple(fields)
+        self.append = append
+        self.count = 0
+        self.limit = None # FRAMES WRITTEN AT THE LAST CHECKPOINT, SET BY 'checkpoint.load'
+        self.P = self.n = None
+        self.files = None
+
+    def open(self, P, n, t=0):
+
+        '''
+
+        PARAMETERS:
+
+        P, n: POPULATION SIZE AND DIMENSIONS OF THE RECORDED SWARM
+
+        t: FIRST ITERATION TO RECORD
+
+        ACTION:
+
+        ALLOCATES THE CHUNK AND RING BUFFERS ('frames' FRAMES FIT IN THE CHUNK BUFFER) AND OPENS THE FILES FOR APPENDING (CALLED BY THE FIRST 'record'). WITH
+
+        'append', THE FILES ARE CUT BACK TO THE LAST COMPLETE CHUNK OF THE EXISTING RECORDING AND THEN TO THE FIRST
+
+        FRAME OF ITERATION 't' OR LATER (AND TO THE FRAMES OF THE CHECKPOINT THE RUN WAS RESTORED FROM, IF ANY)
+
+        '''
+
+        self.P, self.n = P, n
+        shapes = {'X': (P,n), 'V': (P,n), 'fitness': (P,)}
+        self.shapes = {field: shapes[field] for field in self.fields}
+        size = 16 + sum(int(np.prod(shape))*self.dtype.itemsize for shape in self.shapes.values()) # BYTES PER FRAME
+        self.frames = max(1, int(self.buffer_mb*2**20)//size)
+        if self.chunk is not None:
+            self.frames = min(self.frames, self.chunk)
+        self.buffer = {field: np.zeros((self.frames,) + shape, dtype=self.dtype) for field, shape in self.shapes.items()}
+        self.buffer['t'] = np.zeros(self.frames, dtype='int64')
+        self.buffer['gbest_fitness'] = np.zeros(self.frames, dtype='float64')
+        self.buffered = 0
+        if self.ring is not None:
+            self.ring_buffer = {field: np.zeros((self.ring,) + shape, dtype=self.dtype) for field, shape in self.shapes.items()}
+            self.ring_buffer['t'] = np.zeros(self.ring, dtype='int64')
+            self.ring_buffer['gbest_fitness'] = np.zeros(self.ring, dtype='float64')
+            self.ring_size = 0
+        if self.path is None:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        if self.append and os.path.exists(os.path.join(self.path, 'meta.json')):
+            with open(os.path.join(self.path, 'meta.json')) as f:
+                meta = json.load(f)
+            if (meta['P'], meta['n'], meta['dtype'], tuple(meta['fields'])) != (P, n, self.dtype.name, self.fields):
+                raise ValueError('cannot append to %s, it was recorded with P=%d, n=%d, dtype=%s, fields=%s' %
+                                 (self.path, meta['P'], meta['n'], meta['dtype'], ', '.join(meta['fields'])))
+            self.count = meta['count']
+            if self.limit is not None:
+                self.count = min(self.count, self.limit)
+            if self.count:
+                later = np.fromfile(os.path.join(self.path, 't.bin'), dtype='int64', count=self.count) >= t
+                if later.any():
+                    self.count = int(np.argmax(later))
+        else:
+            self.count = 0
+        self.files = {}
+        for field, array in self.buffer.items():
+            name = os.path.join(self.path, field + '.bin')
+            f = open(name, 'r+b' if self.count and os.path.exists(name) else 'wb')
+            f.truncate(self.count*array[0].nbytes)
+            f.seek(0, os.SEEK_END)
+            self.files[field] = f
+        self.write_meta()
+
+    def record(self, optimizer):
+
+        # ADDS THE CURRENT ITERATION OF 'optimizer' TO THE CHUNK (AND RING) BUFFER IF IT IS ONE OF THE RECORDED ONES
+
+        if optimizer.t % self.every:
+            return
+        if self.P is None or (self.path is not None and self.files is None):
+            self.open(optimizer.P, optimizer.n, optimizer.t) # FIRST RECORD, OR A NEW RUN AFTER 'close'
+        arrays = frame(optimizer)
+        k = self.buffered
+        for field in self.fields:
+            self.buffer[field][k] = arrays[field]
+        self.buffer['t'][k] = optimizer.t
+        self.buffer['gbest_fitness'][k] = optimizer.gbest_fitness
+        if self.ring is not None:
+            i = self.ring_size % self.ring
+            for field, array in self.ring_buffer.items():
+                array[i] = self.buffer[field][k]
+            self.ring_size += 1
+        self.buffered += 1
+        if self.buffered == self.frames:
+            self.flush()
+
+    def flush(self):
+
+        # APPENDS THE BUFFERED FRAMES TO THE FILES AND UPDATES 'meta.json'
+
+        if self.files is not None and self.buffered:
+            for field, f in self.files.items():
+                f.write(self.buffer[field][:self.buffered].data)
+                f.flush()
+            self.count += self.buffered
+            self.write_meta()
+        self.buffered = 0
+
+    def write_meta(self):
+
+        # REPLACES 'meta.json' ATOMICALLY (WRITTEN TO A TEMPORARY FILE, THEN RENAMED)
+
+        meta = {'P': self.P, 'n': self.n, 'dtype': self.dtype.name, 'fields': list(self.fields), 'every': self.every,
+                'count': self.count}
+        tmp = os.path.join(self.path, 'meta.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(self.path, 'meta.json'))
+
+    def last(self):
+
+        # THE RING BUFFER AS A DICTIONARY OF ARRAYS WITH THE OLDEST FRAME FIRST ('t', 'gbest_fitness' AND THE 'fields')
+
+        if self.ring is None or self.P is None:
+            return None
+        size = min(self.ring_size, self.ring)
+        order = (np.arange(size) + self.ring_size - size) % self.ring
+        return {field: array[order] for field, array in self.ring_buffer.items()}
+
+    def close(self):
+
+        # WRITES THE FRAMES STILL BUFFERED AND CLOSES THE FILES
+
+        if self.P is None:
+            return
+        self.flush()
+        if self.files is not None:
+            for f in self.files.values():
+                f.close()
+            self.files = None
+
+######################################## END OF RECORDER CLASS ########################################
+
+###########################  TRAJECTORY CLASS  #################################
+
+class Trajectory:
+
+    def __init__(self, path):
+
+        '''
+
+        READS A RUN RECORDED BY 'Recorder' WITHOUT LOADING IT: THE ARRAYS ARE READ-ONLY MEMORY MAPS OF THE FILES
+
+        PARAMETERS:
+
+        path: DIRECTORY OF THE RECORDED RUN
+
+        X, V: POSITIONS AND VELOCITIES OF SHAPE (count,P,n)
+
+        fitness: FITNESS VALUES OF SHAPE (count,P)
+
+        t, gbest_fitness: ITERATION NUMBER AND GLOBAL FITNESS OF EACH FRAME OF SHAPE (count,)
+
+        '''
+
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        self.path = path
+        self.P, self.n, self.every, self.count = meta['P'], meta['n'], meta['every'], meta['count']
+        self.dtype = np.dtype(meta['dtype'])
+        self.fields = tuple(meta['fields'])
+        shapes = {'X': (self.P, self.n), 'V': (self.P, self.n), 'fitness': (self.P,)}
+        for field in FIELDS:
+            setattr(self, field, self.map(field, self.dtype, shapes[field]) if field in self.fields else None)
+        self.t = self.map('t', np.dtype('int64'), ())
+        self.gbest_fitness = self.map('gbest_fitness', np.dtype('float64'), ())
+
+    def map(self, field, dtype, shape):
+
+        # READ-ONLY MEMORY MAP OF THE FIRST 'count' FRAMES OF '<field>.bin' (AN EMPTY ARRAY IF THERE IS NONE YET)
+
+        if self.count == 0:
+            return np.zeros((0,) + shape, dtype=dtype)
+        return np.memmap(os.path.join(self.path, field + '.bin'), dtype=dtype, mode='r', shape=(self.count,) + shape)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+
+        # FRAME 'i' AS A DICTIONARY ('t', 'gbest_fitness' AND THE RECORDED FIELDS), E.G. TO REPLAY OR ANIMATE THE RUN
+
+        item = {'t': int(self.t[i]), 'gbest_fitness': float(self.gbest_fitness[i])}
+        for field in self.fields:
+            item[field] = np.asarray(getattr(self, field)[i])
+        return item
+
+    def reduce(self, function, field='fitness', chunk=256):
+
+        # APPLIES 'function' (E.G. np.min) TO EVERY FRAME OF 'field' ONE CHUNK OF FRAMES AT A TIME, RETURNS SHAPE (count,)
+
+        array = getattr(self, field)
+        out = np.zeros(self.count)
+        for start in range(0, self.count, chunk):
+            block = np.asarray(array[start:start+chunk], dtype='float64')
+            out[start:start+chunk] = function(block.reshape(len(block), -1), axis=1)
+        return out
+
+    def plot(self, filename=None):
+
+        # PLOTS THE GLOBAL FITNESS (AND THE MEDIAN FITNESS OF THE SWARM IF IT WAS RECORDED) VS ITERATION, LIKE 'PSO.Fplot'
+
+        if filename is not None:
+            from matplotlib.figure import Figure
+            fig = Figure()
+            ax = fig.add_subplot(1,1,1)
+        else:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots()
+        ax.plot(self.t, self.gbest_fitness, label='global best')
+        if 'fitness' in self.fields:
+            ax.plot(self.t, self.reduce(np.median), label='swarm median')
+            ax.legend()
+        ax.set_title('Fitness value vs Iteration')
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('Fitness value')
+        if filename is not None:
+            fig.savefig(filename)
+        else:
+            plt.show()
+
+######################################## END OF TRAJECTORY CLASS ########################################
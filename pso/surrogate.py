@@ -0,0 +1,198 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+
+###########################  SURROGATE CLASS  ##################################
+
+class Surrogate:
+
+    def __init__(self, budget=0.5, minimum=1, radius=None, size=300, warmup=None):
+
+        '''
+
+        PRE-SCREENING OF THE NEW POSITIONS OF THE SWARM WITH A CHEAP MODEL OF THE FITNESS FUNCTION, FOR OBJECTIVES
+
+        WHICH COST SECONDS OR MORE PER CALL. THE MODEL IS A CUBIC RADIAL BASIS FUNCTION (RBF) INTERPOLANT WITH A
+
+        LINEAR TAIL [10], FITTED AGAIN AFTER EVERY ITERATION ON AN ARCHIVE OF THE POSITIONS EVALUATED SO FAR (NUMPY ONLY).
+
+        AT EACH ITERATION, A PARTICLE IS SENT TO THE TRUE FITNESS FUNCTION ONLY IF THE MODEL PREDICTS THAT IT BEATS ITS
+
+        OWN 'pbest' (OR IF IT IS FAR FROM EVERY ARCHIVED POSITION, SEE 'radius'), AND AT MOST 'budget' OF THE SWARM IS
+
+        SENT, MOST PROMISING FIRST. THE OTHER PARTICLES KEEP MOVING BUT THEIR 'pbest' IS NOT UPDATED
+
+        PARAMETERS:
+
+        budget: MAXIMUM FRACTION OF THE SWARM EVALUATED PER ITERATION (1 TO ONLY SKIP THE UNPROMISING PARTICLES)
+
+        minimum: NUMBER OF PARTICLES EVALUATED PER ITERATION EVEN IF NONE LOOKS PROMISING (THE BEST PREDICTED ONES),
+
+        SO THAT THE MODEL KEEPS LEARNING
+
+        radius: ALSO EVALUATE THE PARTICLES FARTHER THAN 'radius' FROM EVERY ARCHIVED POSITION, WHERE THE MODEL IS
+
+        NOT TRUSTED (NONE TO RELY ON THE PREDICTION ONLY)
+
+        size: MAXIMUM NUMBER OF ARCHIVED POSITIONS (THE OLDEST ONES ARE DROPPED). FITTING COSTS O(size^3)
+
+        warmup: NUMBER OF ARCHIVED POSITIONS BELOW WHICH EVERY PARTICLE IS EVALUATED (DEFAULT: 2*(n+1))
+
+        RESULTS (SEE 'stats'):
+
+        evaluated, skipped: NUMBER OF POSITIONS SENT TO THE FITNESS FUNCTION AND NUMBER OF EVALUATIONS SAVED
+
+        errors: PREDICTION ERRORS (TRUE MINUS PREDICTED COST) OF ALL THE SCREENED POSITIONS WHICH WERE EVALUATED
+
+        '''
+
+        self.budget = budget
+        self.minimum = minimum
+        self.radius = radius
+        self.size = size
+        self.warmup = warmup
+        self.X = None
+        self.cost = None
+        self.pending = None
+        self.evaluated = self.skipped = 0
+        self.errors = []
+
+    def add(self, X, cost):
+
+        '''
+
+        PARAMETERS:
+
+        X: EVALUATED POSITIONS OF SHAPE (m,n)
+
+        cost: THEIR COSTS OF SHAPE (m,) (FITNESS VALUES, NEGATED FOR MAXIMIZATION)
+
+        ACTION:
+
+        RECORDS THE PREDICTION ERROR OF THE POSITIONS CHOSEN BY THE LAST 'select' (IF ANY), ADDS THE POSITIONS
+
+        TO THE ARCHIVE (SKIPPING EXACT DUPLICATES, WHICH WOULD MAKE THE MODEL SINGULAR) AND FITS THE MODEL AGAIN
+
+        '''
+
+        if self.pending is not None:
+            self.errors.extend((cost - self.pending).tolist())
+            self.pending = None
+        self.evaluated += len(X)
+        if self.X is None:
+            self.X, self.cost = np.empty((0, X.shape[1])), np.empty(0)
+        keep = np.unique(X, axis=0, return_index=True)[1]
+        X, cost = X[np.sort(keep)], cost[np.sort(keep)]
+        if len(self.X):
+            keep = self.distances(X).min(axis=1) > 0
+            X, cost = X[keep], cost[keep]
+        self.X = np.concatenate([self.X, X])[-self.size:]
+        self.cost = np.concatenate([self.cost, cost])[-self.size:]
+        if len(self.X) > self.X.shape[1] + 1:
+            self.fit()
+
+    def distances(self, X):
+
+        # EUCLIDEAN DISTANCES OF SHAPE (m,k) BETWEEN THE ROWS OF 'X' AND THE k ARCHIVED POSITIONS
+
+        d2 = (X**2).sum(axis=1)[:,None] + (self.X**2).sum(axis=1)[None,:] - 2*X @ self.X.T
+        return np.sqrt(np.maximum(d2, 0))
+
+    def fit(self):
+
+        '''
+
+        SOLVES FOR THE RBF WEIGHTS 'lam' AND THE LINEAR TAIL 'tail' SUCH THAT
+
+            s(x) = SUM lam_j |x - x_j|^3 + tail_0 + tail_1:n . x
+
+        INTERPOLATES THE ARCHIVE, WITH SUM lam_j = 0 AND SUM lam_j x_j = 0:
+
+            | PHI   Q | | lam  |   | cost |
+            | Q^T   0 | | tail | = |  0   |
+
+        '''
+
+        k, n = self.X.shape
+        Q = np.hstack([np.ones((k,1)), self.X])
+        A = np.zeros((k+n+1, k+n+1))
+        A[:k,:k] = self.distances(self.X)**3
+        A[:k,k:] = Q
+        A[k:,:k] = Q.T
+        b = np.concatenate([self.cost, np.zeros(n+1)])
+        try:
+            solution = np.linalg.solve(A, b)
+        except np.linalg.LinAlgError:
+            solution = np.linalg.lstsq(A, b, rcond=None)[0]
+        self.lam, self.tail = solution[:k], solution[k:]
+
+    def predict(self, X):
+
+        # PREDICTED COSTS OF THE ROWS OF 'X' OF SHAPE (m,) AND THEIR DISTANCE TO THE NEAREST ARCHIVED POSITION
+
+        d = self.distances(X)
+        return d**3 @ self.lam + self.tail[0] + X @ self.tail[1:], d.min(axis=1)
+
+    def select(self, X, pbest_cost):
+
+        '''
+
+        PARAMETERS:
+
+        X: NEW POSITIONS OF THE SWARM OF SHAPE (P,n)
+
+        pbest_cost: COSTS OF THE PARTICLES' OWN BEST POSITIONS OF SHAPE (P,)
+
+        ACTION:
+
+        RETURNS A BOOLEAN MASK OF SHAPE (P,) OF THE POSITIONS TO EVALUATE WITH THE TRUE FITNESS FUNCTION
+
+        '''
+
+        P, n = X.shape
+        warmup = 2*(n+1) if self.warmup is None else self.warmup
+        if self.X is None or len(self.X) < max(warmup, n+2):
+            return np.ones(P, dtype=bool)
+        predicted, distance = self.predict(X)
+        wanted = predicted < pbest_cost
+        if self.radius is not None:
+            wanted |= distance > self.radius
+        order = np.argsort(predicted)
+        chosen = order[wanted[order]][:max(int(self.budget*P), self.minimum)]
+        if len(chosen) < self.minimum:
+            chosen = order[:self.minimum]
+        mask = np.zeros(P, dtype=bool)
+        mask[chosen] = True
+        self.pending = predicted[mask]
+        self.skipped += P - len(chosen)
+        return mask
+
+    def stats(self):
+
+        # TRUE EVALUATIONS, EVALUATIONS SAVED AND PREDICTION ERROR (MEAN ABSOLUTE AND ROOT MEAN SQUARE) AS A DICTIONARY
+
+        errors = np.array(self.errors)
+        return {'evaluated': self.evaluated, 'skipped': self.skipped,
+                'saved': self.skipped/(self.evaluated + self.skipped) if self.evaluated + self.skipped else 0.0,
+                'mae': float(np.abs(errors).mean()) if len(errors) else None,
+                'rmse': float(np.sqrt((errors**2).mean())) if len(errors) else None}
+
+######################################## END OF SURROGATE CLASS ########################################
+
+#########################################################################################################################################
+#                                                                                                                                       #
+# REFERENCES:                                                                                                                           #
+#                                                                                                                                       #
+# [10] R. G. REGIS AND C. A. SHOEMAKER, "A STOCHASTIC RADIAL BASIS FUNCTION METHOD FOR THE GLOBAL OPTIMIZATION OF EXPENSIVE             #
+#      FUNCTIONS," INFORMS JOURNAL ON COMPUTING, VOL. 19, NO. 4, PP. 497–509, 2007.                                                     #
+#                                                                                                                                       #
+#########################################################################################################################################
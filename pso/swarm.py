@@ -0,0 +1,345 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+
+###########################  SWARM CLASS  ######################################
+
+class Swarm:
+
+    def __init__(self, P=30, n=2, bound=None, min=True, topology=None, rng=None, kernel=None):
+
+        '''
+
+        ARRAY BACKED SWARM ENGINE. INSTEAD OF 'P' PARTICLE OBJECTS EACH HOLDING ITS OWN (n,1)
+
+        ARRAYS, THE WHOLE SWARM IS STORED AS CONTIGUOUS (P,n) ARRAYS AND EVERY STEP OF AN
+
+        ITERATION (VELOCITY, POSITION, CLIPPING AND BEST UPDATE) IS A WHOLE ARRAY OPERATION.
+
+        ALL BUFFERS ARE ALLOCATED HERE, THE UPDATES ONLY USE IN-PLACE UFUNCS.
+
+        PARAMETERS:
+
+        P: POPULATION SIZE
+
+        n: TOTAL DIMENSIONS
+
+        bound: AXIS BOUND FOR EACH DIMENSION (SAME FORMAT AS IN PSO CLASS)
+
+        min: BOOL VALUE (TRUE FOR 'MINIMIZATION PROBLEM' AND FALSE FOR 'MAXIMIZATION PROBLEM')
+
+        topology: 'Topology' OBJECT (NONE FOR THE GLOBAL BEST MODEL, WHERE EVERY PARTICLE IS ATTRACTED BY 'gbest')
+
+        rng: 'numpy.random.Generator' DRAWING ALL THE RANDOM NUMBERS OF THE SWARM (A NEW UNSEEDED ONE IF NONE)
+
+        kernel: 'Kernel' OBJECT (SEE 'kernel.py') MOVING THE WHOLE SWARM AND SELECTING THE BESTS IN FUSED PASSES IN
+
+        'move' AND 'accept_all' (NONE FOR THE UFUNC SEQUENCE OF 'draw', 'propose' AND 'accept_all')
+
+        X: PARTICLE POSITIONS OF SHAPE (P,n)
+
+        V: PARTICLE VELOCITIES OF SHAPE (P,n)
+
+        pbest: PARTICLES' OWN BEST POSITIONS OF SHAPE (P,n)
+
+        cost: COST OF THE CURRENT POSITIONS OF SHAPE (P,)
+
+        pbest_cost: COST OF 'pbest' OF SHAPE (P,)
+
+        gbest: GLOBAL BEST POSITION OF SHAPE (n,)
+
+        gbest_cost: COST OF 'gbest'
+
+        lbest: BEST 'pbest' IN THE NEIGHBOURHOOD OF EACH PARTICLE OF SHAPE (P,n) (ONLY WITH A 'topology')
+
+        NOTE: COST IS THE FITNESS VALUE FOR MINIMIZATION AND THE NEGATED FITNESS VALUE FOR
+
+        MAXIMIZATION, SO THAT THE BEST PARTICLE ALWAYS HAS THE LOWEST COST
+
+        '''
+
+        self.P = P
+        self.n = n
+        self.sign = 1.0 if min else -1.0
+        self.rng = np.random.default_rng() if rng is None else rng
+        if bound is None:
+            self.lower = self.upper = None
+        else:
+            self.lower = np.array([b[0] for b in bound], dtype='float64')
+            self.upper = np.array([b[1] for b in bound], dtype='float64')
+
+        self.X = np.zeros((P,n))
+        self.V = np.zeros((P,n))
+        self.pbest = np.zeros((P,n))
+        self.cost = np.zeros(P)
+        self.pbest_cost = np.zeros(P)
+        self.gbest = np.zeros(n)
+        self.gbest_cost = np.inf
+
+        # WORK BUFFERS (PREVIOUS POSITION AND VELOCITY, TEMPORARY TERM, RANDOM COEFFICIENTS AND MASKS)
+
+        self.X_prev = np.zeros((P,n))
+        self.V_prev = np.zeros((P,n))
+        self.tmp = np.zeros((P,n))
+        self.r = np.zeros((P,2))
+        self.a1 = np.zeros((P,1))
+        self.a2 = np.zeros((P,1))
+        self.improved = np.zeros(P, dtype=bool)
+
+        self.topology = topology
+        self.lbest = None if topology is None else np.zeros((P,n))
+        self.kernel = kernel
+
+        # (n,1) VIEWS OF EACH ROW OF 'X', SO THAT A SINGLE PARTICLE CAN BE PASSED TO A FITNESS FUNCTION WITHOUT COPYING
+
+        self.columns = [self.X[i].reshape(-1,1) for i in range(P)]
+
+    def clip_X(self, start=0, stop=None):
+
+        # IF BOUND IS SPECIFIED THEN CLIP 'X' VALUES (ROWS start TO stop) SO THAT THEY ARE IN THE SPECIFIED RANGE
+
+        if self.lower is not None:
+            np.clip(self.X[start:stop], self.lower, self.upper, out=self.X[start:stop])
+
+    def initialize(self, vmax=1, X0=None):
+
+        '''
+
+        PARAMETERS:
+
+        vmax: MAXIMUM LIMITED VELOCITY OF A PARTICLE
+
+        X0: INITIAL POSITION OF PARTICLES SPECIFIED BY USER
+
+        ACTION:
+
+        INITIALIZE POSITION 'X' AND VELOCITY 'V' OF EVERY PARTICLE. THE RANDOM NUMBERS ARE DRAWN
+
+        PARTICLE BY PARTICLE IN THE SAME ORDER AS THE 'Particle' CLASS DOES, SO BOTH ENGINES
+
+        START FROM THE SAME SWARM FOR THE SAME RANDOM STREAM
+
+        '''
+
+        for i in range(self.P):
+            if X0 is None:
+                self.X[i] = 2*self.rng.random(self.n) - 1
+            else:
+                self.X[i] = np.array(X0, dtype='float64').reshape(-1)
+            self.V[i] = 2*vmax*self.rng.random(self.n) - vmax
+        self.clip_X()
+        self.pbest_cost.fill(np.inf)
+        self.gbest_cost = np.inf
+
+    def set_best(self, F):
+
+        '''
+
+        PARAMETERS:
+
+        F: FITNESS VALUES OF THE INITIAL POSITIONS OF SHAPE (P,)
+
+        ACTION:
+
+        INITIALIZE 'pbest' WITH A COPY OF 'X' AND 'gbest' WITH THE POSITION HAVING BEST FITNESS
+
+        '''
+
+        np.multiply(F, self.sign, out=self.cost)
+        np.copyto(self.pbest, self.X)
+        np.copyto(self.pbest_cost, self.cost)
+        i = np.argmin(self.cost)
+        np.copyto(self.gbest, self.X[i])
+        self.gbest_cost = self.cost[i]
+
+    def draw(self, c1, c2, start=0, stop=None):
+
+        '''
+
+        PARAMETERS:
+
+        c1: INDIVIDUAL COGNITIVE PARAMETER
+
+        c2: SOCIAL LEARNING PARAMETER
+
+        start, stop: RANGE OF PARTICLES (DEFAULT: THE WHOLE SWARM)
+
+        ACTION:
+
+        DRAW THE TWO RANDOM COEFFICIENTS OF EVERY PARTICLE FOR THIS ITERATION IN ONE CALL INTO THE 'r' BUFFER
+
+        (IN THE SAME ORDER AS THE PSO CLASS DRAWS THEM FOR 'Particle.update_velocity') AND KEEP A COPY OF
+
+        THE CURRENT 'X' AND 'V', WHICH 'propose' MOVES THE PARTICLES FROM. WITH A 'topology', THE NEIGHBOURHOOD BESTS 'lbest'
+
+        ARE GATHERED HERE AS WELL
+
+        '''
+
+        rows = slice(start, stop)
+        r = self.rng.random(out=self.r[rows])
+        np.multiply(c1, r[:,:1], out=self.a1[rows])
+        np.multiply(c2, r[:,1:], out=self.a2[rows])
+        np.copyto(self.X_prev[rows], self.X[rows])
+        np.copyto(self.V_prev[rows], self.V[rows])
+        if self.topology is not None:
+            self.topology.social_best(self.pbest, self.pbest_cost, self.lbest, start, stop)
+
+    def propose(self, w, vmax, start=0, stop=None):
+
+        '''
+
+        PARAMETERS:
+
+        w: INERTIA WEIGHT
+
+        vmax: MAXIMUM LIMITED VELOCITY OF A PARTICLE
+
+        start, stop: RANGE OF PARTICLES TO MOVE (DEFAULT: THE WHOLE SWARM)
+
+        ACTION:
+
+        UPDATE THE VELOCITY AND POSITION OF PARTICLES start, start+1, ..., stop-1 FROM THEIR
+
+        POSITION AND VELOCITY AT THE LAST 'draw' AND THE CURRENT 'gbest' (OR 'lbest'). THE OPERATIONS ARE
+
+        DONE IN THE SAME ORDER AS 'Particle.update_velocity' AND 'Particle.update_position'
+
+        SO THAT THE RESULT IS BIT FOR BIT THE SAME
+
+        '''
+
+        rows = slice(start, stop)
+        X, V, tmp = self.X[rows], self.V[rows], self.tmp[rows]
+        X_prev = self.X_prev[rows]
+        np.multiply(w, self.V_prev[rows], out=V) # PARTICLE'S PREVIOUS MOTION
+        np.subtract(self.pbest[rows], X_prev, out=tmp)
+        np.multiply(self.a1[rows], tmp, out=tmp)
+        np.add(V, tmp, out=V) # COGNITIVE VELOCITY
+        social = self.gbest if self.lbest is None else self.lbest[rows]
+        np.subtract(social, X_prev, out=tmp)
+        np.multiply(self.a2[rows], tmp, out=tmp)
+        np.add(V, tmp, out=V) # SOCIAL VELOCITY
+        np.clip(V, -vmax, vmax, out=V)
+        np.add(X_prev, V, out=X)
+        self.clip_X(start, stop)
+
+    def move(self, w, c1, c2, vmax):
+
+        # 'draw' AND 'propose' FOR THE WHOLE SWARM, IN ONE FUSED PASS IF THERE IS A 'kernel' (SAME RESULT EITHER WAY)
+
+        if self.kernel is not None:
+            self.kernel.move(self, w, c1, c2, vmax)
+        else:
+            self.draw(c1, c2)
+            self.propose(w, vmax)
+
+    def accept(self, i, f):
+
+        '''
+
+        PARAMETERS:
+
+        i: PARTICLE INDEX
+
+        f: FITNESS VALUE OF THE CURRENT POSITION OF PARTICLE 'i'
+
+        ACTION:
+
+        UPDATE 'pbest' OF PARTICLE 'i' AND 'gbest'. RETURNS TRUE IF 'gbest' CHANGED
+
+        '''
+
+        cost = self.sign*f
+        self.cost[i] = cost
+        if self.pbest_cost[i] > cost:
+            self.pbest[i] = self.X[i]
+            self.pbest_cost[i] = cost
+        if self.gbest_cost > cost:
+            self.gbest[:] = self.X[i]
+            self.gbest_cost = cost
+            return True
+        return False
+
+    def accept_all(self, F):
+
+        '''
+
+        PARAMETERS:
+
+        F: FITNESS VALUES OF THE CURRENT POSITIONS OF SHAPE (P,)
+
+        ACTION:
+
+        UPDATE 'pbest' OF EVERY PARTICLE AND 'gbest' (ONCE FOR THE WHOLE SWARM). RETURNS TRUE IF 'gbest' CHANGED
+
+        '''
+
+        if self.kernel is not None:
+            return self.kernel.select(self, F)
+        np.multiply(F, self.sign, out=self.cost)
+        np.less(self.cost, self.pbest_cost, out=self.improved)
+        np.copyto(self.pbest, self.X, where=self.improved[:,None])
+        np.copyto(self.pbest_cost, self.cost, where=self.improved)
+        i = np.argmin(self.cost)
+        if self.gbest_cost > self.cost[i]:
+            np.copyto(self.gbest, self.X[i])
+            self.gbest_cost = self.cost[i]
+            return True
+        return False
+
+    def best(self, m=1):
+
+        # RETURNS THE 'm' BEST 'pbest' POSITIONS OF SHAPE (m,n) AND THEIR FITNESS VALUES OF SHAPE (m,)
+
+        i = np.argsort(self.pbest_cost)[:m]
+        return self.pbest[i].copy(), self.sign*self.pbest_cost[i]
+
+    def replace_worst(self, X, F):
+
+        '''
+
+        PARAMETERS:
+
+        X: POSITIONS OF SHAPE (m,n) COMING FROM OUTSIDE THE SWARM (E.G. MIGRANTS FROM ANOTHER SWARM)
+
+        F: THEIR FITNESS VALUES OF SHAPE (m,)
+
+        ACTION:
+
+        EACH POSITION WHICH IS BETTER THAN THE WORST 'pbest' OF THE SWARM REPLACES THAT PARTICLE'S POSITION
+
+        AND 'pbest' ('gbest' IS UPDATED AS WELL). RETURNS THE NUMBER OF REPLACED PARTICLES
+
+        '''
+
+        replaced = 0
+        for x, f in zip(X, F):
+            cost = self.sign*f
+            worst = np.argmax(self.pbest_cost)
+            if cost < self.pbest_cost[worst]:
+                self.X[worst] = self.pbest[worst] = x
+                self.cost[worst] = self.pbest_cost[worst] = cost
+                if cost < self.gbest_cost:
+                    self.gbest[:] = x
+                    self.gbest_cost = cost
+                replaced += 1
+        return replaced
+
+    @property
+    def gbest_fitness(self):
+
+        # FITNESS (OR COST) VALUE OF 'gbest'
+
+        return self.sign*self.gbest_cost
+
+######################################## END OF SWARM CLASS ########################################
@@ -0,0 +1,130 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import numpy as np
+
+TOPOLOGIES = ('global', 'ring', 'von_neumann', 'random')
+
+###########################  TOPOLOGY CLASS  ###################################
+
+class Topology:
+
+    def __init__(self, name='ring', P=30, k=3, rewire=None, rng=None):
+
+        '''
+
+        LOCAL BEST (lbest) NEIGHBOURHOOD OF EVERY PARTICLE. INSTEAD OF 'gbest', EACH PARTICLE IS ATTRACTED
+
+        BY THE BEST 'pbest' AMONG ITS NEIGHBOURS (ITSELF INCLUDED), WHICH SLOWS DOWN THE SPREAD OF
+
+        INFORMATION AND AVOIDS PREMATURE CONVERGENCE ON MULTIMODAL PROBLEMS
+
+        PARAMETERS:
+
+        name: NAME OF THE TOPOLOGY
+
+            1. 'ring': NEIGHBOURS OF PARTICLE i ARE i-1 AND i+1 (WRAPPING AROUND)
+
+            2. 'von_neumann': PARTICLES ARE PLACED ROW BY ROW ON A NEAR-SQUARE 2-D GRID (WRAPPING AROUND) AND THE
+
+            NEIGHBOURS ARE THE PARTICLES ABOVE, BELOW, ON THE LEFT AND ON THE RIGHT. THE GRID HAS CEIL(SQRT(P)) COLUMNS,
+
+            SO IF 'P' IS NOT A MULTIPLE OF IT (E.G. A PRIME 'P') THE LAST ROW IS SHORTER AND ITS PARTICLES, AND THE
+
+            COLUMNS BEYOND IT, WRAP AROUND THEIR OWN LENGTH
+
+            3. 'random': EVERY PARTICLE HAS 'k' NEIGHBOURS CHOSEN AT RANDOM, DRAWN AGAIN EVERY 'rewire' ITERATIONS
+
+        P: POPULATION SIZE
+
+        k: NUMBER OF RANDOM NEIGHBOURS ('random' TOPOLOGY ONLY)
+
+        rewire: NUMBER OF ITERATIONS BETWEEN TWO REWIRINGS ('random' TOPOLOGY ONLY, NONE TO NEVER REWIRE)
+
+        rng: 'numpy.random.Generator' DRAWING THE RANDOM NEIGHBOURS (A NEW UNSEEDED ONE IF NONE)
+
+        index: NEIGHBOUR INDICES OF SHAPE (P,K), COMPUTED ONCE. ROW i LISTS THE NEIGHBOURHOOD OF PARTICLE i
+
+        '''
+
+        if name not in TOPOLOGIES or name == 'global':
+            raise ValueError("topology must be one of 'ring', 'von_neumann' or 'random', got %r" % (name,))
+        self.name = name
+        self.P = P
+        self.k = k
+        self.rewire = rewire
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.index = self.neighbours()
+        K = self.index.shape[1]
+
+        # WORK BUFFERS OF THE GATHER IN 'social_best'
+
+        self.offset = np.arange(P)*K
+        self.cost = np.zeros((P,K))
+        self.best = np.zeros(P, dtype=np.intp)
+
+    def neighbours(self):
+
+        # RETURNS THE (P,K) NEIGHBOUR INDEX ARRAY OF THE TOPOLOGY (FIRST COLUMN IS THE PARTICLE ITSELF)
+
+        P = self.P
+        i = np.arange(P)
+        if self.name == 'ring':
+            return np.stack([i, (i-1) % P, (i+1) % P], axis=1)
+        if self.name == 'von_neumann':
+            cols = int(np.sqrt(P))
+            cols += cols*cols < P
+            rows = -(-P//cols)
+            r, c = i//cols, i % cols
+            width = np.minimum(cols, P - r*cols) # LENGTH OF THE ROW OF EACH PARTICLE
+            height = rows - (c >= P - (rows-1)*cols) # LENGTH OF THE COLUMN OF EACH PARTICLE
+            return np.stack([i, ((r-1) % height)*cols + c, ((r+1) % height)*cols + c,
+                             r*cols + (c-1) % width, r*cols + (c+1) % width], axis=1)
+        return np.concatenate([i[:,None], self.rng.integers(0, P, size=(P,self.k))], axis=1)
+
+    def update(self, t):
+
+        # REWIRE THE 'random' TOPOLOGY AT EVERY 'rewire' ITERATIONS
+
+        if self.name == 'random' and self.rewire and t > 0 and t % self.rewire == 0:
+            self.index[:] = self.neighbours()
+
+    def social_best(self, pbest, pbest_cost, out, start=0, stop=None):
+
+        '''
+
+        PARAMETERS:
+
+        pbest: PARTICLES' OWN BEST POSITIONS OF SHAPE (P,n)
+
+        pbest_cost: COST OF 'pbest' OF SHAPE (P,)
+
+        out: ARRAY OF SHAPE (P,n) RECEIVING THE BEST 'pbest' OF EACH NEIGHBOURHOOD
+
+        start, stop: RANGE OF PARTICLES (DEFAULT: THE WHOLE SWARM)
+
+        ACTION:
+
+        FOR ALL PARTICLES AT ONCE, LOOKS UP THE COST OF EVERY NEIGHBOUR, PICKS THE LOWEST ONE AND GATHERS
+
+        THE CORRESPONDING 'pbest' INTO 'out' (NO PYTHON LOOP OVER THE PARTICLES AND NO NEW ARRAYS)
+
+        '''
+
+        rows = slice(start, stop)
+        cost, best = self.cost[rows], self.best[rows]
+        np.take(pbest_cost, self.index[rows], out=cost)
+        np.argmin(cost, axis=1, out=best)
+        best += self.offset[rows]
+        np.take(self.index, best, out=best)
+        np.take(pbest, best, axis=0, out=out[rows])
+
+######################################## END OF TOPOLOGY CLASS ########################################
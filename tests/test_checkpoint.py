@@ -0,0 +1,73 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+A RUN PRE-EMPTED AFTER A CHECKPOINT AND RESUMED FROM IT MUST GIVE EXACTLY THE SAME RESULT AS A RUN WHICH WAS
+
+NEVER INTERRUPTED
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from cache import FitnessCache
+from fitness import fitness_1
+
+#######################   TESTS   ##############################################
+
+class Preempted(Exception):
+    pass
+
+class Interrupted:
+
+    # 'fitness_1' WHICH RAISES 'Preempted' AT ITS 'calls'-TH CALL, STANDING IN FOR A KILLED PROCESS
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __call__(self, X):
+        self.calls -= 1
+        if self.calls < 0:
+            raise Preempted
+        return fitness_1(X)
+
+def run(fitness, path, **options):
+    return PSO(fitness, P=10, Tmax=40, seed=3, checkpoint=path, checkpoint_every=10, **options)
+
+@pytest.mark.parametrize('vectorize', [False, True])
+@pytest.mark.parametrize('resolution', [None, 0.05])
+def test_resume_matches_uninterrupted_run(tmp_path, vectorize, resolution):
+    cache = lambda: None if resolution is None else FitnessCache(resolution=resolution)
+    reference = run(fitness_1, str(tmp_path / 'reference'), vectorize=vectorize, cache=cache())
+    reference.initialize()
+    reference.move()
+
+    path = str(tmp_path / 'run')
+    optimizer = run(Interrupted(255), path, vectorize=vectorize, cache=cache())
+    with pytest.raises(Preempted):
+        optimizer.initialize()
+        optimizer.move()
+    assert 10 < optimizer.t < 40
+
+    resumed = run(fitness_1, path, vectorize=vectorize, cache=cache())
+    resumed.restore(path)
+    resumed.move()
+    assert resumed.fitness_time == reference.fitness_time
+    assert np.array_equal(resumed.gbest, reference.gbest)
+    assert resumed.evaluations == reference.evaluations
@@ -0,0 +1,88 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+SAME SEED, SAME RUN: THE ENGINES AND OPTIONS DOCUMENTED AS EQUIVALENT MUST FOLLOW THE SAME TRAJECTORIES. USAGE
+
+(FROM THE REPOSITORY ROOT):
+
+    python -m pytest -q tests
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from fitness import fitness_1, fitness_2, fitness_3, fitness_4
+
+#######################   TESTS   ##############################################
+
+def run(fitness, **options):
+
+    # RUNS 'fitness' FOR 30 ITERATIONS AND RETURNS THE FITNESS HISTORY AND THE FINAL 'gbest'
+
+    optimizer = PSO(fitness, Tmax=30, seed=1, min=fitness is not fitness_4, **options)
+    optimizer.initialize()
+    optimizer.move()
+    return np.array(optimizer.fitness_time), np.array(optimizer.gbest, dtype='float64').reshape(-1)
+
+@pytest.mark.parametrize('fitness', [fitness_1, fitness_2, fitness_3, fitness_4])
+def test_vectorize_matches_particle(fitness):
+    history, gbest = run(fitness)
+    vectorized_history, vectorized_gbest = run(fitness, vectorize=True)
+    assert np.array_equal(history, vectorized_history)
+    assert np.array_equal(gbest, vectorized_gbest)
+
+@pytest.mark.parametrize('fitness', [fitness_1, fitness_3])
+def test_kernel_matches_batch(fitness):
+    history, gbest = run(fitness, vectorize=True, batch=True)
+    kernel_history, kernel_gbest = run(fitness, vectorize=True, batch=True, kernel='numpy')
+    assert np.array_equal(history, kernel_history)
+    assert np.array_equal(gbest, kernel_gbest)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_workers_match_batch(workers):
+    history, gbest = run(fitness_1, vectorize=True, batch=True)
+    optimizer = PSO(fitness_1, Tmax=30, seed=1, workers=workers)
+    try:
+        optimizer.initialize()
+        optimizer.move()
+    finally:
+        optimizer.close()
+    assert np.array_equal(history, np.array(optimizer.fitness_time))
+    assert np.array_equal(gbest, np.array(optimizer.gbest, dtype='float64').reshape(-1))
+
+def test_loop_kernels_match_numpy_kernels():
+    from kernel import move_loops, move_numpy, select_loops, select_numpy, NO_BOUND
+    rng = np.random.default_rng(0)
+    P, n = 50, 3
+    X, V, pbest = rng.random((P,n)), rng.random((P,n)) - 0.5, rng.random((P,n))
+    social, r, vmax = rng.random((1,n)), rng.random((P,2)), np.full(n, 0.3)
+    moved = [a.copy() for a in (X, V)]
+    move_loops(moved[0], moved[1], pbest, social, r.copy(), 2.8, 2.05, 0.7, vmax, NO_BOUND, NO_BOUND, None)
+    move_numpy(X, V, pbest, social, r.copy(), 2.8, 2.05, 0.7, vmax, None, None, np.zeros((P,n)))
+    assert np.array_equal(moved[0], X) and np.array_equal(moved[1], V)
+
+    F, pbest_cost = rng.random(P), np.full(P, 0.5)
+    results = []
+    for select in (select_loops, select_numpy):
+        arrays = (np.zeros(P), pbest.copy(), pbest_cost.copy(), np.zeros(n))
+        gbest_cost, changed = select(X, F, 1.0, *arrays[:3], arrays[3], 0.2, np.zeros(P, dtype=bool))
+        results.append((gbest_cost, changed) + arrays)
+    for a, b in zip(*results):
+        assert np.array_equal(a, b)
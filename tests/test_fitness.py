@@ -0,0 +1,37 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from fitness import fitness_1, sphere
+
+#######################   TESTS   ##############################################
+
+def test_benchmark_one_dimensional_batch():
+    X = np.arange(5.0).reshape(5,1)
+    assert np.array_equal(sphere(X), X[:,0]**2)
+    assert sphere(np.array([3.0, 4.0])) == 25.0
+    optimizer = PSO(sphere, n=1, P=5, Tmax=10, vectorize=True, seed=0)
+    optimizer.initialize()
+    optimizer.move()
+    assert optimizer.gbest_fitness >= 0
+
+def test_example_function_forms():
+    X = np.array([[3.0, 2.0], [0.0, 0.0]])
+    F = fitness_1(X)
+    assert F.shape == (2,)
+    assert fitness_1(X[0].reshape(-1,1)) == F[0] == fitness_1(X[0]) == fitness_1(X[:1])[0]
@@ -0,0 +1,51 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+'''
+
+EVERY RUN OF A 'MultiPSO' HAS ITS OWN RANDOM STREAM, SO IT CAN BE REPRODUCED ON ITS OWN BY A PSO
+
+'''
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from multirun import MultiPSO
+from fitness import fitness_1
+
+#######################   TESTS   ##############################################
+
+def test_each_run_matches_a_pso():
+    w, update_c1 = [0.4, 0.6, 0.9], [False, True, False]
+    sweep = MultiPSO(fitness_1, R=3, Tmax=30, w=w, update_c1=update_c1, bound=[(-4,4),(-4,4)], seed=7)
+    sweep.initialize()
+    sweep.move()
+    for k, seed in enumerate(np.random.SeedSequence(7).spawn(3)):
+        optimizer = PSO(fitness_1, Tmax=30, w=w[k], update_c1=update_c1[k], bound=[(-4,4),(-4,4)], seed=seed,
+                        vectorize=True, batch=True)
+        optimizer.initialize()
+        optimizer.move()
+        assert np.array_equal(sweep.fitness_time[k], optimizer.fitness_time)
+        assert np.array_equal(sweep.gbest[k], optimizer.gbest.reshape(-1))
+
+def test_runs_do_not_depend_on_each_other():
+    sweep = MultiPSO(fitness_1, R=4, Tmax=20, w=[0.4, 0.6, 0.8, 0.9], seed=3)
+    sweep.initialize()
+    sweep.move()
+    other = MultiPSO(fitness_1, R=4, Tmax=20, w=[0.4, 0.6, 0.8, 0.5], seed=3)
+    other.initialize()
+    other.move()
+    assert np.array_equal(sweep.fitness_time[:3], other.fitness_time[:3])
@@ -0,0 +1,88 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from cooperative import CooperativePSO
+from fitness import fitness_1, sphere
+from recorder import Trajectory
+
+#######################   TESTS   ##############################################
+
+def test_ask_after_particle_initialize():
+    optimizer = PSO(fitness_1, seed=1)
+    optimizer.initialize()
+    with pytest.raises(RuntimeError, match='vectorize=True'):
+        optimizer.ask()
+    optimizer = PSO(fitness_1, seed=1, vectorize=True)
+    optimizer.initialize()
+    assert optimizer.ask().shape == (optimizer.P, 2)
+
+@pytest.mark.parametrize('option', [{'surrogate': True}, {'recorder': 'run'}, {'checkpoint': 'run'}])
+def test_cooperative_rejects_options(option):
+    with pytest.raises(ValueError, match='cooperative'):
+        CooperativePSO(sphere, n=20, groups=4, **option)
+
+def test_max_evaluations_covers_initialization():
+    with pytest.raises(ValueError, match='initialization'):
+        PSO(fitness_1, P=10, max_evaluations=5)
+    optimizer = PSO(fitness_1, P=10, max_evaluations=25, seed=1)
+    optimizer.initialize()
+    optimizer.move()
+    assert optimizer.evaluations <= 25 and optimizer.stop_reason == 'max_evaluations'
+
+def test_execute_inside_running_loop():
+    import asyncio
+
+    async def fitness(X):
+        return fitness_1(X)
+
+    async def main():
+        optimizer = PSO(fitness, Tmax=2, seed=1, vectorize=True)
+        with pytest.raises(RuntimeError, match='await optimizer.run'):
+            optimizer.execute()
+        assert optimizer.evaluations == 0
+        assert optimizer.gbest is None and optimizer.swarm is None and optimizer.t == 0
+        await optimizer.run()
+        return optimizer
+
+    optimizer = asyncio.run(main())
+    assert optimizer.gbest_fitness >= 0 and optimizer.evaluations == (optimizer.Tmax+2)*optimizer.P
+
+def test_run_closes_the_recorder(tmp_path):
+    import asyncio
+
+    async def fitness(X):
+        return fitness_1(X)
+
+    path = str(tmp_path / 'run')
+    optimizer = PSO(fitness, P=10, Tmax=20, seed=1, recorder=path)
+    asyncio.run(optimizer.run())
+    trajectory = Trajectory(path)
+    assert len(trajectory) == 21
+    assert np.array_equal(trajectory.X[-1], optimizer.swarm.X.astype(trajectory.X.dtype))
+
+def test_executor_needs_workers():
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValueError, match='workers'):
+            PSO(fitness_1, executor=executor)
+        optimizer = PSO(fitness_1, executor=executor, workers=2, Tmax=5, seed=1)
+        optimizer.initialize()
+        optimizer.move()
+    assert optimizer.evaluator.workers == 2
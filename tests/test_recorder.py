@@ -0,0 +1,79 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+import json
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from pso import PSO
+from recorder import Recorder, Trajectory
+from fitness import fitness_1
+
+#######################   TESTS   ##############################################
+
+class Preempted(Exception):
+    pass
+
+class Interrupted:
+
+    # 'fitness_1' WHICH RAISES 'Preempted' AT ITS 'calls'-TH CALL, STANDING IN FOR A KILLED PROCESS
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __call__(self, X):
+        self.calls -= 1
+        if self.calls < 0:
+            raise Preempted
+        return fitness_1(X)
+
+def test_buffer_is_sized_in_bytes(tmp_path):
+    recorder = Recorder(str(tmp_path / 'run'), buffer_mb=1)
+    recorder.open(P=5000, n=200)
+    assert recorder.frames == 1
+    assert sum(array.nbytes for array in recorder.buffer.values()) < 2**20 + 5000*200*4*2 + 5000*4
+    recorder.close()
+    recorder = Recorder(str(tmp_path / 'small'), chunk=16)
+    recorder.open(P=10, n=2)
+    assert recorder.frames == 16
+    recorder.close()
+
+@pytest.mark.parametrize('vectorize', [False, True])
+def test_append_after_checkpoint(tmp_path, vectorize):
+    options = dict(P=10, Tmax=40, seed=3, vectorize=vectorize, checkpoint_every=10)
+    reference = str(tmp_path / 'reference')
+    PSO(fitness_1, checkpoint=str(tmp_path / 'reference_checkpoint'), recorder=reference, **options).execute()
+
+    path, checkpoint = str(tmp_path / 'run'), str(tmp_path / 'checkpoint')
+    optimizer = PSO(Interrupted(255), checkpoint=checkpoint, recorder=Recorder(path, chunk=4), **options)
+    with pytest.raises(Preempted):
+        optimizer.execute()
+    assert len(Trajectory(path)) > 20 # FRAMES AFTER THE LAST CHECKPOINT (t=20) ARE ON DISK
+    with open(os.path.join(checkpoint, 'state.json')) as f:
+        assert json.load(f)['recorder'] == 20
+
+    # THE FRAME COUNT OF THE CHECKPOINT ALONE CUTS THE RECORDING BACK
+    recorder = Recorder(path, chunk=4, append=True)
+    recorder.limit = 20
+    recorder.open(P=10, n=2, t=1000)
+    assert recorder.count == 20
+    recorder.close()
+
+    PSO(fitness_1, checkpoint=checkpoint, recorder=Recorder(path, chunk=4, append=True), **options).resume()
+    expected, trajectory = Trajectory(reference), Trajectory(path)
+    assert np.array_equal(trajectory.t, np.arange(41))
+    for field in ('X', 'V', 'fitness'):
+        assert np.array_equal(getattr(trajectory, field), getattr(expected, field))
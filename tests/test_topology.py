@@ -0,0 +1,34 @@
+
+################################################################################
+#                                                                              #
+#	UJJWAL KHANDELWAL                                                          #
+#	PSO (PARTICLE SWARM OPTIMIZATION)                                          #
+#	PYTHON 3.7.10                                                              #
+#                                                                              #
+################################################################################
+
+#######################   IMPORT DEPENDENCIES   ################################
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pso'))
+
+from topology import Topology
+
+#######################   TESTS   ##############################################
+
+@pytest.mark.parametrize('P', [2, 3, 12, 13, 30, 31])
+def test_von_neumann_grid(P):
+    index = Topology('von_neumann', P).index
+    assert index.min() >= 0 and index.max() < P
+    adjacency = np.zeros((P,P), dtype=bool)
+    adjacency[np.arange(P)[:,None], index] = True
+    assert np.array_equal(adjacency, adjacency.T)
+
+def test_von_neumann_prime_is_not_a_ring():
+    index = Topology('von_neumann', 13).index
+    assert sorted(index[0].tolist()) == [0, 1, 3, 4, 12]